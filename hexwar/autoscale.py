@@ -4,13 +4,15 @@ Dynamic worker scaling for parallel game evaluation.
 Automatically probes throughput and scales workers until diminishing returns.
 """
 
+import json
+import math
 import os
+import platform
 import time
 import multiprocessing as mp
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from dataclasses import dataclass
 from typing import Optional, Callable
-import random
 
 
 @dataclass
@@ -23,50 +25,153 @@ class ScaleResult:
 
 # Global cache for optimal worker count
 _cached_optimal_workers: Optional[int] = None
+_cached_max_workers: Optional[int] = None  # Ceiling the cached count was probed under
 _cache_timestamp: float = 0
 _CACHE_TTL = 300  # 5 minutes
 
+# Disk cache so fresh processes (CLI runs, pipeline restarts) skip re-probing.
+# Keyed on a CPU signature; stale after a day or when the hardware changes.
+_DISK_CACHE_FILE = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'hexwar', 'autoscale.json',
+)
+_DISK_CACHE_TTL = 24 * 3600
+
+# Probe search: geometric scale-up probes before switching to golden section
+_SCALE_UP_PROBES = 3
+_INV_PHI = (math.sqrt(5) - 1) / 2
+
+# Probe tasks must outweigh pool dispatch (pickling, IPC) or small worker
+# counts look no faster than serial. Calibrated once per process.
+_PROBE_TASK_SECONDS = 0.05
+_work_units: Optional[int] = None
+
+_SQRT_SCALE = math.sqrt(0.001)
+
+
+def available_cpus() -> int:
+    """CPUs this process may actually run on.
+
+    Respects CPU affinity (taskset, Docker --cpuset-cpus, SLURM), where
+    cpu_count() would report every CPU on the host.
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS/Windows
+        return mp.cpu_count()
+
+
+def _default_max_workers() -> int:
+    """Probe ceiling: HEXWAR_MAX_WORKERS if set, else min(60, 4x available CPUs)."""
+    override = os.environ.get('HEXWAR_MAX_WORKERS')
+    if override:
+        try:
+            return max(1, int(override))
+        except ValueError:
+            print(f"Warning: ignoring HEXWAR_MAX_WORKERS={override!r} (not an integer)")
+    # Allow oversubscription up to 4x CPU count, capped at 60
+    return min(60, available_cpus() * 4)
+
 
 def _simple_cpu_work(iterations: int = 100000) -> float:
-    """Simple CPU-bound work to measure throughput."""
-    total = 0.0
-    for i in range(iterations):
-        total += (i * 0.001) ** 0.5
-    return total
+    """Simple CPU-bound work to measure throughput.
 
+    Sums sqrt(i * 0.001) with the loop running in C (map + sum) rather
+    than bytecode, so the probe is dominated by arithmetic, not the
+    interpreter, and allocates nothing per iteration.
+    """
+    return _SQRT_SCALE * sum(map(math.sqrt, range(iterations)))
+
+
+def _calibrated_work_units() -> int:
+    """Iterations of _simple_cpu_work taking at least _PROBE_TASK_SECONDS here."""
+    global _work_units
+    if _work_units is None:
+        work_units = 50000
+        for _ in range(10):
+            start = time.perf_counter()
+            _simple_cpu_work(work_units)
+            if time.perf_counter() - start >= _PROBE_TASK_SECONDS:
+                break
+            work_units *= 2
+        _work_units = work_units
+    return _work_units
 
-def _probe_worker(args: tuple) -> float:
-    """Worker function for throughput probing."""
-    work_units, seed = args
-    random.seed(seed)
-    start = time.perf_counter()
+
+def _probe_worker(work_units: int) -> None:
+    """Worker function for throughput probing.
+
+    Returns nothing: the parent times the whole batch, so per-task timing
+    would only add work and IPC payload.
+    """
     _simple_cpu_work(work_units)
-    return time.perf_counter() - start
+
+
+def _noop(_: int) -> None:
+    """Task used to force pool workers to start before timing."""
+    return None
+
+
+def _warm_pool(executor: ProcessPoolExecutor, n_workers: int) -> None:
+    """Start every worker in the pool so probes measure steady state."""
+    list(executor.map(_noop, range(n_workers)))
+
+
+def _run_bounded(executor: ProcessPoolExecutor, fn: Callable, tasks: list, max_in_flight: int) -> None:
+    """Run tasks on a shared pool with at most max_in_flight outstanding.
+
+    Lets one pool sized for the largest probe simulate any smaller worker count.
+    """
+    pending = set()
+    for task in tasks:
+        if len(pending) >= max_in_flight:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                future.result()
+        pending.add(executor.submit(fn, task))
+    for future in pending:
+        future.result()
 
 
 def probe_throughput(
     n_workers: int,
-    work_units: int = 50000,
+    work_units: Optional[int] = None,
     n_tasks: int = None,
+    executor: Optional[ProcessPoolExecutor] = None,
 ) -> float:
     """
     Probe throughput with a given number of workers.
 
+    Args:
+        n_workers: Concurrency to measure
+        work_units: Iterations of synthetic work per task (default:
+                    calibrated to ~50ms on this machine)
+        n_tasks: Tasks to run (default: enough to saturate workers)
+        executor: Optional warm pool with at least n_workers workers. When
+                  given, concurrency is capped at n_workers instead of
+                  spinning up a fresh pool for this probe.
+
     Returns: tasks per second
     """
+    if work_units is None:
+        work_units = _calibrated_work_units()
     if n_tasks is None:
         n_tasks = max(n_workers * 4, 16)  # Enough tasks to saturate workers
 
-    tasks = [(work_units, i) for i in range(n_tasks)]
+    tasks = [work_units] * n_tasks
 
     start = time.perf_counter()
 
     if n_workers == 1:
-        for task in tasks:
-            _probe_worker(task)
+        for _ in range(n_tasks):
+            _simple_cpu_work(work_units)
+    elif executor is not None:
+        _run_bounded(executor, _probe_worker, tasks, n_workers)
     else:
+        # Batch tasks per dispatch so pickling/IPC doesn't dominate short probes
+        chunksize = max(1, n_tasks // (n_workers * 4))
         with ProcessPoolExecutor(max_workers=n_workers) as executor:
-            list(executor.map(_probe_worker, tasks))
+            list(executor.map(_probe_worker, tasks, chunksize=chunksize))
 
     elapsed = time.perf_counter() - start
     return n_tasks / elapsed if elapsed > 0 else 0
@@ -82,14 +187,16 @@ def find_optimal_workers(
     Find optimal worker count by probing throughput.
 
     Algorithm:
-    1. Start at min_workers
-    2. Measure throughput
-    3. Try more workers (scale by 1.5x or +2, whichever is larger)
-    4. If improvement > threshold, continue
-    5. Stop when improvement drops below threshold or hit ceiling
+    1. Start at min_workers and measure throughput
+    2. Scale up (1.5x or +2, whichever is larger) for a few probes,
+       stopping early if improvement drops below threshold
+    3. If still improving, golden-section search up to the ceiling
+       (throughput vs workers is unimodal: rises, plateaus, falls)
+    4. Pick the fewest workers within threshold of the best throughput
 
     Args:
-        max_workers: Hard ceiling (default: min(60, CPU count * 4))
+        max_workers: Hard ceiling (default: HEXWAR_MAX_WORKERS, else
+                     min(60, available CPUs * 4))
         min_workers: Starting point
         improvement_threshold: Min improvement to keep scaling (0.10 = 10%)
         verbose: Print progress
@@ -98,63 +205,162 @@ def find_optimal_workers(
         ScaleResult with optimal worker count and history
     """
     if max_workers is None:
-        # Allow oversubscription up to 4x CPU count, capped at 60
-        max_workers = min(60, mp.cpu_count() * 4)
+        max_workers = _default_max_workers()
 
     # Clamp min_workers
     min_workers = max(1, min(min_workers, max_workers))
 
-    history = []
-    current_workers = min_workers
-    best_workers = min_workers
-    best_throughput = 0.0
+    # One pool for every probe: forking a fresh pool per probe dominated
+    # small probes and skewed throughput toward cold-start cost.
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        _warm_pool(executor, max_workers)
+        return _search_optimal_workers(
+            lambda n: probe_throughput(n, executor=executor),
+            max_workers, min_workers, improvement_threshold, verbose,
+        )
+
+
+def _search_optimal_workers(
+    probe: Callable[[int], float],
+    max_workers: int,
+    min_workers: int,
+    improvement_threshold: float,
+    verbose: bool,
+) -> ScaleResult:
+    """Find the worker count with the best throughput.
 
-    while current_workers <= max_workers:
-        # Probe throughput at current worker count
-        throughput = probe_throughput(current_workers)
-        history.append((current_workers, throughput))
+    Scales up geometrically for a few probes; if throughput is still
+    climbing, golden-section searches the rest of the range. Every probe
+    is memoized, so points the search revisits are free.
+    """
+    history = []
+    measured: dict[int, float] = {}
 
+    def measure(n_workers: int) -> float:
+        if n_workers not in measured:
+            throughput = probe(n_workers)
+            if verbose:
+                best = max(measured.values(), default=0.0)
+                improvement = ((throughput / best) - 1) * 100 if best > 0 else 0
+                print(f"  Workers={n_workers}: {throughput:.1f} tasks/sec "
+                      f"({improvement:+.1f}% vs best)")
+            measured[n_workers] = throughput
+            history.append((n_workers, throughput))
+        return measured[n_workers]
+
+    bracket = _scale_up_bracket(measure, min_workers, max_workers, improvement_threshold, verbose)
+    if bracket is not None:
         if verbose:
-            improvement = ((throughput / best_throughput) - 1) * 100 if best_throughput > 0 else 0
-            print(f"  Workers={current_workers}: {throughput:.1f} tasks/sec "
-                  f"({improvement:+.1f}% vs best)")
+            print(f"  Still scaling, searching {bracket[0]}-{bracket[1]} workers")
+        _golden_section_search(bracket[0], bracket[1], measure)
 
-        # Check if this is better
-        if throughput > best_throughput:
-            improvement_ratio = (throughput / best_throughput) - 1 if best_throughput > 0 else 1.0
+    best_workers = _pick_workers(measured, improvement_threshold)
+    return ScaleResult(
+        optimal_workers=best_workers,
+        throughput=measured[best_workers],
+        probe_history=history,
+    )
 
-            if improvement_ratio >= improvement_threshold or best_throughput == 0:
-                best_workers = current_workers
-                best_throughput = throughput
-            else:
-                # Improvement too small, stop scaling
-                if verbose:
-                    print(f"  Improvement ({improvement_ratio*100:.1f}%) below threshold "
-                          f"({improvement_threshold*100:.0f}%), stopping")
-                break
-        else:
-            # Throughput decreased, stop scaling
-            if verbose:
-                print(f"  Throughput decreased, stopping")
-            break
 
-        # Scale up for next iteration
-        next_workers = max(current_workers + 2, int(current_workers * 1.5))
-        if next_workers == current_workers:
-            next_workers = current_workers + 1
+def _scale_up_bracket(
+    measure: Callable[[int], float],
+    min_workers: int,
+    max_workers: int,
+    improvement_threshold: float,
+    verbose: bool,
+) -> Optional[tuple[int, int]]:
+    """Scale workers by 1.5x (or +2) for the first few probes.
+
+    Returns None if scaling stopped paying off (or hit the ceiling) within
+    those probes, else the (lo, hi) range still worth searching.
+    """
+    prev_workers = current_workers = min_workers
+    best_throughput = measure(current_workers)
 
+    for _ in range(_SCALE_UP_PROBES - 1):
+        next_workers = max(current_workers + 2, int(current_workers * 1.5))
         if next_workers > max_workers:
-            break
+            return None
 
-        current_workers = next_workers
+        throughput = measure(next_workers)
+        improvement_ratio = (throughput / best_throughput) - 1 if best_throughput > 0 else 1.0
+        if improvement_ratio < improvement_threshold:
+            if verbose:
+                print(f"  Improvement ({improvement_ratio*100:.1f}%) below threshold "
+                      f"({improvement_threshold*100:.0f}%), stopping")
+            return None
 
-    return ScaleResult(
-        optimal_workers=best_workers,
-        throughput=best_throughput,
-        probe_history=history,
+        prev_workers, current_workers = current_workers, next_workers
+        best_throughput = throughput
+
+    if current_workers >= max_workers:
+        return None
+    return prev_workers, max_workers
+
+
+def _golden_section_search(lo: int, hi: int, f: Callable[[int], float], tol: int = 1) -> int:
+    """Return the int in [lo, hi] maximizing a unimodal f.
+
+    Each step keeps one interior point from the previous step, so with a
+    memoized f only one new evaluation is needed per step.
+    """
+    left = hi - round((hi - lo) * _INV_PHI)
+    right = lo + round((hi - lo) * _INV_PHI)
+    while hi - lo > tol + 1:
+        if left >= right:
+            left, right = (lo + hi) // 2, (lo + hi) // 2 + 1
+        if f(left) >= f(right):
+            hi, right = right, left
+            left = hi - round((hi - lo) * _INV_PHI)
+        else:
+            lo, left = left, right
+            right = lo + round((hi - lo) * _INV_PHI)
+    return max(range(lo, hi + 1), key=f)
+
+
+def _pick_workers(measured: dict[int, float], improvement_threshold: float) -> int:
+    """Fewest workers whose throughput is within the threshold of the best."""
+    best_throughput = max(measured.values())
+    return min(
+        n for n, throughput in measured.items()
+        if throughput * (1 + improvement_threshold) >= best_throughput
     )
 
 
+def _cpu_signature() -> str:
+    """Identify the machine's CPU setup for disk cache invalidation."""
+    return f"{platform.machine()}|{platform.processor()}|{mp.cpu_count()}|{available_cpus()}"
+
+
+def _load_disk_cache(max_workers: int) -> Optional[tuple[int, float]]:
+    """Load (optimal_workers, timestamp) from disk if still valid for this machine."""
+    try:
+        with open(_DISK_CACHE_FILE) as f:
+            data = json.load(f)
+        if (data['cpu'] == _cpu_signature()
+                and data['max_workers'] == max_workers
+                and time.time() - data['timestamp'] < _DISK_CACHE_TTL):
+            return data['workers'], data['timestamp']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _save_disk_cache(workers: int, max_workers: int, timestamp: float) -> None:
+    """Persist the probed worker count; failures only cost a future re-probe."""
+    try:
+        os.makedirs(os.path.dirname(_DISK_CACHE_FILE), exist_ok=True)
+        with open(_DISK_CACHE_FILE, 'w') as f:
+            json.dump({
+                'cpu': _cpu_signature(),
+                'max_workers': max_workers,
+                'workers': workers,
+                'timestamp': timestamp,
+            }, f)
+    except OSError:
+        pass
+
+
 def get_optimal_workers(
     max_workers: int = None,
     force_reprobe: bool = False,
@@ -164,31 +370,50 @@ def get_optimal_workers(
     Get optimal worker count, using cached value if available.
 
     This is the main entry point - call this to get worker count.
+    Checks the in-process cache, then the on-disk cache shared across
+    invocations, and only probes if both are missing or stale.
 
     Args:
-        max_workers: Hard ceiling
+        max_workers: Hard ceiling (default: HEXWAR_MAX_WORKERS, else
+                     min(60, available CPUs * 4))
         force_reprobe: Ignore cache and re-probe
         verbose: Print probing progress
 
     Returns:
         Optimal number of workers
     """
-    global _cached_optimal_workers, _cache_timestamp
+    global _cached_optimal_workers, _cached_max_workers, _cache_timestamp
 
     now = time.time()
+    # Resolve the ceiling first so the disk cache is keyed on the value
+    # actually probed, not on None for every default caller.
+    if max_workers is None:
+        max_workers = _default_max_workers()
 
     # Use cache if valid
-    if not force_reprobe and _cached_optimal_workers is not None:
+    if (not force_reprobe and _cached_optimal_workers is not None
+            and _cached_max_workers == max_workers):
         if now - _cache_timestamp < _CACHE_TTL:
             return _cached_optimal_workers
 
+    if not force_reprobe:
+        disk_cached = _load_disk_cache(max_workers)
+        if disk_cached is not None:
+            _cached_optimal_workers, _cache_timestamp = disk_cached
+            _cached_max_workers = max_workers
+            if verbose:
+                print(f"Optimal workers: {_cached_optimal_workers} (cached in {_DISK_CACHE_FILE})")
+            return _cached_optimal_workers
+
     if verbose:
         print("Probing for optimal worker count...")
 
     result = find_optimal_workers(max_workers=max_workers, verbose=verbose)
 
     _cached_optimal_workers = result.optimal_workers
+    _cached_max_workers = max_workers
     _cache_timestamp = now
+    _save_disk_cache(result.optimal_workers, max_workers, now)
 
     if verbose:
         print(f"Optimal workers: {result.optimal_workers} "
@@ -234,14 +459,15 @@ def find_optimal_game_workers(
 
     Args:
         game_runner: Function(n_workers, n_games) -> runs games
-        max_workers: Hard ceiling (default: min(60, CPU count * 4))
+        max_workers: Hard ceiling (default: HEXWAR_MAX_WORKERS, else
+                     min(60, available CPUs * 4))
         min_workers: Starting point
         games_per_probe: Games to run per probe
         improvement_threshold: Min improvement to keep scaling
         verbose: Print progress
     """
     if max_workers is None:
-        max_workers = min(60, mp.cpu_count() * 4)
+        max_workers = _default_max_workers()
 
     min_workers = max(1, min(min_workers, max_workers))
 
@@ -303,7 +529,7 @@ def find_optimal_rust_workers(
         max_workers: Hard ceiling
         verbose: Print progress
     """
-    from hexwar.tournament import run_matchup, RUST_AVAILABLE
+    from hexwar.tournament import run_matchup, RUST_AVAILABLE, _worker_init
     from hexwar.ai import Heuristics
 
     if not RUST_AVAILABLE:
@@ -312,6 +538,8 @@ def find_optimal_rust_workers(
         return find_optimal_workers(max_workers=max_workers, verbose=verbose)
 
     h = Heuristics.create_default()
+    # Load worker-side modules here so forked probe workers inherit them
+    _worker_init()
 
     def game_runner(n_workers: int, n_games: int):
         run_matchup(depth, depth, n_games, h, n_workers=n_workers, use_rust=True)
@@ -328,7 +556,7 @@ def find_optimal_rust_workers(
 
 
 if __name__ == '__main__':
-    print(f"CPU count: {mp.cpu_count()}")
+    print(f"CPU count: {mp.cpu_count()} ({available_cpus()} available)")
     print()
 
     print("=== Synthetic Probe ===")
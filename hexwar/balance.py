@@ -11,11 +11,18 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
 import multiprocessing
 import os
+import sqlite3
 import time
+from collections import Counter
+from dataclasses import asdict
 from datetime import datetime
+from functools import lru_cache
+from io import StringIO
+from operator import itemgetter
 from pathlib import Path
 
 from hexwar.ai import Heuristics
@@ -28,8 +35,18 @@ from hexwar.evolution import (
     evaluate_ruleset_fitness,
     create_template_aware_heuristics,
     load_seed_rulesets,
+    ruleset_signature,
+    genome_to_ruleset,
+    board_set_to_ruleset,
 )
 from hexwar.pieces import PIECE_TYPES
+from hexwar.tournament import MatchupStats
+
+# orjson encodes large reports several times faster; stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # Direction names for human-readable output
@@ -53,8 +70,32 @@ TEMPLATE_DESCRIPTIONS = {
 }
 
 
+def write_atomic(path: Path, data: str | bytes) -> None:
+    """Replace path with data in one rename, never leaving a truncated file.
+
+    An interrupted run keeps the previous version of each report instead
+    of a half-written one.
+    """
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_bytes(data.encode() if isinstance(data, str) else data)
+    os.replace(tmp, path)
+
+
+def write_json(path: Path, obj) -> None:
+    """Write obj to path as 2-space indented JSON."""
+    if orjson is not None:
+        write_atomic(path, orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        write_atomic(path, json.dumps(obj, indent=2))
+
+
+@lru_cache(maxsize=None)
 def get_piece_description(piece_id: str) -> str:
-    """Get human-readable description of a piece's movement."""
+    """Get human-readable description of a piece's movement.
+
+    Cached: PIECE_TYPES and the name tables are fixed, and reports are
+    rebuilt every generation with the same handful of pieces.
+    """
     pt = PIECE_TYPES.get(piece_id)
     if pt is None:
         return f"Unknown piece: {piece_id}"
@@ -92,6 +133,15 @@ def get_piece_description(piece_id: str) -> str:
     return f"{pt.name} ({piece_id}){king_note}: {move_desc} in directions: {dir_str}{special_desc}"
 
 
+def _report_timestamp() -> str:
+    """Local wall-clock time for report headers.
+
+    time.strftime formats the struct_time directly, skipping the datetime
+    object that datetime.now().strftime() builds on every report.
+    """
+    return time.strftime('%Y-%m-%d %H:%M:%S')
+
+
 def generate_human_readable_report(
     ruleset: RuleSet,
     heuristics: Heuristics,
@@ -100,169 +150,172 @@ def generate_human_readable_report(
     timings: dict,
 ) -> str:
     """Generate a human-readable report for the balanced game."""
-    lines = []
-    lines.append("=" * 70)
-    lines.append("HEXWAR BALANCED GAME CONFIGURATION")
-    lines.append("=" * 70)
-    lines.append("")
-    lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append("")
+    buf = StringIO()
+
+    def w(line: str = '') -> None:
+        print(line, file=buf)
+
+    w("=" * 70)
+    w("HEXWAR BALANCED GAME CONFIGURATION")
+    w("=" * 70)
+    w()
+    w(f"Generated: {_report_timestamp()}")
+    w()
 
     # Configuration used
-    lines.append("-" * 70)
-    lines.append("EVOLUTION PARAMETERS")
-    lines.append("-" * 70)
-    lines.append(f"Search Depth: {config.get('depth', 2)} (AI looks ahead this many turns)")
-    lines.append("Heuristics: Template-aware (computed per-ruleset)")
-    lines.append(f"Ruleset Generations: {config.get('ruleset_generations', '?')}")
-    lines.append(f"Ruleset Population: {config.get('ruleset_population', '?')}")
-    lines.append(f"Games per Evaluation: {config.get('games_per_eval', '?')}")
-    lines.append(f"Total Evolution Time: {format_duration(timings.get('total', 0))}")
-    lines.append("")
+    w("-" * 70)
+    w("EVOLUTION PARAMETERS")
+    w("-" * 70)
+    w(f"Search Depth: {config.get('depth', 2)} (AI looks ahead this many turns)")
+    w("Heuristics: Template-aware (computed per-ruleset)")
+    w(f"Ruleset Generations: {config.get('ruleset_generations', '?')}")
+    w(f"Ruleset Population: {config.get('ruleset_population', '?')}")
+    w(f"Games per Evaluation: {config.get('games_per_eval', '?')}")
+    w(f"Total Evolution Time: {format_duration(timings.get('total', 0))}")
+    w()
 
     # Balance stats
-    lines.append("-" * 70)
-    lines.append("BALANCE STATISTICS")
-    lines.append("-" * 70)
-    lines.append(f"Evaluation Games: {eval_result['total_games']}")
-    lines.append(f"White Wins: {eval_result['white_wins']} ({eval_result['white_wins']/eval_result['total_games']*100:.1f}%)")
-    lines.append(f"Black Wins: {eval_result['black_wins']} ({eval_result['black_wins']/eval_result['total_games']*100:.1f}%)")
-    lines.append(f"Draws: {eval_result['draws']} ({eval_result['draws']/eval_result['total_games']*100:.1f}%)")
-    lines.append(f"Average Game Length: {eval_result['avg_rounds']:.1f} rounds")
-    lines.append(f"Color Fairness Score: {eval_result['color_fairness']:.3f} (1.0 = perfect 50/50)")
-    lines.append(f"Overall Fitness: {eval_result['fitness']:.3f}")
-    lines.append("")
+    w("-" * 70)
+    w("BALANCE STATISTICS")
+    w("-" * 70)
+    w(f"Evaluation Games: {eval_result['total_games']}")
+    w(f"White Wins: {eval_result['white_wins']} ({eval_result['white_wins']/eval_result['total_games']*100:.1f}%)")
+    w(f"Black Wins: {eval_result['black_wins']} ({eval_result['black_wins']/eval_result['total_games']*100:.1f}%)")
+    w(f"Draws: {eval_result['draws']} ({eval_result['draws']/eval_result['total_games']*100:.1f}%)")
+    w(f"Average Game Length: {eval_result['avg_rounds']:.1f} rounds")
+    w(f"Color Fairness Score: {eval_result['color_fairness']:.3f} (1.0 = perfect 50/50)")
+    w(f"Overall Fitness: {eval_result['fitness']:.3f}")
+    w()
 
     # Templates explanation
-    lines.append("-" * 70)
-    lines.append("ACTION TEMPLATES")
-    lines.append("-" * 70)
-    lines.append("Each turn, a player performs actions according to their template:")
-    lines.append("")
+    w("-" * 70)
+    w("ACTION TEMPLATES")
+    w("-" * 70)
+    w("Each turn, a player performs actions according to their template:")
+    w()
+    markers = {ruleset.white_template: " <- WHITE"}
+    markers[ruleset.black_template] = markers.get(ruleset.black_template, "") + " <- BLACK"
     for t, desc in TEMPLATE_DESCRIPTIONS.items():
-        marker = ""
-        if t == ruleset.white_template:
-            marker += " <- WHITE"
-        if t == ruleset.black_template:
-            marker += " <- BLACK"
-        lines.append(f"  Template {t}: {desc}{marker}")
-    lines.append("")
+        w(f"  Template {t}: {desc}{markers.get(t, '')}")
+    w()
 
     # White Army
-    lines.append("-" * 70)
-    lines.append(f"WHITE ARMY (Template {ruleset.white_template}: {TEMPLATE_DESCRIPTIONS[ruleset.white_template]})")
-    lines.append("-" * 70)
-    lines.append("")
-    lines.append("KING:")
-    lines.append(f"  {get_piece_description(ruleset.white_king)}")
-    lines.append("")
-    lines.append("PIECES:")
+    w("-" * 70)
+    w(f"WHITE ARMY (Template {ruleset.white_template}: {TEMPLATE_DESCRIPTIONS[ruleset.white_template]})")
+    w("-" * 70)
+    w()
+    w("KING:")
+    w(f"  {get_piece_description(ruleset.white_king)}")
+    w()
+    w("PIECES:")
 
     # Count and describe white pieces
-    white_counts = {}
-    for p in ruleset.white_pieces:
-        white_counts[p] = white_counts.get(p, 0) + 1
+    white_counts = Counter(ruleset.white_pieces)
 
     for piece_id in sorted(white_counts.keys()):
         count = white_counts[piece_id]
         desc = get_piece_description(piece_id)
-        lines.append(f"  {count}x {desc}")
-    lines.append(f"\n  TOTAL: 1 King + {len(ruleset.white_pieces)} pieces = {len(ruleset.white_pieces) + 1} units")
+        w(f"  {count}x {desc}")
+    w(f"\n  TOTAL: 1 King + {len(ruleset.white_pieces)} pieces = {len(ruleset.white_pieces) + 1} units")
 
     # Show fixed positions if available
     if ruleset.white_positions:
-        lines.append("")
-        lines.append("STARTING POSITIONS (q, r hex coordinates):")
-        lines.append(f"  King: {ruleset.white_positions[0]}")
+        w()
+        w("STARTING POSITIONS (q, r hex coordinates):")
+        w(f"  King: {ruleset.white_positions[0]}")
         for i, pos in enumerate(ruleset.white_positions[1:]):
             if i < len(ruleset.white_pieces):
                 piece_name = PIECE_TYPES[ruleset.white_pieces[i]].name
-                lines.append(f"  {piece_name}: {pos}")
-    lines.append("")
+                w(f"  {piece_name}: {pos}")
+    w()
 
     # Black Army
-    lines.append("-" * 70)
-    lines.append(f"BLACK ARMY (Template {ruleset.black_template}: {TEMPLATE_DESCRIPTIONS[ruleset.black_template]})")
-    lines.append("-" * 70)
-    lines.append("")
-    lines.append("KING:")
-    lines.append(f"  {get_piece_description(ruleset.black_king)}")
-    lines.append("")
-    lines.append("PIECES:")
+    w("-" * 70)
+    w(f"BLACK ARMY (Template {ruleset.black_template}: {TEMPLATE_DESCRIPTIONS[ruleset.black_template]})")
+    w("-" * 70)
+    w()
+    w("KING:")
+    w(f"  {get_piece_description(ruleset.black_king)}")
+    w()
+    w("PIECES:")
 
     # Count and describe black pieces
-    black_counts = {}
-    for p in ruleset.black_pieces:
-        black_counts[p] = black_counts.get(p, 0) + 1
+    black_counts = Counter(ruleset.black_pieces)
 
     for piece_id in sorted(black_counts.keys()):
         count = black_counts[piece_id]
         desc = get_piece_description(piece_id)
-        lines.append(f"  {count}x {desc}")
-    lines.append(f"\n  TOTAL: 1 King + {len(ruleset.black_pieces)} pieces = {len(ruleset.black_pieces) + 1} units")
+        w(f"  {count}x {desc}")
+    w(f"\n  TOTAL: 1 King + {len(ruleset.black_pieces)} pieces = {len(ruleset.black_pieces) + 1} units")
 
     # Show fixed positions if available
     if ruleset.black_positions:
-        lines.append("")
-        lines.append("STARTING POSITIONS (q, r hex coordinates):")
-        lines.append(f"  King: {ruleset.black_positions[0]}")
+        w()
+        w("STARTING POSITIONS (q, r hex coordinates):")
+        w(f"  King: {ruleset.black_positions[0]}")
         for i, pos in enumerate(ruleset.black_positions[1:]):
             if i < len(ruleset.black_pieces):
                 piece_name = PIECE_TYPES[ruleset.black_pieces[i]].name
-                lines.append(f"  {piece_name}: {pos}")
-    lines.append("")
+                w(f"  {piece_name}: {pos}")
+    w()
 
     # Heuristics summary
-    lines.append("-" * 70)
-    lines.append("AI HEURISTICS (Piece Values)")
-    lines.append("-" * 70)
-    lines.append("These values represent how the AI evaluates each piece type.")
-    lines.append("Higher = more valuable. Used for balancing, not gameplay rules.")
-    lines.append("")
-    lines.append(f"White center weight: {heuristics.white_center_weight:.3f}")
-    lines.append(f"Black center weight: {heuristics.black_center_weight:.3f}")
-    lines.append("")
-    lines.append("Piece values (sorted by value):")
-    lines.append("")
-    white_sorted = sorted(heuristics.white_piece_values.items(), key=lambda x: -x[1])
-    black_sorted = sorted(heuristics.black_piece_values.items(), key=lambda x: -x[1])
-
-    lines.append("  WHITE:")
+    w("-" * 70)
+    w("AI HEURISTICS (Piece Values)")
+    w("-" * 70)
+    w("These values represent how the AI evaluates each piece type.")
+    w("Higher = more valuable. Used for balancing, not gameplay rules.")
+    w()
+    w(f"White center weight: {heuristics.white_center_weight:.3f}")
+    w(f"Black center weight: {heuristics.black_center_weight:.3f}")
+    w()
+    w("Piece values (sorted by value):")
+    w()
+    white_sorted = sorted(heuristics.white_piece_values.items(), key=itemgetter(1), reverse=True)
+    black_sorted = sorted(heuristics.black_piece_values.items(), key=itemgetter(1), reverse=True)
+
+    w("  WHITE:")
     for pid, val in white_sorted:
-        lines.append(f"    {pid} ({PIECE_TYPES[pid].name}): {val:.2f}")
-    lines.append("")
-    lines.append("  BLACK:")
+        w(f"    {pid} ({PIECE_TYPES[pid].name}): {val:.2f}")
+    w()
+    w("  BLACK:")
     for pid, val in black_sorted:
-        lines.append(f"    {pid} ({PIECE_TYPES[pid].name}): {val:.2f}")
-    lines.append("")
+        w(f"    {pid} ({PIECE_TYPES[pid].name}): {val:.2f}")
+    w()
 
     # Setup instructions
-    lines.append("-" * 70)
-    lines.append("GAME SETUP")
-    lines.append("-" * 70)
-    lines.append("1. Use a hexagonal board with 61 hexes (radius 4 from center)")
-    lines.append("2. White sets up in the 3 rows closest to their edge (south)")
-    lines.append("3. Black sets up in the 3 rows closest to their edge (north)")
+    w("-" * 70)
+    w("GAME SETUP")
+    w("-" * 70)
+    w("1. Use a hexagonal board with 61 hexes (radius 4 from center)")
+    w("2. White sets up in the 3 rows closest to their edge (south)")
+    w("3. Black sets up in the 3 rows closest to their edge (north)")
     if ruleset.white_positions or ruleset.black_positions:
-        lines.append("4. Place pieces at the fixed (q, r) coordinates listed above")
-        lines.append("5. All pieces start facing toward the center")
+        w("4. Place pieces at the fixed (q, r) coordinates listed above")
+        w("5. All pieces start facing toward the center")
     else:
-        lines.append("4. Kings go in the back row, center position")
-        lines.append("5. Other pieces fill remaining home zone hexes")
-        lines.append("6. All pieces start facing toward the center")
-    lines.append("")
-    lines.append("VICTORY CONDITIONS:")
-    lines.append("- Capture the enemy King to win immediately")
-    lines.append("- After 50 rounds: King closest to center wins")
-    lines.append("- Tiebreaker: Player with more pieces wins")
-    lines.append("- Final tiebreaker: White wins")
-    lines.append("")
+        w("4. Kings go in the back row, center position")
+        w("5. Other pieces fill remaining home zone hexes")
+        w("6. All pieces start facing toward the center")
+    w()
+    w("VICTORY CONDITIONS:")
+    w("- Capture the enemy King to win immediately")
+    w("- After 50 rounds: King closest to center wins")
+    w("- Tiebreaker: Player with more pieces wins")
+    w("- Final tiebreaker: White wins")
+    w()
+
+    w("=" * 70)
+    w("END OF CONFIGURATION")
+    w("=" * 70)
+
+    return buf.getvalue()
 
-    lines.append("=" * 70)
-    lines.append("END OF CONFIGURATION")
-    lines.append("=" * 70)
 
-    return '\n'.join(lines)
+def format_piece_counts(pieces) -> str:
+    """Piece counts as a dict literal in id order, e.g. "{'A1': 2, 'B1': 1}"."""
+    counts = sorted(Counter(pieces).items(), key=itemgetter(0))
+    return '{' + ', '.join(f"{pid!r}: {n}" for pid, n in counts) + '}'
 
 
 def format_duration(seconds: float) -> str:
@@ -275,6 +328,51 @@ def format_duration(seconds: float) -> str:
         return f"{seconds/3600:.1f}h"
 
 
+def cached_final_evaluation(
+    cache_path: Path,
+    ruleset: RuleSet,
+    n_games: int,
+    depth: int,
+    max_moves_per_action: int,
+    seed: int,
+) -> dict:
+    """Template-aware evaluate_ruleset_fitness, memoized in a sqlite file.
+
+    Seeded evaluations are deterministic, so an identical champion (same
+    genome, game count, depth, move limit and seed) found by an earlier
+    run is read back instead of re-simulated.
+    """
+    key_src = json.dumps(
+        [ruleset_to_genome(ruleset), n_games, depth, max_moves_per_action, seed],
+        sort_keys=True,
+    )
+    key = hashlib.blake2b(key_src.encode(), digest_size=8).hexdigest()
+
+    with sqlite3.connect(cache_path) as db:
+        db.execute('CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, result TEXT)')
+        row = db.execute('SELECT result FROM cache WHERE key = ?', (key,)).fetchone()
+        if row is not None:
+            result = json.loads(row[0])
+            result['matchups'] = {
+                (m['deeper_depth'], m['shallower_depth']): MatchupStats(**m)
+                for m in result['matchups']
+            }
+            return result
+
+        result = evaluate_ruleset_fitness(
+            ruleset,
+            Heuristics.create_default(),  # Replaced by template-aware heuristics
+            n_games=n_games,
+            depth=depth,
+            max_moves_per_action=max_moves_per_action,
+            seed=seed,
+            use_template_aware=True,
+        )
+        stored = {**result, 'matchups': [asdict(m) for m in result['matchups'].values()]}
+        db.execute('INSERT OR REPLACE INTO cache VALUES (?, ?)', (key, json.dumps(stored)))
+    return result
+
+
 def write_generation_report(
     output_dir: Path,
     gen: int,
@@ -283,49 +381,148 @@ def write_generation_report(
     heuristics: 'Heuristics',
 ):
     """Write a partial report for a single generation."""
-    from hexwar.evolution import RuleSet
-
     report_path = output_dir / f'gen_{gen:03d}_report.txt'
 
-    lines = []
-    lines.append(f"HEXWAR Generation {gen} Report")
-    lines.append("=" * 50)
-    lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append("")
-
-    lines.append(f"Fitness: {result['fitness']:.3f}")
-    lines.append(f"Skill Gradient: {result.get('skill_gradient', 0.0):.3f}")
-    lines.append(f"Color Fairness: {result['color_fairness']:.3f}")
-    lines.append(f"Games: W:{result['white_wins']} B:{result['black_wins']} D:{result['draws']}")
-    lines.append("")
-
-    lines.append("WHITE ARMY:")
-    lines.append(f"  Template: {ruleset.white_template}")
-    lines.append(f"  King: {ruleset.white_king}")
-    piece_counts = {}
-    for p in ruleset.white_pieces:
-        piece_counts[p] = piece_counts.get(p, 0) + 1
-    lines.append(f"  Pieces: {dict(sorted(piece_counts.items()))}")
-    lines.append("")
-
-    lines.append("BLACK ARMY:")
-    lines.append(f"  Template: {ruleset.black_template}")
-    lines.append(f"  King: {ruleset.black_king}")
-    piece_counts = {}
-    for p in ruleset.black_pieces:
-        piece_counts[p] = piece_counts.get(p, 0) + 1
-    lines.append(f"  Pieces: {dict(sorted(piece_counts.items()))}")
-    lines.append("")
+    header = (
+        f"HEXWAR Generation {gen} Report\n"
+        + "=" * 50 + "\n"
+        + f"Generated: {_report_timestamp()}\n\n"
+    )
+    write_atomic(report_path, header + _generation_report_body(ruleset, result))
+
+
+# A surviving elite keeps its cached evaluation result from one generation
+# to the next, so its report body only needs rendering once. Only the
+# previous generation's (key, body) is kept.
+_last_generation_report: tuple[tuple, str] | None = None
+
+
+def _generation_report_body(ruleset: 'RuleSet', result: dict) -> str:
+    """Everything in a generation report below the header."""
+    global _last_generation_report
+
+    key = (
+        ruleset_signature(ruleset), ruleset.white_template, ruleset.black_template,
+        result['fitness'], result.get('skill_gradient', 0.0), result['color_fairness'],
+        result['white_wins'], result['black_wins'], result['draws'],
+        tuple(sorted(
+            (k, s.deeper_wins, s.games_played) for k, s in result['matchups'].items()
+        )) if 'matchups' in result else None,
+    )
+    if _last_generation_report is not None and _last_generation_report[0] == key:
+        return _last_generation_report[1]
+
+    buf = StringIO()
+
+    def w(line: str = '') -> None:
+        print(line, file=buf)
+
+    w(f"Fitness: {result['fitness']:.3f}")
+    w(f"Skill Gradient: {result.get('skill_gradient', 0.0):.3f}")
+    w(f"Color Fairness: {result['color_fairness']:.3f}")
+    w(f"Games: W:{result['white_wins']} B:{result['black_wins']} D:{result['draws']}")
+    w()
+
+    w("WHITE ARMY:")
+    w(f"  Template: {ruleset.white_template}")
+    w(f"  King: {ruleset.white_king}")
+    w(f"  Pieces: {format_piece_counts(ruleset.white_pieces)}")
+    w()
+
+    w("BLACK ARMY:")
+    w(f"  Template: {ruleset.black_template}")
+    w(f"  King: {ruleset.black_king}")
+    w(f"  Pieces: {format_piece_counts(ruleset.black_pieces)}")
+    w()
 
     # Matchup breakdown if available
     if 'matchups' in result:
-        lines.append("MATCHUP BREAKDOWN:")
+        w("MATCHUP BREAKDOWN:")
         for (d1, d2), stats in sorted(result['matchups'].items()):
-            lines.append(f"  d{d1} vs d{d2}: deeper wins {stats.deeper_wins}/{stats.games_played}")
-        lines.append("")
+            w(f"  d{d1} vs d{d2}: deeper wins {stats.deeper_wins}/{stats.games_played}")
+        w()
+
+    body = buf.getvalue()
+    _last_generation_report = (key, body)
+    return body
+
+
+# End-of-run console summary; filled in once by format_console_summary
+_SUMMARY_TEMPLATE = """
+{rule}
+BALANCE REPORT
+{rule}
+
+--- TIMINGS ---
+Ruleset Evolution:   {phase2_time}
+Final Evaluation:    {phase3_time}
+TOTAL:               {total_time}
+
+--- BEST RULESET ---
+White Army ({rs.white_template}):
+  King: {rs.white_king}
+  Pieces: {white_counts}
+  Total: {white_total} pieces
+
+Black Army ({rs.black_template}):
+  King: {rs.black_king}
+  Pieces: {black_counts}
+  Total: {black_total} pieces
 
-    with open(report_path, 'w') as f:
-        f.write('\n'.join(lines))
+--- BALANCE STATS ---
+Games Played: {ev[total_games]}
+White Wins:   {ev[white_wins]} ({white_pct:.1f}%)
+Black Wins:   {ev[black_wins]} ({black_pct:.1f}%)
+Draws:        {ev[draws]} ({draw_pct:.1f}%)
+Avg Rounds:   {ev[avg_rounds]:.1f}
+
+Color Fairness:  {ev[color_fairness]:.3f} (1.0 = perfect)
+Game Length:     {ev[game_length_score]:.3f}
+Decisiveness:    {ev[decisiveness]:.3f}
+Overall Fitness: {ev[fitness]:.3f}
+
+--- HEURISTIC SUMMARY ---
+White center weight: {h.white_center_weight:.3f}
+Black center weight: {h.black_center_weight:.3f}
+
+White piece values:
+{white_values}
+Black piece values:
+{black_values}"""
+
+
+def _format_piece_values(values: dict) -> str:
+    """One '  id: value' line per piece, highest value first."""
+    ranked = sorted(values.items(), key=itemgetter(1), reverse=True)
+    return ''.join(f"  {pid}: {val:.2f}\n" for pid, val in ranked)
+
+
+def format_console_summary(
+    ruleset: RuleSet,
+    heuristics: Heuristics,
+    final_eval: dict,
+    timings: dict,
+) -> str:
+    """Render the end-of-run summary printed by run_balance_pipeline."""
+    total_games = final_eval['total_games']
+    return _SUMMARY_TEMPLATE.format(
+        rule="=" * 60,
+        phase2_time=format_duration(timings['ruleset_evolution']),
+        phase3_time=format_duration(timings['final_evaluation']),
+        total_time=format_duration(timings['total']),
+        rs=ruleset,
+        white_counts=format_piece_counts(ruleset.white_pieces),
+        white_total=len(ruleset.white_pieces) + 1,
+        black_counts=format_piece_counts(ruleset.black_pieces),
+        black_total=len(ruleset.black_pieces) + 1,
+        ev=final_eval,
+        white_pct=final_eval['white_wins'] / total_games * 100,
+        black_pct=final_eval['black_wins'] / total_games * 100,
+        draw_pct=final_eval['draws'] / total_games * 100,
+        h=heuristics,
+        white_values=_format_piece_values(heuristics.white_piece_values),
+        black_values=_format_piece_values(heuristics.black_piece_values),
+    )
 
 
 def run_balance_pipeline(
@@ -349,6 +546,7 @@ def run_balance_pipeline(
     fixed_white_file: str = None,
     fixed_black_file: str = None,
     no_cache: bool = False,
+    report_every: int = 1,
 ) -> dict:
     """Run the balancing pipeline (ruleset evolution only).
 
@@ -374,16 +572,24 @@ def run_balance_pipeline(
                          When provided, only Black's army will be evolved.
         fixed_black_file: Path to a JSON file containing the fixed Black army.
                          When provided, only White's army will be evolved.
+        report_every: Write gen_NNN_report.txt every N generations. Reports
+                      for new best fitness and the final generation are
+                      always written.
 
     Returns:
         Report dictionary with all results
     """
+    if report_every < 1:
+        raise ValueError(f"report_every must be at least 1, got {report_every}")
+
     if n_workers is None:
         # Auto-scale workers based on throughput probing
-        from hexwar.autoscale import get_optimal_workers
+        from hexwar.autoscale import available_cpus, get_optimal_workers
         if verbose:
             print("Auto-detecting optimal worker count...")
-        n_workers = get_optimal_workers(verbose=verbose)
+        # Games are CPU-bound, so probe no further than the CPUs this
+        # process is allowed on (cgroup cpuset, SLURM).
+        n_workers = get_optimal_workers(max_workers=available_cpus(), verbose=verbose)
         if verbose:
             print(f"Using {n_workers} workers (auto-detected)")
             print()
@@ -411,6 +617,7 @@ def run_balance_pipeline(
             'smart_mutate': smart_mutate,
             'fixed_white_file': fixed_white_file,
             'fixed_black_file': fixed_black_file,
+            'report_every': report_every,
         },
         'timings': {},
         'results': {},
@@ -426,7 +633,6 @@ def run_balance_pipeline(
     # Load fixed white army if provided
     fixed_white = None
     if fixed_white_file:
-        from hexwar.evolution import genome_to_ruleset
         with open(fixed_white_file, 'r') as f:
             fixed_white_data = json.load(f)
         # Handle both champion format (with 'ruleset' key) and direct format
@@ -441,7 +647,6 @@ def run_balance_pipeline(
     # Load fixed black army if provided
     fixed_black = None
     if fixed_black_file:
-        from hexwar.evolution import genome_to_ruleset, board_set_to_ruleset
         with open(fixed_black_file, 'r') as f:
             fixed_black_data = json.load(f)
         # Handle board set format (has 'pieces' array)
@@ -487,7 +692,14 @@ def run_balance_pipeline(
     phase2_start = time.time()
 
     # Create per-generation report callback
+    best_reported = float('-inf')
+
     def on_generation(gen, best_rs, best_result, heuristics):
+        nonlocal best_reported
+        improved = best_result['fitness'] > best_reported
+        if gen % report_every and not improved and gen != ruleset_generations:
+            return
+        best_reported = max(best_reported, best_result['fitness'])
         write_generation_report(output_path, gen, best_rs, best_result, heuristics)
         if verbose:
             print(f"    Wrote gen_{gen:03d}_report.txt")
@@ -523,8 +735,7 @@ def run_balance_pipeline(
 
     # Save ruleset
     ruleset_genome = ruleset_to_genome(best_ruleset)
-    with open(output_path / 'ruleset.json', 'w') as f:
-        json.dump(ruleset_genome, f, indent=2)
+    write_json(output_path / 'ruleset.json', ruleset_genome)
 
     report['results']['ruleset'] = ruleset_genome
     report['results']['ruleset_evolution_stats'] = ruleset_stats
@@ -544,15 +755,26 @@ def run_balance_pipeline(
     phase3_start = time.time()
 
     # Run more games for final stats
-    final_eval = evaluate_ruleset_fitness(
-        best_ruleset,
-        best_heuristics,
-        n_games=games_per_eval * 3,  # More games for better stats
-        depth=depth,
-        max_moves_per_action=max_moves_per_action,
-        seed=seed,
-        use_template_aware=True,  # Always use template-aware heuristics
-    )
+    if seed is not None and not no_cache:
+        # Seeded runs are reproducible; reuse a prior identical evaluation
+        final_eval = cached_final_evaluation(
+            output_path / 'fitness_cache.sqlite',
+            best_ruleset,
+            n_games=games_per_eval * 3,
+            depth=depth,
+            max_moves_per_action=max_moves_per_action,
+            seed=seed,
+        )
+    else:
+        final_eval = evaluate_ruleset_fitness(
+            best_ruleset,
+            best_heuristics,
+            n_games=games_per_eval * 3,  # More games for better stats
+            depth=depth,
+            max_moves_per_action=max_moves_per_action,
+            seed=seed,
+            use_template_aware=True,  # Always use template-aware heuristics
+        )
 
     # Get the actual template-aware heuristics for reporting
     best_heuristics = create_template_aware_heuristics(
@@ -560,13 +782,12 @@ def run_balance_pipeline(
     )
     # Save these for the report
     heuristics_genome = heuristics_to_genome(best_heuristics)
-    with open(output_path / 'heuristics.json', 'w') as f:
-        json.dump({
-            'mode': 'template_aware',
-            'white_template': best_ruleset.white_template,
-            'black_template': best_ruleset.black_template,
-            **heuristics_genome
-        }, f, indent=2)
+    write_json(output_path / 'heuristics.json', {
+        'mode': 'template_aware',
+        'white_template': best_ruleset.white_template,
+        'black_template': best_ruleset.black_template,
+        **heuristics_genome
+    })
     report['results']['heuristics'] = {
         'mode': 'template_aware',
         'white_template': best_ruleset.white_template,
@@ -582,7 +803,6 @@ def run_balance_pipeline(
     # Convert matchup tuple keys to strings and MatchupStats to dicts for JSON serialization
     final_eval_json = dict(final_eval)
     if 'matchups' in final_eval_json:
-        from dataclasses import asdict
         final_eval_json['matchups'] = {
             f"{k[0]}v{k[1]}": asdict(v) if hasattr(v, '__dataclass_fields__') else v
             for k, v in final_eval_json['matchups'].items()
@@ -596,60 +816,11 @@ def run_balance_pipeline(
     # Generate Report
     # =========================================================================
     if verbose:
-        print("\n" + "=" * 60)
-        print("BALANCE REPORT")
-        print("=" * 60)
-
-        print(f"\n--- TIMINGS ---")
-        print(f"Ruleset Evolution:   {format_duration(phase2_time)}")
-        print(f"Final Evaluation:    {format_duration(phase3_time)}")
-        print(f"TOTAL:               {format_duration(total_time)}")
-
-        print(f"\n--- BEST RULESET ---")
-        print(f"White Army ({best_ruleset.white_template}):")
-        print(f"  King: {best_ruleset.white_king}")
-        piece_counts = {}
-        for p in best_ruleset.white_pieces:
-            piece_counts[p] = piece_counts.get(p, 0) + 1
-        print(f"  Pieces: {dict(sorted(piece_counts.items()))}")
-        print(f"  Total: {len(best_ruleset.white_pieces) + 1} pieces")
-
-        print(f"\nBlack Army ({best_ruleset.black_template}):")
-        print(f"  King: {best_ruleset.black_king}")
-        piece_counts = {}
-        for p in best_ruleset.black_pieces:
-            piece_counts[p] = piece_counts.get(p, 0) + 1
-        print(f"  Pieces: {dict(sorted(piece_counts.items()))}")
-        print(f"  Total: {len(best_ruleset.black_pieces) + 1} pieces")
-
-        print(f"\n--- BALANCE STATS ---")
-        print(f"Games Played: {final_eval['total_games']}")
-        print(f"White Wins:   {final_eval['white_wins']} ({final_eval['white_wins']/final_eval['total_games']*100:.1f}%)")
-        print(f"Black Wins:   {final_eval['black_wins']} ({final_eval['black_wins']/final_eval['total_games']*100:.1f}%)")
-        print(f"Draws:        {final_eval['draws']} ({final_eval['draws']/final_eval['total_games']*100:.1f}%)")
-        print(f"Avg Rounds:   {final_eval['avg_rounds']:.1f}")
-        print(f"\nColor Fairness:  {final_eval['color_fairness']:.3f} (1.0 = perfect)")
-        print(f"Game Length:     {final_eval['game_length_score']:.3f}")
-        print(f"Decisiveness:    {final_eval['decisiveness']:.3f}")
-        print(f"Overall Fitness: {final_eval['fitness']:.3f}")
-
-        print(f"\n--- HEURISTIC SUMMARY ---")
-        print(f"White center weight: {best_heuristics.white_center_weight:.3f}")
-        print(f"Black center weight: {best_heuristics.black_center_weight:.3f}")
-
-        # Full piece values
-        white_sorted = sorted(best_heuristics.white_piece_values.items(), key=lambda x: -x[1])
-        black_sorted = sorted(best_heuristics.black_piece_values.items(), key=lambda x: -x[1])
-        print(f"\nWhite piece values:")
-        for pid, val in white_sorted:
-            print(f"  {pid}: {val:.2f}")
-        print(f"\nBlack piece values:")
-        for pid, val in black_sorted:
-            print(f"  {pid}: {val:.2f}")
+        # One write for the whole summary rather than one per line
+        print(format_console_summary(best_ruleset, best_heuristics, final_eval, report['timings']), end='')
 
     # Save full report (JSON)
-    with open(output_path / 'report.json', 'w') as f:
-        json.dump(report, f, indent=2)
+    write_json(output_path / 'report.json', report)
 
     # Generate and save human-readable report
     human_report = generate_human_readable_report(
@@ -659,8 +830,7 @@ def run_balance_pipeline(
         config=report['config'],
         timings=report['timings'],
     )
-    with open(output_path / 'GAME_CONFIG.txt', 'w') as f:
-        f.write(human_report)
+    write_atomic(output_path / 'GAME_CONFIG.txt', human_report)
 
     if verbose:
         print(f"\n--- OUTPUT FILES ---")
@@ -716,6 +886,8 @@ def main():
                         help='Path to JSON file with fixed White army. Only Black will evolve.')
     parser.add_argument('--fixed-black', type=str, default=None,
                         help='Path to JSON file with fixed Black army. Only White will evolve.')
+    parser.add_argument('--report-every', type=int, default=1,
+                        help='Write per-generation reports every N generations, plus on improvement (default: 1)')
     parser.add_argument('--no-cache', action='store_true',
                         help='Disable caching - force re-evaluation of all rulesets every generation')
     parser.add_argument('--evaluate-only', type=str, default=None,
@@ -724,6 +896,8 @@ def main():
                         help='Number of evaluations for --evaluate-only mode (default: 14)')
 
     args = parser.parse_args()
+    if args.report_every < 1:
+        parser.error('--report-every must be at least 1')
 
     # Quick mode for testing
     if args.quick:
@@ -753,6 +927,7 @@ def main():
         fixed_white_file=args.fixed_white,
         fixed_black_file=args.fixed_black,
         no_cache=args.no_cache,
+        report_every=args.report_every,
     )
 
 
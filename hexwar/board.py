@@ -7,7 +7,7 @@ Axial coordinate system (q, r) with center at (0, 0).
 Valid coordinates satisfy: |q| <= 7, |r| <= 7, |q + r| <= 7
 """
 
-from typing import Iterator
+from typing import Iterable, Iterator
 
 # Board configuration
 # Spec says 61 hexes total - that requires radius 4
@@ -53,18 +53,24 @@ def distance_to_center(q: int, r: int) -> int:
     return (abs(q) + abs(r) + abs(q + r)) // 2
 
 
+# (dq, dr) for every (facing, relative direction) pair
+_REL_DIR_TABLE: tuple[tuple[tuple[int, int], ...], ...] = tuple(
+    tuple(DIRECTIONS[(facing + relative) % 6] for relative in range(6))
+    for facing in range(6)
+)
+
+
 def get_direction_vector(facing: int, relative: int) -> tuple[int, int]:
     """Get the (dq, dr) vector for a relative direction from a facing.
 
     Args:
         facing: Absolute facing (0-5)
-        relative: Relative direction (FORWARD, FORWARD_RIGHT, etc.)
+        relative: Relative direction (FORWARD, FORWARD_RIGHT, etc.; 0-5)
 
     Returns:
         (delta_q, delta_r) tuple
     """
-    absolute_dir = (facing + relative) % 6
-    return DIRECTIONS[absolute_dir]
+    return _REL_DIR_TABLE[facing][relative]
 
 
 def get_neighbor(q: int, r: int, direction: int) -> tuple[int, int]:
@@ -84,6 +90,9 @@ def iter_all_hexes() -> Iterator[tuple[int, int]]:
 # Precompute all valid hexes
 ALL_HEXES = tuple(iter_all_hexes())
 NUM_HEXES = len(ALL_HEXES)  # Should be 61
+# For hot loops that already hold a (q, r) tuple: `hex in VALID_HEXES` is
+# one hash probe, cheaper than unpacking into is_valid_hex(*hex)
+VALID_HEXES = frozenset(ALL_HEXES)
 
 # Precompute home zones (3 rows from each edge)
 # For radius 4: White south edge (r >= 2), Black north edge (r <= -2)
@@ -104,6 +113,34 @@ WHITE_PIECE_ZONE = WHITE_HOME_ZONE - WHITE_EXCLUDED_WINGS - {WHITE_KING_POS}
 BLACK_PIECE_ZONE = BLACK_HOME_ZONE - BLACK_EXCLUDED_WINGS - {BLACK_KING_POS}
 
 
+# Bitboards: the 61 hexes fit in one int, bit i standing for ALL_HEXES[i].
+# Zone membership, unions and intersections become single int operations.
+HEX_INDEX: dict[tuple[int, int], int] = {h: i for i, h in enumerate(ALL_HEXES)}
+
+
+def mask_from_coords(hexes: Iterable[tuple[int, int]]) -> int:
+    """Bitboard with the bit set for each (q, r) in hexes."""
+    mask = 0
+    for h in hexes:
+        mask |= 1 << HEX_INDEX[h]
+    return mask
+
+
+def iter_mask(mask: int) -> Iterator[tuple[int, int]]:
+    """Iterate over the hexes set in a bitboard, in ALL_HEXES order."""
+    while mask:
+        low = mask & -mask
+        yield ALL_HEXES[low.bit_length() - 1]
+        mask ^= low
+
+
+ALL_HEXES_MASK = (1 << NUM_HEXES) - 1
+WHITE_HOME_MASK = mask_from_coords(WHITE_HOME_ZONE)
+BLACK_HOME_MASK = mask_from_coords(BLACK_HOME_ZONE)
+WHITE_PIECE_MASK = mask_from_coords(WHITE_PIECE_ZONE)
+BLACK_PIECE_MASK = mask_from_coords(BLACK_PIECE_ZONE)
+
+
 def get_home_zone(owner: int) -> frozenset[tuple[int, int]]:
     """Get the home zone for a player (0=White, 1=Black)."""
     return WHITE_HOME_ZONE if owner == 0 else BLACK_HOME_ZONE
@@ -136,6 +173,18 @@ def _build_neighbor_cache() -> None:
 
 _build_neighbor_cache()
 
+# Neighbor bitboards, indexed by HEX_INDEX: e.g. occupied neighbors of
+# hex i are NEIGHBOR_MASK[i] & occupied_mask
+NEIGHBOR_MASK: tuple[int, ...] = tuple(
+    mask_from_coords(n for n in _NEIGHBOR_CACHE[h] if n is not None) for h in ALL_HEXES
+)
+
+# Flat neighbor index table: entry i * 6 + d is the HEX_INDEX of the hex in
+# direction d from hex i, or -1 off the board
+NEIGHBOR_INDEX: tuple[int, ...] = tuple(
+    -1 if n is None else HEX_INDEX[n] for h in ALL_HEXES for n in _NEIGHBOR_CACHE[h]
+)
+
 
 def get_neighbors(q: int, r: int) -> tuple[tuple[int, int] | None, ...]:
     """Get all neighbors of a hex. None for invalid neighbors (edge of board).
@@ -150,62 +199,98 @@ def get_valid_neighbors(q: int, r: int) -> list[tuple[int, int]]:
     return [n for n in _NEIGHBOR_CACHE[(q, r)] if n is not None]
 
 
+def get_neighbor_mask(q: int, r: int) -> int:
+    """Get the valid neighbors of a hex as a bitboard."""
+    return NEIGHBOR_MASK[HEX_INDEX[(q, r)]]
+
+
+def get_neighbor_idx(index: int, direction: int) -> int:
+    """Get the HEX_INDEX of a neighbor by hex index, or -1 off the board."""
+    return NEIGHBOR_INDEX[index * 6 + direction]
+
+
 def opposite_direction(direction: int) -> int:
     """Get the opposite direction (180 degrees)."""
     return (direction + 3) % 6
 
 
+def _sector_of(dq: int, dr: int) -> int:
+    """Compute the direction sector of (dq, dr); see hex_to_sector.
+
+    Sectors are 60° wedges centered on each direction: N=270°, NE=330°,
+    SE=30°, S=90°, SW=150°, NW=210° (pointy-top pixel angles). The wedge
+    edges at 0°/180°, 60°/240° and 120°/300° are the axial lines
+    q + 2r = 0, r = q and r = -2q, so the sector follows from the signs
+    of three integer expressions with no trigonometry. Hexes exactly on
+    an edge go to the sector below it in angle (e.g. 60° -> SE).
+    """
+    if dq == 0 and dr == 0:
+        return 0  # At origin, arbitrary
+
+    edge_0 = dq + 2 * dr     # > 0 for angles in (0°, 180°)
+    edge_60 = dr - dq        # > 0 for angles in (60°, 240°)
+    edge_120 = dr + 2 * dq   # > 0 for angles in (300°, 120°)
+
+    if edge_0 >= 0 and edge_60 <= 0:
+        return 2  # SE: 0° to 60°
+    if edge_60 > 0 and edge_120 > 0:
+        return 3  # S: 60° to 120°
+    if edge_120 <= 0 and edge_0 > 0:
+        return 4  # SW: 120° to 180°
+    if edge_0 <= 0 and edge_60 >= 0:
+        return 5  # NW: 180° to 240°
+    if edge_60 < 0 and edge_120 < 0:
+        return 0  # N: 240° to 300°
+    return 1  # NE: 300° to 360°
+
+
+# Precompute sectors for every offset between two on-board hexes
+_SECTOR_CACHE: dict[tuple[int, int], int] = {}
+
+def _build_sector_cache() -> None:
+    """Build the sector lookup cache."""
+    span = range(-2 * BOARD_RADIUS, 2 * BOARD_RADIUS + 1)
+    for dq in span:
+        for dr in span:
+            _SECTOR_CACHE[(dq, dr)] = _sector_of(dq, dr)
+
+_build_sector_cache()
+
+
 def hex_to_sector(dq: int, dr: int) -> int:
     """Determine which of the 6 direction sectors a relative hex position is in.
 
     For a hex at (dq, dr) relative to origin, returns the direction (0-5)
-    that best describes which sector it's in.
-
-    Uses angle-based calculation for accuracy. Sectors are 60° wedges centered
-    on each direction: N=270°, NE=330°, SE=30°, S=90°, SW=150°, NW=210°.
+    that best describes which sector it's in. Offsets between on-board
+    hexes are a table lookup; larger ones are computed.
     """
-    import math
+    sector = _SECTOR_CACHE.get((dq, dr))
+    if sector is None:
+        return _sector_of(dq, dr)
+    return sector
 
-    if dq == 0 and dr == 0:
-        return 0  # At origin, arbitrary
 
-    # Convert axial to pixel coordinates (pointy-top orientation)
-    # x = 3/2 * q, y = sqrt(3)/2 * q + sqrt(3) * r
-    x = 1.5 * dq
-    y = 0.8660254 * dq + 1.7320508 * dr  # sqrt(3)/2, sqrt(3)
-
-    # Calculate angle in degrees (0-360)
-    angle = math.degrees(math.atan2(y, x))
-    if angle < 0:
-        angle += 360
-
-    # Sector boundaries at 0°, 60°, 120°, 180°, 240°, 300°
-    # Sector 2 (SE): 0° to 60°
-    # Sector 3 (S): 60° to 120°
-    # Sector 4 (SW): 120° to 180°
-    # Sector 5 (NW): 180° to 240°
-    # Sector 0 (N): 240° to 300°
-    # Sector 1 (NE): 300° to 360°
-    if angle < 60:
-        return 2  # SE
-    elif angle < 120:
-        return 3  # S
-    elif angle < 180:
-        return 4  # SW
-    elif angle < 240:
-        return 5  # NW
-    elif angle < 300:
-        return 0  # N
-    else:
-        return 1  # NE
+# Materialized rings around on-board centers, filled on first use
+_RING_CACHE: dict[tuple[int, int, int], tuple[tuple[int, int], ...]] = {}
 
 
 def iter_hex_ring(center_q: int, center_r: int, radius: int) -> Iterator[tuple[int, int]]:
     """Iterate over all hexes at exactly `radius` distance from center.
 
     Yields hexes in order around the ring, starting from the "south" corner
-    and going counter-clockwise.
+    and going counter-clockwise. Ring hexes may lie off the board.
     """
+    key = (center_q, center_r, radius)
+    ring = _RING_CACHE.get(key)
+    if ring is None:
+        ring = tuple(_walk_hex_ring(center_q, center_r, radius))
+        if (center_q, center_r) in VALID_HEXES:
+            _RING_CACHE[key] = ring
+    return iter(ring)
+
+
+def _walk_hex_ring(center_q: int, center_r: int, radius: int) -> Iterator[tuple[int, int]]:
+    """Generate the hexes of iter_hex_ring by walking the six edges."""
     if radius == 0:
         yield (center_q, center_r)
         return
@@ -6,16 +6,30 @@ Phase 5: Rule set evolution (army compositions)
 """
 
 from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
 from typing import Optional
 import random
 import json
 import hashlib
+import sys
 from pathlib import Path
 
 from hexwar.ai import Heuristics
-from hexwar.pieces import REGULAR_PIECE_IDS, PIECE_TYPES
-from hexwar.tournament import run_matchup, MatchupStats
+from hexwar.board import WHITE_PIECE_ZONE, BLACK_PIECE_ZONE, WHITE_KING_POS, BLACK_KING_POS
+from hexwar.pieces import REGULAR_PIECE_IDS, KING_IDS, PIECE_TYPES
+from hexwar.tournament import (
+    run_matchup, MatchupStats, _worker_init, tournament_matchup_spec, score_tournament,
+)
+
+# orjson parses seed files several times faster; stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # ============================================================================
@@ -52,9 +66,18 @@ def ruleset_signature(rs: 'RuleSet') -> str:
     Two rulesets with identical pieces (regardless of positions) get the same signature.
     Used for tracking fitness history across generations.
     """
+    return _army_signature(
+        rs.white_king, tuple(rs.white_pieces), rs.black_king, tuple(rs.black_pieces),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _army_signature(white_king: str, white_pieces: tuple, black_king: str, black_pieces: tuple) -> str:
+    """ruleset_signature body, memoized: FitnessTracker asks for the same
+    handful of population signatures many times per generation."""
     return (
-        rs.white_king + ":" + ",".join(sorted(rs.white_pieces)) + "|" +
-        rs.black_king + ":" + ",".join(sorted(rs.black_pieces))
+        white_king + ":" + ",".join(sorted(white_pieces)) + "|" +
+        black_king + ":" + ",".join(sorted(black_pieces))
     )
 
 
@@ -69,13 +92,16 @@ def ruleset_name(rs: 'RuleSet') -> str:
     return signature_to_name(sig)
 
 
+@lru_cache(maxsize=4096)
 def signature_to_name(sig: str) -> str:
     """Convert a ruleset signature to a deterministic two-word name.
 
     Uses MD5 hash for consistency across Python runs (Python's hash() is randomized).
+    Names appear in logs and champion files, so the hash must not change;
+    repeat lookups are served from the cache instead.
     """
-    # MD5 gives deterministic hash across runs
-    h = int(hashlib.md5(sig.encode()).hexdigest()[:8], 16)
+    # MD5 gives deterministic hash across runs; first 32 bits, big-endian
+    h = int.from_bytes(hashlib.md5(sig.encode()).digest()[:4], 'big')
 
     adj_idx = (h >> 6) & 0x3F  # bits 6-11 -> adjective (0-63)
     noun_idx = h & 0x3F        # bits 0-5 -> noun (0-63)
@@ -110,6 +136,7 @@ class FitnessTracker:
         self.c = c
         self.min_evals_for_confidence = min_evals_for_confidence
         self.history: dict[str, list[float]] = {}  # sig -> list of fitness scores
+        self._running: dict[str, list[float]] = {}  # sig -> [sum, min, max] of history
         self.rulesets: dict[str, 'RuleSet'] = {}  # sig -> RuleSet object (for recovery)
         self.last_results: dict[str, dict] = {}  # sig -> last full result dict
 
@@ -122,10 +149,18 @@ class FitnessTracker:
             result: Optional full result dict (matchups, stats, etc.) to cache
         """
         sig = ruleset_signature(rs)
-        if sig not in self.history:
-            self.history[sig] = []
+        running = self._running.get(sig)
+        if running is None:
+            self.history[sig] = [fitness]
             self.rulesets[sig] = rs  # Store the RuleSet for later recovery
-        self.history[sig].append(fitness)
+            self._running[sig] = [fitness, fitness, fitness]
+        else:
+            self.history[sig].append(fitness)
+            running[0] += fitness
+            if fitness < running[1]:
+                running[1] = fitness
+            elif fitness > running[2]:
+                running[2] = fitness
         if result is not None:
             self.last_results[sig] = result
 
@@ -148,9 +183,8 @@ class FitnessTracker:
                 return current_fitness - self.c
             return 0.0  # No data at all
 
-        scores = self.history[sig]
-        n = len(scores)
-        mean = sum(scores) / n
+        n = len(self.history[sig])
+        mean = self._running[sig][0] / n
 
         # UCB penalty decreases as sqrt(1/n)
         uncertainty_penalty = self.c * (1.0 / n) ** 0.5
@@ -163,12 +197,13 @@ class FitnessTracker:
         if sig not in self.history:
             return {'n_evals': 0, 'mean': None, 'min': None, 'max': None}
 
-        scores = self.history[sig]
+        n = len(self.history[sig])
+        total, lo, hi = self._running[sig]
         return {
-            'n_evals': len(scores),
-            'mean': sum(scores) / len(scores),
-            'min': min(scores),
-            'max': max(scores),
+            'n_evals': n,
+            'mean': total / n,
+            'min': lo,
+            'max': hi,
         }
 
     def has_enough_evals(self, rs: 'RuleSet') -> bool:
@@ -185,9 +220,9 @@ class FitnessTracker:
         best_score = float('-inf')
 
         for sig, scores in self.history.items():
-            if len(scores) >= self.min_evals_for_confidence:
-                n = len(scores)
-                mean = sum(scores) / n
+            n = len(scores)
+            if n >= self.min_evals_for_confidence:
+                mean = self._running[sig][0] / n
                 ucb = mean - self.c * (1.0 / n) ** 0.5
                 if ucb > best_score:
                     best_score = ucb
@@ -281,6 +316,40 @@ def _template_direction_multiplier(template: str, n_directions: int) -> float:
     return 1.0
 
 
+def _template_free_base_value(pt) -> float:
+    """Piece value before template adjustment: reach plus special bonus, /6."""
+    # Base value from reachable squares
+    base_value = _calculate_reachable_squares(pt)
+
+    # Add bonus for special abilities
+    if pt.special == 'SWAP_MOVE':
+        base_value += 4  # Warper teleport
+    elif pt.special == 'SWAP_ROTATE':
+        base_value += 3  # Shifter swap
+    elif pt.special == 'RESURRECT':
+        base_value += 5  # Phoenix resurrect is very powerful
+    elif pt.special == 'PHASED':
+        base_value += 3  # Ghost can't be captured
+
+    # Normalize base to reasonable range
+    return base_value / 6.0
+
+
+# (piece id, template-free base value, direction count) per regular piece.
+# Only the template multiplier differs between template pairs.
+_PIECE_BASES: tuple[tuple[str, float, int], ...] = tuple(
+    (
+        pid,
+        _template_free_base_value(PIECE_TYPES[pid]),
+        len(PIECE_TYPES[pid].directions) if PIECE_TYPES[pid].directions else 6,  # Warper has no dirs
+    )
+    for pid in REGULAR_PIECE_IDS
+)
+
+# Template-aware heuristics per (white_template, black_template); at most 36 pairs
+_TEMPLATE_HEURISTICS_CACHE: dict[tuple[str, str], Heuristics] = {}
+
+
 def create_template_aware_heuristics(white_template: str, black_template: str) -> Heuristics:
     """Create heuristics that account for how templates affect piece values.
 
@@ -295,40 +364,27 @@ def create_template_aware_heuristics(white_template: str, black_template: str) -
         black_template: Template letter for Black ('A', 'B', 'C', or 'D')
 
     Returns:
-        Heuristics with per-color piece values adjusted for templates
+        Heuristics with per-color piece values adjusted for templates.
+        Cached per template pair and shared between callers: treat as read-only.
     """
+    key = (white_template, black_template)
+    # Only template letters are cached; other values fall through uncached
+    cacheable = isinstance(white_template, str) and isinstance(black_template, str)
+    if cacheable and key in _TEMPLATE_HEURISTICS_CACHE:
+        return _TEMPLATE_HEURISTICS_CACHE[key]
+
     white_values = {}
     black_values = {}
 
-    for pid in REGULAR_PIECE_IDS:
-        pt = PIECE_TYPES[pid]
-
-        # Base value from reachable squares
-        base_value = _calculate_reachable_squares(pt)
-
-        # Add bonus for special abilities
-        if pt.special == 'SWAP_MOVE':
-            base_value += 4  # Warper teleport
-        elif pt.special == 'SWAP_ROTATE':
-            base_value += 3  # Shifter swap
-        elif pt.special == 'RESURRECT':
-            base_value += 5  # Phoenix resurrect is very powerful
-        elif pt.special == 'PHASED':
-            base_value += 3  # Ghost can't be captured
-
-        # Normalize base to reasonable range
-        base_value = base_value / 6.0
-
+    for pid, base_value, n_dirs in _PIECE_BASES:
         # Apply template-specific multipliers
-        n_dirs = len(pt.directions) if pt.directions else 6  # Warper has no dirs
-
         white_mult = _template_direction_multiplier(white_template, n_dirs)
         black_mult = _template_direction_multiplier(black_template, n_dirs)
 
         white_values[pid] = max(0.5, min(6.0, base_value * white_mult))
         black_values[pid] = max(0.5, min(6.0, base_value * black_mult))
 
-    return Heuristics(
+    heuristics = Heuristics(
         white_piece_values=white_values,
         black_piece_values=black_values,
         white_center_weight=0.5,
@@ -336,6 +392,9 @@ def create_template_aware_heuristics(white_template: str, black_template: str) -
         white_king_center_weight=1.0,
         black_king_center_weight=1.0,
     )
+    if cacheable:
+        _TEMPLATE_HEURISTICS_CACHE[key] = heuristics
+    return heuristics
 
 
 # NOTE: Heuristic evolution code was removed (Jan 2026).
@@ -372,9 +431,13 @@ def genome_to_heuristics(genome: dict) -> Heuristics:
 # RULE SET EVOLUTION (Phase 5)
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class RuleSet:
-    """A rule set defining army composition and placement."""
+    """A rule set defining army composition and placement.
+
+    Slotted: populations of these are created and pickled to workers
+    every generation. Not frozen, since mutation edits them in place.
+    """
     white_pieces: list[str]  # List of piece type IDs (not including king)
     black_pieces: list[str]
     white_template: str
@@ -412,16 +475,18 @@ def ruleset_to_genome(rs: RuleSet) -> dict:
     return genome
 
 
-def _normalize_position(p) -> tuple[int, int]:
-    """Convert a position to (q, r) tuple.
+def _normalize_positions(seq) -> list[tuple[int, int]]:
+    """Convert a list of positions to (q, r) tuples.
 
     Handles both:
     - Dict format: {'q': 0, 'r': 3}
     - Tuple/list format: [0, 3] or (0, 3)
+
+    A list uses one format throughout, so it is detected from the first entry.
     """
-    if isinstance(p, dict):
-        return (p['q'], p['r'])
-    return tuple(p)
+    if seq and isinstance(seq[0], dict):
+        return [(p['q'], p['r']) for p in seq]
+    return list(map(tuple, seq))
 
 
 def genome_to_ruleset(genome: dict) -> RuleSet:
@@ -431,17 +496,18 @@ def genome_to_ruleset(genome: dict) -> RuleSet:
     white_facings = None
     black_facings = None
     if 'white_positions' in genome:
-        white_pos = [_normalize_position(p) for p in genome['white_positions']]
+        white_pos = _normalize_positions(genome['white_positions'])
     if 'black_positions' in genome:
-        black_pos = [_normalize_position(p) for p in genome['black_positions']]
+        black_pos = _normalize_positions(genome['black_positions'])
     if 'white_facings' in genome:
         white_facings = list(genome['white_facings'])
     if 'black_facings' in genome:
         black_facings = list(genome['black_facings'])
 
+    # Interned ids loaded from JSON share one string object per piece type
     return RuleSet(
-        white_pieces=list(genome['white_pieces']),
-        black_pieces=list(genome['black_pieces']),
+        white_pieces=list(map(sys.intern, genome['white_pieces'])),
+        black_pieces=list(map(sys.intern, genome['black_pieces'])),
         white_template=genome['white_template'],
         black_template=genome['black_template'],
         white_king=genome['white_king'],
@@ -453,6 +519,22 @@ def genome_to_ruleset(genome: dict) -> RuleSet:
     )
 
 
+def _free_cells(zone: frozenset, positions: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Cells of zone not already in positions, in the zone's iteration order."""
+    occupied = set(positions)
+    return [p for p in zone if p not in occupied]
+
+
+def _drop_shifter_with_warper(pieces: list[str], positions: Optional[list[tuple[int, int]]]) -> None:
+    """Enforce the Warper (W1) / Shifter (W2) constraint in place.
+
+    Removes the first W2 from an army that also has a W1, along with its
+    position (index + 1, after the king) so the two lists stay aligned.
+    """
+    if 'W2' in pieces and 'W1' in pieces:
+        _remove_piece(pieces, positions, pieces.index('W2'))
+
+
 def _generate_positions(piece_count: int, piece_zone: frozenset, king_pos: tuple[int, int], rng: random.Random) -> list[tuple[int, int]]:
     """Generate random positions for king + pieces.
 
@@ -468,11 +550,14 @@ def _generate_positions(piece_count: int, piece_zone: frozenset, king_pos: tuple
     return [king_pos] + piece_positions
 
 
+# Kings other than each king, for picking an asymmetric opponent
+_OTHER_KINGS: dict[str, tuple[str, ...]] = {
+    king: tuple(k for k in KING_IDS if k != king) for king in KING_IDS
+}
+
+
 def create_random_ruleset(rng: random.Random, forced_template: str = None) -> RuleSet:
     """Create a random rule set with asymmetric armies and fixed positions."""
-    from hexwar.pieces import REGULAR_PIECE_IDS, KING_IDS
-    from hexwar.board import WHITE_PIECE_ZONE, BLACK_PIECE_ZONE, WHITE_KING_POS, BLACK_KING_POS
-
     # Random piece counts (8-12 regular pieces per side for richer games)
     white_count = rng.randint(8, 12)
     black_count = rng.randint(8, 12)
@@ -481,10 +566,8 @@ def create_random_ruleset(rng: random.Random, forced_template: str = None) -> Ru
     black_pieces = [rng.choice(REGULAR_PIECE_IDS) for _ in range(black_count)]
 
     # Constraint: Warper (W1) and Shifter (W2) not on same team
-    if 'W1' in white_pieces and 'W2' in white_pieces:
-        white_pieces.remove('W2')
-    if 'W1' in black_pieces and 'W2' in black_pieces:
-        black_pieces.remove('W2')
+    _drop_shifter_with_warper(white_pieces, None)
+    _drop_shifter_with_warper(black_pieces, None)
 
     # Handle forced template or random selection
     if forced_template:
@@ -499,14 +582,12 @@ def create_random_ruleset(rng: random.Random, forced_template: str = None) -> Ru
         black_template = 'E'
 
     # Prefer different kings for asymmetry
-    king_list = list(KING_IDS)
-    white_king = rng.choice(king_list)
+    white_king = rng.choice(KING_IDS)
     # 80% chance of different king for Black
     if rng.random() < 0.8:
-        other_kings = [k for k in king_list if k != white_king]
-        black_king = rng.choice(other_kings)
+        black_king = rng.choice(_OTHER_KINGS[white_king])
     else:
-        black_king = rng.choice(king_list)
+        black_king = rng.choice(KING_IDS)
 
     # Generate fixed positions (king at fixed pos, pieces in piece zone)
     white_positions = _generate_positions(len(white_pieces), WHITE_PIECE_ZONE, WHITE_KING_POS, rng)
@@ -524,22 +605,35 @@ def create_random_ruleset(rng: random.Random, forced_template: str = None) -> Ru
     )
 
 
-def create_bootstrap_ruleset(rng: random.Random = None) -> RuleSet:
-    """Create the bootstrap rule set from the spec with fixed positions."""
-    from hexwar.board import WHITE_PIECE_ZONE, BLACK_PIECE_ZONE, WHITE_KING_POS, BLACK_KING_POS
+_BOOTSTRAP_WHITE_PIECES = ('A1', 'A1', 'A1', 'A1', 'A3', 'A3', 'B1', 'B1', 'C1', 'D2', 'E1')
+_BOOTSTRAP_BLACK_PIECES = ('A2', 'A2', 'A2', 'G1', 'W2', 'P1', 'D3', 'D3', 'D4', 'E2')
 
-    if rng is None:
-        rng = random.Random(42)  # Deterministic default
 
-    white_pieces = ['A1', 'A1', 'A1', 'A1', 'A3', 'A3', 'B1', 'B1', 'C1', 'D2', 'E1']
-    black_pieces = ['A2', 'A2', 'A2', 'G1', 'W2', 'P1', 'D3', 'D3', 'D4', 'E2']
+def _bootstrap_positions(rng: random.Random) -> tuple[list, list]:
+    """White and black bootstrap positions drawn from rng."""
+    white_positions = _generate_positions(len(_BOOTSTRAP_WHITE_PIECES), WHITE_PIECE_ZONE, WHITE_KING_POS, rng)
+    black_positions = _generate_positions(len(_BOOTSTRAP_BLACK_PIECES), BLACK_PIECE_ZONE, BLACK_KING_POS, rng)
+    return white_positions, black_positions
+
+
+@lru_cache(maxsize=1)
+def _default_bootstrap_positions() -> tuple[tuple, tuple]:
+    """Bootstrap positions for the deterministic default seed, computed once."""
+    white_positions, black_positions = _bootstrap_positions(random.Random(42))
+    return tuple(white_positions), tuple(black_positions)
 
-    white_positions = _generate_positions(len(white_pieces), WHITE_PIECE_ZONE, WHITE_KING_POS, rng)
-    black_positions = _generate_positions(len(black_pieces), BLACK_PIECE_ZONE, BLACK_KING_POS, rng)
+
+def create_bootstrap_ruleset(rng: random.Random = None) -> RuleSet:
+    """Create the bootstrap rule set from the spec with fixed positions."""
+    if rng is None:
+        # Deterministic default; fresh lists so callers can mutate the result
+        white_positions, black_positions = map(list, _default_bootstrap_positions())
+    else:
+        white_positions, black_positions = _bootstrap_positions(rng)
 
     return RuleSet(
-        white_pieces=white_pieces,
-        black_pieces=black_pieces,
+        white_pieces=list(_BOOTSTRAP_WHITE_PIECES),
+        black_pieces=list(_BOOTSTRAP_BLACK_PIECES),
         white_template='E',  # Only E is viable for D5+ (multi-action templates cause exponential slowdown)
         black_template='E',
         white_king='K1',
@@ -549,6 +643,68 @@ def create_bootstrap_ruleset(rng: random.Random = None) -> RuleSet:
     )
 
 
+# Mutation weights per mode: (mutated side, template mutations allowed).
+# Bias toward MORE pieces (add is 3x more likely than remove)
+# Bias toward duplicating existing pieces (for player learnability)
+_MUTATION_WEIGHTS = {
+    # Only black mutations when white is fixed
+    'black': {
+        'add_black': 2.0,
+        'add_copy_black': 2.0,
+        'remove_black': 1.0,
+        'swap_black': 1.0,
+        'swap_existing_black': 2.0,
+        'change_black_king': 1.0,
+        'shuffle_black_positions': 1.0,
+        'swap_two_black_positions': 1.0,
+        'rotate_black': 1.0,  # Rotate a piece
+    },
+    # Only white mutations when black is fixed
+    'white': {
+        'add_white': 2.0,
+        'add_copy_white': 2.0,
+        'remove_white': 1.0,
+        'swap_white': 1.0,
+        'swap_existing_white': 2.0,
+        'change_white_king': 1.0,
+        'shuffle_white_positions': 1.0,
+        'swap_two_white_positions': 1.0,
+        'rotate_white': 1.0,  # Rotate a piece
+    },
+    'both': {
+        'add_white': 2.0, 'add_black': 2.0,           # Add random piece
+        'add_copy_white': 2.0, 'add_copy_black': 2.0, # Add copy of existing (themed armies)
+        'remove_white': 1.0, 'remove_black': 1.0,     # Rarely remove
+        'swap_white': 1.0, 'swap_black': 1.0,         # Swap for random piece
+        'swap_existing_white': 2.0, 'swap_existing_black': 2.0,  # Swap for existing type
+        'change_white_king': 1.0, 'change_black_king': 1.0,
+        'shuffle_white_positions': 1.0, 'shuffle_black_positions': 1.0,
+        'swap_two_white_positions': 1.0, 'swap_two_black_positions': 1.0,
+        'rotate_white': 1.0, 'rotate_black': 1.0,  # Rotate pieces
+    },
+}
+_TEMPLATE_MUTATIONS = {
+    'black': ('change_black_template',),
+    'white': ('change_white_template',),
+    'both': ('change_white_template', 'change_black_template'),
+}
+
+
+def _build_mutation_tables() -> dict[tuple[str, bool], tuple[tuple[str, ...], tuple[float, ...]]]:
+    """(mutation names, cumulative weights) for each mode, for a bisect draw."""
+    tables = {}
+    for side, weights in _MUTATION_WEIGHTS.items():
+        for with_templates in (False, True):
+            w = dict(weights)
+            if with_templates:
+                w.update(dict.fromkeys(_TEMPLATE_MUTATIONS[side], 1.0))
+            tables[side, with_templates] = (tuple(w), tuple(accumulate(w.values())))
+    return tables
+
+
+_MUTATION_TABLES = _build_mutation_tables()
+
+
 def mutate_ruleset(rs: RuleSet, rng: random.Random, forced_template: str = None, mutate_black_only: bool = False, mutate_white_only: bool = False) -> RuleSet:
     """Mutate a rule set. One random mutation per call.
 
@@ -559,9 +715,6 @@ def mutate_ruleset(rs: RuleSet, rng: random.Random, forced_template: str = None,
         mutate_black_only: If True, only mutate Black's army (for fixed-white evolution)
         mutate_white_only: If True, only mutate White's army (for fixed-black evolution)
     """
-    from hexwar.pieces import REGULAR_PIECE_IDS, KING_IDS
-    from hexwar.board import WHITE_PIECE_ZONE, BLACK_PIECE_ZONE
-
     # Copy lists
     white_pieces = list(rs.white_pieces)
     black_pieces = list(rs.black_pieces)
@@ -575,62 +728,15 @@ def mutate_ruleset(rs: RuleSet, rng: random.Random, forced_template: str = None,
     black_facings = list(rs.black_facings) if rs.black_facings else None
 
     # Choose mutation type with weighted probabilities
-    # Bias toward MORE pieces (add is 3x more likely than remove)
-    # Bias toward duplicating existing pieces (for player learnability)
-    if mutate_black_only:
-        # Only black mutations when white is fixed
-        mutation_weights = {
-            'add_black': 2.0,
-            'add_copy_black': 2.0,
-            'remove_black': 1.0,
-            'swap_black': 1.0,
-            'swap_existing_black': 2.0,
-            'change_black_king': 1.0,
-            'shuffle_black_positions': 1.0,
-            'swap_two_black_positions': 1.0,
-            'rotate_black': 1.0,  # Rotate a piece
-        }
-        if not forced_template:
-            mutation_weights['change_black_template'] = 1.0
-    elif mutate_white_only:
-        # Only white mutations when black is fixed
-        mutation_weights = {
-            'add_white': 2.0,
-            'add_copy_white': 2.0,
-            'remove_white': 1.0,
-            'swap_white': 1.0,
-            'swap_existing_white': 2.0,
-            'change_white_king': 1.0,
-            'shuffle_white_positions': 1.0,
-            'swap_two_white_positions': 1.0,
-            'rotate_white': 1.0,  # Rotate a piece
-        }
-        if not forced_template:
-            mutation_weights['change_white_template'] = 1.0
-    else:
-        mutation_weights = {
-            'add_white': 2.0, 'add_black': 2.0,           # Add random piece
-            'add_copy_white': 2.0, 'add_copy_black': 2.0, # Add copy of existing (themed armies)
-            'remove_white': 1.0, 'remove_black': 1.0,     # Rarely remove
-            'swap_white': 1.0, 'swap_black': 1.0,         # Swap for random piece
-            'swap_existing_white': 2.0, 'swap_existing_black': 2.0,  # Swap for existing type
-            'change_white_king': 1.0, 'change_black_king': 1.0,
-            'shuffle_white_positions': 1.0, 'shuffle_black_positions': 1.0,
-            'swap_two_white_positions': 1.0, 'swap_two_black_positions': 1.0,
-            'rotate_white': 1.0, 'rotate_black': 1.0,  # Rotate pieces
-        }
-        if not forced_template:
-            mutation_weights['change_white_template'] = 1.0
-            mutation_weights['change_black_template'] = 1.0
-
-    mutations = list(mutation_weights.keys())
-    weights = [mutation_weights[m] for m in mutations]
-    mutation = rng.choices(mutations, weights=weights, k=1)[0]
+    side = 'black' if mutate_black_only else 'white' if mutate_white_only else 'both'
+    mutations, cum_weights = _MUTATION_TABLES[side, not forced_template]
+    # Same draw as rng.choices(mutations, cum_weights=cum_weights, k=1)[0]
+    mutation = mutations[bisect_right(cum_weights, rng.random() * cum_weights[-1], 0, len(mutations) - 1)]
 
     # For add mutations: only add piece if there's an available position
     if mutation == 'add_white' and len(white_pieces) < 15:
         if white_positions:
-            available = [p for p in WHITE_PIECE_ZONE if p not in white_positions]
+            available = _free_cells(WHITE_PIECE_ZONE, white_positions)
             if available:
                 white_pieces.append(rng.choice(REGULAR_PIECE_IDS))
                 white_positions.append(rng.choice(available))
@@ -638,7 +744,7 @@ def mutate_ruleset(rs: RuleSet, rng: random.Random, forced_template: str = None,
             white_pieces.append(rng.choice(REGULAR_PIECE_IDS))
     elif mutation == 'add_black' and len(black_pieces) < 15:
         if black_positions:
-            available = [p for p in BLACK_PIECE_ZONE if p not in black_positions]
+            available = _free_cells(BLACK_PIECE_ZONE, black_positions)
             if available:
                 black_pieces.append(rng.choice(REGULAR_PIECE_IDS))
                 black_positions.append(rng.choice(available))
@@ -647,7 +753,7 @@ def mutate_ruleset(rs: RuleSet, rng: random.Random, forced_template: str = None,
     elif mutation == 'add_copy_white' and len(white_pieces) < 15 and white_pieces:
         # Add a copy of an existing piece type (themed armies)
         if white_positions:
-            available = [p for p in WHITE_PIECE_ZONE if p not in white_positions]
+            available = _free_cells(WHITE_PIECE_ZONE, white_positions)
             if available:
                 white_pieces.append(rng.choice(white_pieces))
                 white_positions.append(rng.choice(available))
@@ -656,7 +762,7 @@ def mutate_ruleset(rs: RuleSet, rng: random.Random, forced_template: str = None,
     elif mutation == 'add_copy_black' and len(black_pieces) < 15 and black_pieces:
         # Add a copy of an existing piece type (themed armies)
         if black_positions:
-            available = [p for p in BLACK_PIECE_ZONE if p not in black_positions]
+            available = _free_cells(BLACK_PIECE_ZONE, black_positions)
             if available:
                 black_pieces.append(rng.choice(black_pieces))
                 black_positions.append(rng.choice(available))
@@ -699,9 +805,9 @@ def mutate_ruleset(rs: RuleSet, rng: random.Random, forced_template: str = None,
         # Template mutation disabled - only E is viable for D5+ evolution
         pass  # Keep current template (E)
     elif mutation == 'change_white_king':
-        white_king = rng.choice(list(KING_IDS))
+        white_king = rng.choice(KING_IDS)
     elif mutation == 'change_black_king':
-        black_king = rng.choice(list(KING_IDS))
+        black_king = rng.choice(KING_IDS)
     elif mutation == 'shuffle_white_positions' and white_positions and len(white_positions) > 1:
         # Shuffle only piece positions (index 1+), keep king at index 0 fixed
         piece_pos = white_positions[1:]
@@ -729,19 +835,17 @@ def mutate_ruleset(rs: RuleSet, rng: random.Random, forced_template: str = None,
     elif mutation == 'rotate_white' and white_facings and len(white_facings) > 1:
         # Rotate a random piece (not king at index 0) by 1-3 steps
         idx = rng.randrange(1, len(white_facings))
-        rotation = rng.choice([1, 2, -1, -2])  # CW or CCW by 1-2 steps
+        rotation = rng.choice((1, 2, -1, -2))  # CW or CCW by 1-2 steps
         white_facings[idx] = (white_facings[idx] + rotation) % 6
     elif mutation == 'rotate_black' and black_facings and len(black_facings) > 1:
         # Rotate a random piece (not king at index 0) by 1-3 steps
         idx = rng.randrange(1, len(black_facings))
-        rotation = rng.choice([1, 2, -1, -2])  # CW or CCW by 1-2 steps
+        rotation = rng.choice((1, 2, -1, -2))  # CW or CCW by 1-2 steps
         black_facings[idx] = (black_facings[idx] + rotation) % 6
 
     # Enforce W1/W2 constraint
-    if 'W1' in white_pieces and 'W2' in white_pieces:
-        white_pieces.remove('W2')
-    if 'W1' in black_pieces and 'W2' in black_pieces:
-        black_pieces.remove('W2')
+    _drop_shifter_with_warper(white_pieces, white_positions)
+    _drop_shifter_with_warper(black_pieces, black_positions)
 
     return RuleSet(
         white_pieces=white_pieces,
@@ -776,9 +880,246 @@ PIECE_TIERS = {
 }
 
 
-def get_pieces_by_tier(tier: int) -> list[str]:
+# Reverse index of PIECE_TIERS, in PIECE_TIERS order
+PIECES_BY_TIER: dict[int, tuple[str, ...]] = {}
+for _pid, _tier in PIECE_TIERS.items():
+    PIECES_BY_TIER[_tier] = PIECES_BY_TIER.get(_tier, ()) + (_pid,)
+
+# Candidate pools smart mutation adds from
+PAWN_TIER_POOL = PIECES_BY_TIER[0] + PIECES_BY_TIER[1]
+HIGH_TIER_POOL = PIECES_BY_TIER[5] + PIECES_BY_TIER[4]
+
+
+def get_pieces_by_tier(tier: int) -> tuple[str, ...]:
     """Get all piece IDs at a given tier."""
-    return [pid for pid, t in PIECE_TIERS.items() if t == tier]
+    return PIECES_BY_TIER.get(tier, ())
+
+
+def _lowest_tier_index(pieces: list[str]) -> int:
+    """Index of the first lowest-tier piece."""
+    tier_of = PIECE_TIERS.get
+    tiers = [tier_of(p, 3) for p in pieces]
+    return tiers.index(min(tiers))
+
+
+def _highest_tier_index(pieces: list[str]) -> int:
+    """Index of the first highest-tier piece."""
+    tier_of = PIECE_TIERS.get
+    tiers = [tier_of(p, 3) for p in pieces]
+    return tiers.index(max(tiers))
+
+
+def _remove_piece(pieces: list[str], positions: Optional[list[tuple[int, int]]], idx: int) -> None:
+    """Remove pieces[idx] and its position (index + 1, after the king)."""
+    pieces.pop(idx)
+    if positions and len(positions) > idx + 1:
+        positions.pop(idx + 1)
+
+
+def _add_piece(
+    pieces: list[str],
+    positions: Optional[list[tuple[int, int]]],
+    zone: frozenset,
+    pool: tuple[str, ...],
+    rng: random.Random,
+    unplaced_ok: bool = False,
+) -> bool:
+    """Add a piece from pool on a free cell of zone. Returns whether one was added.
+
+    Armies without positions are only added to when unplaced_ok; they get
+    placed randomly at game creation.
+    """
+    if positions:
+        available = _free_cells(zone, positions)
+        if not available:
+            return False
+        pieces.append(rng.choice(pool))
+        positions.append(rng.choice(available))
+        return True
+    if unplaced_ok:
+        pieces.append(rng.choice(pool))
+        return True
+    return False
+
+
+def _swap_two_positions(positions: Optional[list[tuple[int, int]]], rng: random.Random) -> None:
+    """Swap two piece positions (index 1+), keeping the king at index 0."""
+    if positions and len(positions) >= 3:
+        i, j = rng.sample(range(1, len(positions)), 2)
+        positions[i], positions[j] = positions[j], positions[i]
+
+
+def _retier_piece(pieces: list[str], idx: int, tier: int, rng: random.Random) -> None:
+    """Replace pieces[idx] with a random piece of the given tier, if there is one."""
+    candidates = get_pieces_by_tier(tier)
+    if candidates:
+        pieces[idx] = rng.choice(candidates)
+
+
+def _swap_same_tier(pieces: list[str], rng: random.Random) -> None:
+    """Swap a random piece for another of its tier."""
+    idx = rng.randrange(len(pieces))
+    _retier_piece(pieces, idx, PIECE_TIERS.get(pieces[idx], 3), rng)
+
+
+def _swap_near_tier(pieces: list[str], rng: random.Random) -> None:
+    """Swap a random piece for one of the same or an adjacent tier."""
+    idx = rng.randrange(len(pieces))
+    target_tier = PIECE_TIERS.get(pieces[idx], 3) + rng.choice((-1, 0, 0, 1))  # Bias toward same tier
+    _retier_piece(pieces, idx, max(0, min(5, target_tier)), rng)
+
+
+def _upgrade_lowest(pieces: list[str], rng: random.Random) -> None:
+    """Upgrade the lowest-tier piece by 1-2 tiers."""
+    idx = _lowest_tier_index(pieces)
+    _retier_piece(pieces, idx, min(PIECE_TIERS.get(pieces[idx], 3) + rng.randint(1, 2), 5), rng)
+
+
+def _downgrade_highest(pieces: list[str], rng: random.Random) -> None:
+    """Downgrade the highest-tier piece by 1-2 tiers."""
+    idx = _highest_tier_index(pieces)
+    _retier_piece(pieces, idx, max(PIECE_TIERS.get(pieces[idx], 3) - rng.randint(1, 2), 0), rng)
+
+
+def _side_balanced(pieces: list[str], positions: Optional[list[tuple[int, int]]], zone: frozenset, needs_buff: bool, rng: random.Random) -> None:
+    """Balanced: small random mutation, with no buff/nerf direction."""
+    action = rng.choice(('swap_piece', 'add_piece', 'shuffle'))
+    if action == 'swap_piece' and pieces:
+        _swap_near_tier(pieces, rng)
+    elif action == 'add_piece' and len(pieces) < 15:
+        _add_piece(pieces, positions, zone, PAWN_TIER_POOL, rng)
+    else:  # shuffle + swap
+        _swap_two_positions(positions, rng)
+        if pieces:
+            _swap_same_tier(pieces, rng)
+
+
+def _side_slight(pieces: list[str], positions: Optional[list[tuple[int, int]]], zone: frozenset, needs_buff: bool, rng: random.Random) -> None:
+    """Slight imbalance: add or remove a pawn, else shuffle."""
+    if needs_buff and len(pieces) < 15:
+        # Add pawn to buff this side
+        _add_piece(pieces, positions, zone, PAWN_TIER_POOL, rng)
+    elif not needs_buff and len(pieces) > 8:
+        # Remove pawn to nerf this side
+        _remove_piece(pieces, positions, _lowest_tier_index(pieces))
+    else:
+        _swap_two_positions(positions, rng)
+
+
+def _side_moderate(pieces: list[str], positions: Optional[list[tuple[int, int]]], zone: frozenset, needs_buff: bool, rng: random.Random) -> None:
+    """Moderate imbalance: upgrade or downgrade one piece."""
+    if needs_buff and pieces:
+        _upgrade_lowest(pieces, rng)
+    elif not needs_buff and pieces:
+        _downgrade_highest(pieces, rng)
+
+
+def _side_severe(pieces: list[str], positions: Optional[list[tuple[int, int]]], zone: frozenset, needs_buff: bool, rng: random.Random) -> None:
+    """Severe imbalance: add or remove a high-tier piece."""
+    if needs_buff:
+        # Add high-tier piece or upgrade existing
+        added = len(pieces) < 15 and _add_piece(pieces, positions, zone, HIGH_TIER_POOL, rng)
+        if not added and pieces:
+            idx = _lowest_tier_index(pieces)
+            pieces[idx] = rng.choice(HIGH_TIER_POOL)
+    else:
+        # Remove high-tier piece or downgrade existing
+        if len(pieces) > 8:
+            _remove_piece(pieces, positions, _highest_tier_index(pieces))
+        elif pieces:
+            idx = _highest_tier_index(pieces)
+            pieces[idx] = rng.choice(PAWN_TIER_POOL)
+
+
+# One-sided smart mutation handlers, indexed by imbalance band
+_IMBALANCE_THRESHOLDS = (0.05, 0.15, 0.25)
+_SIDE_HANDLERS = (_side_balanced, _side_slight, _side_moderate, _side_severe)
+
+
+def _normal_balanced(losing_pieces: list[str], losing_positions: Optional[list[tuple[int, int]]], losing_piece_zone: frozenset, winning_pieces: list[str], winning_positions: Optional[list[tuple[int, int]]], rng: random.Random) -> None:
+    """Very balanced (0.45-0.55): small random mutation to explore."""
+    # Can't just shuffle positions - that doesn't change the signature!
+    action = rng.choice(('swap_piece', 'add_piece', 'shuffle'))
+
+    if action == 'swap_piece' and losing_pieces:
+        # Swap one piece for a same-tier or adjacent-tier piece
+        _swap_near_tier(losing_pieces, rng)
+    elif action == 'add_piece' and len(losing_pieces) < 15:
+        # Add a low-tier piece (only if position available)
+        _add_piece(losing_pieces, losing_positions, losing_piece_zone, PAWN_TIER_POOL, rng, unplaced_ok=True)
+    else:  # shuffle - but also swap a piece to ensure signature changes
+        _swap_two_positions(losing_positions, rng)
+        if losing_pieces:
+            _swap_same_tier(losing_pieces, rng)
+
+
+def _normal_slight(losing_pieces: list[str], losing_positions: Optional[list[tuple[int, int]]], losing_piece_zone: frozenset, winning_pieces: list[str], winning_positions: Optional[list[tuple[int, int]]], rng: random.Random) -> None:
+    """Slightly imbalanced (0.35-0.45 or 0.55-0.65).
+
+    Add a pawn to the losing side, remove one from the winning side, or shuffle.
+    """
+    action = rng.choice(('add_pawn_losing', 'remove_pawn_winning', 'shuffle'))
+
+    if action == 'add_pawn_losing' and len(losing_pieces) < 15:
+        # Only add piece if position available
+        _add_piece(losing_pieces, losing_positions, losing_piece_zone, PAWN_TIER_POOL, rng, unplaced_ok=True)
+    elif action == 'remove_pawn_winning' and len(winning_pieces) > 8:
+        # Remove the lowest tier piece
+        _remove_piece(winning_pieces, winning_positions, _lowest_tier_index(winning_pieces))
+    else:
+        _swap_two_positions(losing_positions, rng)
+
+
+def _normal_moderate(losing_pieces: list[str], losing_positions: Optional[list[tuple[int, int]]], losing_piece_zone: frozenset, winning_pieces: list[str], winning_positions: Optional[list[tuple[int, int]]], rng: random.Random) -> None:
+    """Moderately imbalanced (0.25-0.35 or 0.65-0.75).
+
+    Upgrade a piece on the losing side, or downgrade one on the winning side.
+    """
+    action = rng.choice(('upgrade_losing', 'downgrade_winning'))
+
+    if action == 'upgrade_losing' and losing_pieces:
+        _upgrade_lowest(losing_pieces, rng)
+    elif action == 'downgrade_winning' and winning_pieces:
+        _downgrade_highest(winning_pieces, rng)
+
+
+def _normal_severe(losing_pieces: list[str], losing_positions: Optional[list[tuple[int, int]]], losing_piece_zone: frozenset, winning_pieces: list[str], winning_positions: Optional[list[tuple[int, int]]], rng: random.Random) -> None:
+    """Severely imbalanced (>0.75 or <0.25).
+
+    Add a high-value piece to the losing side, or upgrade one if it is full.
+    """
+    added = len(losing_pieces) < 15 and _add_piece(
+        losing_pieces, losing_positions, losing_piece_zone, HIGH_TIER_POOL, rng, unplaced_ok=True
+    )
+    if not added:
+        # Can't add more, so upgrade existing
+        idx = _lowest_tier_index(losing_pieces)
+        losing_pieces[idx] = rng.choice(HIGH_TIER_POOL)
+
+
+# Two-sided (normal mode) smart mutation handlers, indexed by imbalance band
+_NORMAL_HANDLERS = (_normal_balanced, _normal_slight, _normal_moderate, _normal_severe)
+
+
+def _smart_mutate_side(
+    pieces: list[str],
+    positions: Optional[list[tuple[int, int]]],
+    zone: frozenset,
+    needs_buff: bool,
+    imbalance: float,
+    rng: random.Random,
+) -> None:
+    """Buff or nerf one army in place, scaled by win-rate imbalance.
+
+    Used by smart_mutate_ruleset when only one side is mutated; the
+    intensity bands match its docstring.
+    """
+    _SIDE_HANDLERS[bisect_right(_IMBALANCE_THRESHOLDS, imbalance)](
+        pieces, positions, zone, needs_buff, rng
+    )
+
+    # Enforce W1/W2 constraint
+    _drop_shifter_with_warper(pieces, positions)
 
 
 def smart_mutate_ruleset(
@@ -805,9 +1146,6 @@ def smart_mutate_ruleset(
     - 0.25-0.35 or 0.65-0.75: Upgrade/downgrade a piece
     - <0.25 or >0.75: Add high-value piece to losing side
     """
-    from hexwar.pieces import REGULAR_PIECE_IDS
-    from hexwar.board import WHITE_PIECE_ZONE, BLACK_PIECE_ZONE
-
     # Copy ruleset data
     white_pieces = list(rs.white_pieces)
     black_pieces = list(rs.black_pieces)
@@ -832,118 +1170,7 @@ def smart_mutate_ruleset(
         # If white is losing (black winning), nerf black
         needs_buff = not white_losing  # Black needs buff when white is winning
 
-        if imbalance < 0.05:
-            # Balanced: small random mutation
-            action = rng.choice(['swap_piece', 'add_piece', 'shuffle'])
-            if action == 'swap_piece' and black_pieces:
-                idx = rng.randrange(len(black_pieces))
-                current_tier = PIECE_TIERS.get(black_pieces[idx], 3)
-                target_tier = current_tier + rng.choice([-1, 0, 0, 1])
-                target_tier = max(0, min(5, target_tier))
-                candidates = get_pieces_by_tier(target_tier)
-                if candidates:
-                    black_pieces[idx] = rng.choice(candidates)
-            elif action == 'add_piece' and len(black_pieces) < 15:
-                if black_positions:
-                    available = [p for p in BLACK_PIECE_ZONE if p not in black_positions]
-                    if available:
-                        pawn_tier = get_pieces_by_tier(0) + get_pieces_by_tier(1)
-                        black_pieces.append(rng.choice(pawn_tier))
-                        black_positions.append(rng.choice(available))
-            else:  # shuffle + swap
-                if black_positions and len(black_positions) >= 3:
-                    i, j = rng.sample(range(1, len(black_positions)), 2)
-                    black_positions[i], black_positions[j] = black_positions[j], black_positions[i]
-                if black_pieces:
-                    idx = rng.randrange(len(black_pieces))
-                    current_tier = PIECE_TIERS.get(black_pieces[idx], 3)
-                    candidates = get_pieces_by_tier(current_tier)
-                    if candidates:
-                        black_pieces[idx] = rng.choice(candidates)
-
-        elif imbalance < 0.15:
-            # Slight imbalance
-            if needs_buff and len(black_pieces) < 15:
-                # Add pawn to buff black
-                if black_positions:
-                    available = [p for p in BLACK_PIECE_ZONE if p not in black_positions]
-                    if available:
-                        pawn_tier = get_pieces_by_tier(0) + get_pieces_by_tier(1)
-                        black_pieces.append(rng.choice(pawn_tier))
-                        black_positions.append(rng.choice(available))
-            elif not needs_buff and len(black_pieces) > 8:
-                # Remove pawn to nerf black
-                piece_tiers = [(i, PIECE_TIERS.get(p, 3)) for i, p in enumerate(black_pieces)]
-                piece_tiers.sort(key=lambda x: x[1])
-                idx = piece_tiers[0][0]
-                black_pieces.pop(idx)
-                if black_positions and len(black_positions) > idx + 1:
-                    black_positions.pop(idx + 1)
-            else:
-                # Shuffle
-                if black_positions and len(black_positions) >= 3:
-                    i, j = rng.sample(range(1, len(black_positions)), 2)
-                    black_positions[i], black_positions[j] = black_positions[j], black_positions[i]
-
-        elif imbalance < 0.25:
-            # Moderate imbalance
-            if needs_buff and black_pieces:
-                # Upgrade a low-tier piece
-                piece_tiers = [(i, PIECE_TIERS.get(p, 3)) for i, p in enumerate(black_pieces)]
-                piece_tiers.sort(key=lambda x: x[1])
-                idx, current_tier = piece_tiers[0]
-                new_tier = min(current_tier + rng.randint(1, 2), 5)
-                candidates = get_pieces_by_tier(new_tier)
-                if candidates:
-                    black_pieces[idx] = rng.choice(candidates)
-            elif not needs_buff and black_pieces:
-                # Downgrade a high-tier piece
-                piece_tiers = [(i, PIECE_TIERS.get(p, 3)) for i, p in enumerate(black_pieces)]
-                piece_tiers.sort(key=lambda x: -x[1])
-                idx, current_tier = piece_tiers[0]
-                new_tier = max(current_tier - rng.randint(1, 2), 0)
-                candidates = get_pieces_by_tier(new_tier)
-                if candidates:
-                    black_pieces[idx] = rng.choice(candidates)
-
-        else:
-            # Severe imbalance
-            if needs_buff:
-                # Add high-tier piece or upgrade existing
-                can_add = False
-                if len(black_pieces) < 15:
-                    if black_positions:
-                        available = [p for p in BLACK_PIECE_ZONE if p not in black_positions]
-                        if available:
-                            high_tier = get_pieces_by_tier(5) + get_pieces_by_tier(4)
-                            black_pieces.append(rng.choice(high_tier))
-                            black_positions.append(rng.choice(available))
-                            can_add = True
-                if not can_add and black_pieces:
-                    piece_tiers = [(i, PIECE_TIERS.get(p, 3)) for i, p in enumerate(black_pieces)]
-                    piece_tiers.sort(key=lambda x: x[1])
-                    idx, _ = piece_tiers[0]
-                    high_tier = get_pieces_by_tier(5) + get_pieces_by_tier(4)
-                    black_pieces[idx] = rng.choice(high_tier)
-            else:
-                # Remove high-tier piece or downgrade existing
-                if len(black_pieces) > 8:
-                    piece_tiers = [(i, PIECE_TIERS.get(p, 3)) for i, p in enumerate(black_pieces)]
-                    piece_tiers.sort(key=lambda x: -x[1])
-                    idx = piece_tiers[0][0]
-                    black_pieces.pop(idx)
-                    if black_positions and len(black_positions) > idx + 1:
-                        black_positions.pop(idx + 1)
-                elif black_pieces:
-                    piece_tiers = [(i, PIECE_TIERS.get(p, 3)) for i, p in enumerate(black_pieces)]
-                    piece_tiers.sort(key=lambda x: -x[1])
-                    idx, current_tier = piece_tiers[0]
-                    low_tier = get_pieces_by_tier(0) + get_pieces_by_tier(1)
-                    black_pieces[idx] = rng.choice(low_tier)
-
-        # Enforce W1/W2 constraint for black only
-        if 'W1' in black_pieces and 'W2' in black_pieces:
-            black_pieces.remove('W2')
+        _smart_mutate_side(black_pieces, black_positions, BLACK_PIECE_ZONE, needs_buff, imbalance, rng)
 
         return RuleSet(
             white_pieces=white_pieces,
@@ -966,118 +1193,7 @@ def smart_mutate_ruleset(
         # If white is winning, nerf white
         needs_buff = white_losing  # White needs buff when white is losing
 
-        if imbalance < 0.05:
-            # Balanced: small random mutation
-            action = rng.choice(['swap_piece', 'add_piece', 'shuffle'])
-            if action == 'swap_piece' and white_pieces:
-                idx = rng.randrange(len(white_pieces))
-                current_tier = PIECE_TIERS.get(white_pieces[idx], 3)
-                target_tier = current_tier + rng.choice([-1, 0, 0, 1])
-                target_tier = max(0, min(5, target_tier))
-                candidates = get_pieces_by_tier(target_tier)
-                if candidates:
-                    white_pieces[idx] = rng.choice(candidates)
-            elif action == 'add_piece' and len(white_pieces) < 15:
-                if white_positions:
-                    available = [p for p in WHITE_PIECE_ZONE if p not in white_positions]
-                    if available:
-                        pawn_tier = get_pieces_by_tier(0) + get_pieces_by_tier(1)
-                        white_pieces.append(rng.choice(pawn_tier))
-                        white_positions.append(rng.choice(available))
-            else:  # shuffle + swap
-                if white_positions and len(white_positions) >= 3:
-                    i, j = rng.sample(range(1, len(white_positions)), 2)
-                    white_positions[i], white_positions[j] = white_positions[j], white_positions[i]
-                if white_pieces:
-                    idx = rng.randrange(len(white_pieces))
-                    current_tier = PIECE_TIERS.get(white_pieces[idx], 3)
-                    candidates = get_pieces_by_tier(current_tier)
-                    if candidates:
-                        white_pieces[idx] = rng.choice(candidates)
-
-        elif imbalance < 0.15:
-            # Slight imbalance
-            if needs_buff and len(white_pieces) < 15:
-                # Add pawn to buff white
-                if white_positions:
-                    available = [p for p in WHITE_PIECE_ZONE if p not in white_positions]
-                    if available:
-                        pawn_tier = get_pieces_by_tier(0) + get_pieces_by_tier(1)
-                        white_pieces.append(rng.choice(pawn_tier))
-                        white_positions.append(rng.choice(available))
-            elif not needs_buff and len(white_pieces) > 8:
-                # Remove pawn to nerf white
-                piece_tiers = [(i, PIECE_TIERS.get(p, 3)) for i, p in enumerate(white_pieces)]
-                piece_tiers.sort(key=lambda x: x[1])
-                idx = piece_tiers[0][0]
-                white_pieces.pop(idx)
-                if white_positions and len(white_positions) > idx + 1:
-                    white_positions.pop(idx + 1)
-            else:
-                # Shuffle
-                if white_positions and len(white_positions) >= 3:
-                    i, j = rng.sample(range(1, len(white_positions)), 2)
-                    white_positions[i], white_positions[j] = white_positions[j], white_positions[i]
-
-        elif imbalance < 0.25:
-            # Moderate imbalance
-            if needs_buff and white_pieces:
-                # Upgrade a low-tier piece
-                piece_tiers = [(i, PIECE_TIERS.get(p, 3)) for i, p in enumerate(white_pieces)]
-                piece_tiers.sort(key=lambda x: x[1])
-                idx, current_tier = piece_tiers[0]
-                new_tier = min(current_tier + rng.randint(1, 2), 5)
-                candidates = get_pieces_by_tier(new_tier)
-                if candidates:
-                    white_pieces[idx] = rng.choice(candidates)
-            elif not needs_buff and white_pieces:
-                # Downgrade a high-tier piece
-                piece_tiers = [(i, PIECE_TIERS.get(p, 3)) for i, p in enumerate(white_pieces)]
-                piece_tiers.sort(key=lambda x: -x[1])
-                idx, current_tier = piece_tiers[0]
-                new_tier = max(current_tier - rng.randint(1, 2), 0)
-                candidates = get_pieces_by_tier(new_tier)
-                if candidates:
-                    white_pieces[idx] = rng.choice(candidates)
-
-        else:
-            # Severe imbalance
-            if needs_buff:
-                # Add high-tier piece or upgrade existing
-                can_add = False
-                if len(white_pieces) < 15:
-                    if white_positions:
-                        available = [p for p in WHITE_PIECE_ZONE if p not in white_positions]
-                        if available:
-                            high_tier = get_pieces_by_tier(5) + get_pieces_by_tier(4)
-                            white_pieces.append(rng.choice(high_tier))
-                            white_positions.append(rng.choice(available))
-                            can_add = True
-                if not can_add and white_pieces:
-                    piece_tiers = [(i, PIECE_TIERS.get(p, 3)) for i, p in enumerate(white_pieces)]
-                    piece_tiers.sort(key=lambda x: x[1])
-                    idx, _ = piece_tiers[0]
-                    high_tier = get_pieces_by_tier(5) + get_pieces_by_tier(4)
-                    white_pieces[idx] = rng.choice(high_tier)
-            else:
-                # Remove high-tier piece or downgrade existing
-                if len(white_pieces) > 8:
-                    piece_tiers = [(i, PIECE_TIERS.get(p, 3)) for i, p in enumerate(white_pieces)]
-                    piece_tiers.sort(key=lambda x: -x[1])
-                    idx = piece_tiers[0][0]
-                    white_pieces.pop(idx)
-                    if white_positions and len(white_positions) > idx + 1:
-                        white_positions.pop(idx + 1)
-                elif white_pieces:
-                    piece_tiers = [(i, PIECE_TIERS.get(p, 3)) for i, p in enumerate(white_pieces)]
-                    piece_tiers.sort(key=lambda x: -x[1])
-                    idx, current_tier = piece_tiers[0]
-                    low_tier = get_pieces_by_tier(0) + get_pieces_by_tier(1)
-                    white_pieces[idx] = rng.choice(low_tier)
-
-        # Enforce W1/W2 constraint for white only
-        if 'W1' in white_pieces and 'W2' in white_pieces:
-            white_pieces.remove('W2')
+        _smart_mutate_side(white_pieces, white_positions, WHITE_PIECE_ZONE, needs_buff, imbalance, rng)
 
         return RuleSet(
             white_pieces=white_pieces,
@@ -1100,128 +1216,10 @@ def smart_mutate_ruleset(
     losing_positions = white_positions if white_losing else black_positions
     winning_positions = black_positions if white_losing else white_positions
     losing_piece_zone = WHITE_PIECE_ZONE if white_losing else BLACK_PIECE_ZONE
-    winning_piece_zone = BLACK_PIECE_ZONE if white_losing else WHITE_PIECE_ZONE
-
-    if imbalance < 0.05:
-        # Very balanced (0.45-0.55): small random mutation to explore
-        # Can't just shuffle positions - that doesn't change the signature!
-        action = rng.choice(['swap_piece', 'add_piece', 'shuffle'])
-
-        if action == 'swap_piece' and losing_pieces:
-            # Swap one piece for a same-tier or adjacent-tier piece
-            idx = rng.randrange(len(losing_pieces))
-            current_tier = PIECE_TIERS.get(losing_pieces[idx], 3)
-            # Pick from current tier or adjacent
-            target_tier = current_tier + rng.choice([-1, 0, 0, 1])  # Bias toward same tier
-            target_tier = max(0, min(5, target_tier))
-            candidates = get_pieces_by_tier(target_tier)
-            if candidates:
-                losing_pieces[idx] = rng.choice(candidates)
-        elif action == 'add_piece' and len(losing_pieces) < 15:
-            # Add a low-tier piece (only if position available)
-            if losing_positions:
-                available = [p for p in losing_piece_zone if p not in losing_positions]
-                if available:
-                    pawn_tier = get_pieces_by_tier(0) + get_pieces_by_tier(1)
-                    losing_pieces.append(rng.choice(pawn_tier))
-                    losing_positions.append(rng.choice(available))
-            else:
-                pawn_tier = get_pieces_by_tier(0) + get_pieces_by_tier(1)
-                losing_pieces.append(rng.choice(pawn_tier))
-        else:  # shuffle - but also swap a piece to ensure signature changes
-            if losing_positions and len(losing_positions) >= 3:
-                # Shuffle piece positions only (index 1+), keep king at index 0
-                i, j = rng.sample(range(1, len(losing_positions)), 2)
-                losing_positions[i], losing_positions[j] = losing_positions[j], losing_positions[i]
-            # Also swap one piece to change signature
-            if losing_pieces:
-                idx = rng.randrange(len(losing_pieces))
-                current_tier = PIECE_TIERS.get(losing_pieces[idx], 3)
-                candidates = get_pieces_by_tier(current_tier)
-                if candidates:
-                    losing_pieces[idx] = rng.choice(candidates)
-
-    elif imbalance < 0.15:
-        # Slightly imbalanced (0.35-0.45 or 0.55-0.65)
-        # Try: add pawn to losing side, or remove pawn from winning side, or shuffle
-        action = rng.choice(['add_pawn_losing', 'remove_pawn_winning', 'shuffle'])
-
-        if action == 'add_pawn_losing' and len(losing_pieces) < 15:
-            # Only add piece if position available
-            if losing_positions:
-                available = [p for p in losing_piece_zone if p not in losing_positions]
-                if available:
-                    pawn_tier = get_pieces_by_tier(0) + get_pieces_by_tier(1)
-                    losing_pieces.append(rng.choice(pawn_tier))
-                    losing_positions.append(rng.choice(available))
-            else:
-                pawn_tier = get_pieces_by_tier(0) + get_pieces_by_tier(1)
-                losing_pieces.append(rng.choice(pawn_tier))
-
-        elif action == 'remove_pawn_winning' and len(winning_pieces) > 8:
-            # Find lowest tier piece to remove
-            piece_tiers = [(i, PIECE_TIERS.get(p, 3)) for i, p in enumerate(winning_pieces)]
-            piece_tiers.sort(key=lambda x: x[1])
-            idx = piece_tiers[0][0]
-            winning_pieces.pop(idx)
-            if winning_positions and len(winning_positions) > idx + 1:
-                winning_positions.pop(idx + 1)
-
-        else:  # shuffle piece positions only (index 1+), keep king at index 0
-            if losing_positions and len(losing_positions) >= 3:
-                i, j = rng.sample(range(1, len(losing_positions)), 2)
-                losing_positions[i], losing_positions[j] = losing_positions[j], losing_positions[i]
-
-    elif imbalance < 0.25:
-        # Moderately imbalanced (0.25-0.35 or 0.65-0.75)
-        # Upgrade a piece on losing side, or downgrade on winning side
-        action = rng.choice(['upgrade_losing', 'downgrade_winning'])
-
-        if action == 'upgrade_losing' and losing_pieces:
-            # Find a low-tier piece to upgrade
-            piece_tiers = [(i, PIECE_TIERS.get(p, 3)) for i, p in enumerate(losing_pieces)]
-            piece_tiers.sort(key=lambda x: x[1])
-            idx, current_tier = piece_tiers[0]
-            # Upgrade by 1-2 tiers
-            new_tier = min(current_tier + rng.randint(1, 2), 5)
-            candidates = get_pieces_by_tier(new_tier)
-            if candidates:
-                losing_pieces[idx] = rng.choice(candidates)
-
-        elif action == 'downgrade_winning' and winning_pieces:
-            # Find a high-tier piece to downgrade
-            piece_tiers = [(i, PIECE_TIERS.get(p, 3)) for i, p in enumerate(winning_pieces)]
-            piece_tiers.sort(key=lambda x: -x[1])  # Highest first
-            idx, current_tier = piece_tiers[0]
-            # Downgrade by 1-2 tiers
-            new_tier = max(current_tier - rng.randint(1, 2), 0)
-            candidates = get_pieces_by_tier(new_tier)
-            if candidates:
-                winning_pieces[idx] = rng.choice(candidates)
 
-    else:
-        # Severely imbalanced (>0.75 or <0.25)
-        # Add a high-value piece to losing side (only if position available)
-        can_add = False
-        if len(losing_pieces) < 15:
-            if losing_positions:
-                available = [p for p in losing_piece_zone if p not in losing_positions]
-                if available:
-                    high_tier = get_pieces_by_tier(5) + get_pieces_by_tier(4)
-                    losing_pieces.append(rng.choice(high_tier))
-                    losing_positions.append(rng.choice(available))
-                    can_add = True
-            else:
-                high_tier = get_pieces_by_tier(5) + get_pieces_by_tier(4)
-                losing_pieces.append(rng.choice(high_tier))
-                can_add = True
-        if not can_add:
-            # Can't add more, so upgrade existing
-            piece_tiers = [(i, PIECE_TIERS.get(p, 3)) for i, p in enumerate(losing_pieces)]
-            piece_tiers.sort(key=lambda x: x[1])
-            idx, _ = piece_tiers[0]
-            high_tier = get_pieces_by_tier(5) + get_pieces_by_tier(4)
-            losing_pieces[idx] = rng.choice(high_tier)
+    _NORMAL_HANDLERS[bisect_right(_IMBALANCE_THRESHOLDS, imbalance)](
+        losing_pieces, losing_positions, losing_piece_zone, winning_pieces, winning_positions, rng
+    )
 
     # Reassign back
     if white_losing:
@@ -1236,10 +1234,8 @@ def smart_mutate_ruleset(
         white_positions = winning_positions
 
     # Enforce W1/W2 constraint
-    if 'W1' in white_pieces and 'W2' in white_pieces:
-        white_pieces.remove('W2')
-    if 'W1' in black_pieces and 'W2' in black_pieces:
-        black_pieces.remove('W2')
+    _drop_shifter_with_warper(white_pieces, white_positions)
+    _drop_shifter_with_warper(black_pieces, black_positions)
 
     return RuleSet(
         white_pieces=white_pieces,
@@ -1269,9 +1265,6 @@ def load_seed_rulesets(seed_dir: str) -> list[RuleSet]:
     Returns:
         List of RuleSet objects
     """
-    import json
-    from pathlib import Path
-
     seed_path = Path(seed_dir)
     if not seed_path.exists():
         print(f"Warning: Seed directory {seed_dir} does not exist")
@@ -1280,8 +1273,8 @@ def load_seed_rulesets(seed_dir: str) -> list[RuleSet]:
     rulesets = []
     for f in seed_path.glob('*.json'):
         try:
-            with open(f) as fp:
-                data = json.load(fp)
+            raw = f.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
             # Handle board set format (has 'pieces' array)
             if 'pieces' in data and isinstance(data['pieces'], list):
@@ -1530,7 +1523,11 @@ def evaluate_ruleset_fitness(
         depth=depth,
         games_per_matchup=n_games,
     )
+    return _tournament_fitness(result)
+
 
+def _tournament_fitness(result) -> dict:
+    """Fitness dict for a RulesetEvalResult, with derived length/decisiveness scores."""
     # Compute derived metrics
     # Game length score: peaks around 20-40 rounds, lower for very short or very long games
     ideal_min, ideal_max = 15.0, 50.0
@@ -1584,6 +1581,7 @@ def evolve_rulesets(
     fixed_white: Optional[RuleSet] = None,
     fixed_black: Optional[RuleSet] = None,
     no_cache: bool = False,
+    executor: Optional[ProcessPoolExecutor] = None,
 ) -> tuple[RuleSet, dict]:
     """Evolve rule sets using a genetic algorithm with UCB selection.
 
@@ -1619,284 +1617,280 @@ def evolve_rulesets(
         fixed_black: If provided, keep Black's army fixed and only evolve White.
                      Pass a RuleSet whose black_pieces, black_king, black_template,
                      and black_positions will be used for all individuals.
+        executor: Optional process pool shared with the caller. When omitted
+                  and n_workers > 1, one pool is created for the whole run
+                  instead of forking fresh workers every generation.
 
     Returns:
         (best_ruleset, stats_dict)
     """
-    from concurrent.futures import ProcessPoolExecutor, as_completed
     from pathlib import Path
 
-    rng = random.Random(seed) if seed is not None else random.Random()
-
-    # Initialize fitness tracker for UCB selection
-    tracker = FitnessTracker(c=ucb_c, min_evals_for_confidence=min_evals_for_winner)
-
-    # Set up game logging if log_dir provided
+    owns_executor = executor is None and n_workers > 1
+    if owns_executor:
+        executor = ProcessPoolExecutor(max_workers=n_workers, initializer=_worker_init)
     game_log_file = None
-    if log_dir:
-        log_path = Path(log_dir)
-        log_path.mkdir(parents=True, exist_ok=True)
-        game_log_file = open(log_path / 'game_log.txt', 'w')
 
-    def log_game(msg: str):
-        if game_log_file:
-            game_log_file.write(msg + '\n')
-            game_log_file.flush()
+    try:
+        rng = random.Random(seed) if seed is not None else random.Random()
+
+        # Initialize fitness tracker for UCB selection
+        tracker = FitnessTracker(c=ucb_c, min_evals_for_confidence=min_evals_for_winner)
+
+        # Set up game logging if log_dir provided
+        if log_dir:
+            log_path = Path(log_dir)
+            log_path.mkdir(parents=True, exist_ok=True)
+            game_log_file = open(log_path / 'game_log.txt', 'w')
+
+        def log_game(msg: str):
+            if game_log_file:
+                game_log_file.write(msg + '\n')
+                game_log_file.flush()
+
+        # Helper to apply fixed white army to a ruleset
+        def apply_fixed_white(rs: RuleSet) -> RuleSet:
+            if fixed_white is None:
+                return rs
+            return RuleSet(
+                white_pieces=list(fixed_white.white_pieces),
+                black_pieces=rs.black_pieces,
+                white_template=fixed_white.white_template,
+                black_template=rs.black_template,
+                white_king=fixed_white.white_king,
+                black_king=rs.black_king,
+                white_positions=list(fixed_white.white_positions) if fixed_white.white_positions else None,
+                black_positions=rs.black_positions,
+                white_facings=list(fixed_white.white_facings) if fixed_white.white_facings else None,
+                black_facings=rs.black_facings,
+            )
 
-    # Helper to apply fixed white army to a ruleset
-    def apply_fixed_white(rs: RuleSet) -> RuleSet:
-        if fixed_white is None:
-            return rs
-        return RuleSet(
-            white_pieces=list(fixed_white.white_pieces),
-            black_pieces=rs.black_pieces,
-            white_template=fixed_white.white_template,
-            black_template=rs.black_template,
-            white_king=fixed_white.white_king,
-            black_king=rs.black_king,
-            white_positions=list(fixed_white.white_positions) if fixed_white.white_positions else None,
-            black_positions=rs.black_positions,
-            white_facings=list(fixed_white.white_facings) if fixed_white.white_facings else None,
-            black_facings=rs.black_facings,
-        )
+        # Helper to apply fixed black army to a ruleset
+        def apply_fixed_black(rs: RuleSet) -> RuleSet:
+            if fixed_black is None:
+                return rs
+            return RuleSet(
+                white_pieces=rs.white_pieces,
+                black_pieces=list(fixed_black.black_pieces),
+                white_template=rs.white_template,
+                black_template=fixed_black.black_template,
+                white_king=rs.white_king,
+                black_king=fixed_black.black_king,
+                white_positions=rs.white_positions,
+                black_positions=list(fixed_black.black_positions) if fixed_black.black_positions else None,
+                white_facings=rs.white_facings,
+                black_facings=list(fixed_black.black_facings) if fixed_black.black_facings else None,
+            )
 
-    # Helper to apply fixed black army to a ruleset
-    def apply_fixed_black(rs: RuleSet) -> RuleSet:
-        if fixed_black is None:
+        # Combined helper to apply any fixed armies
+        def apply_fixed_armies(rs: RuleSet) -> RuleSet:
+            rs = apply_fixed_white(rs)
+            rs = apply_fixed_black(rs)
             return rs
-        return RuleSet(
-            white_pieces=rs.white_pieces,
-            black_pieces=list(fixed_black.black_pieces),
-            white_template=rs.white_template,
-            black_template=fixed_black.black_template,
-            white_king=rs.white_king,
-            black_king=fixed_black.black_king,
-            white_positions=rs.white_positions,
-            black_positions=list(fixed_black.black_positions) if fixed_black.black_positions else None,
-            white_facings=rs.white_facings,
-            black_facings=list(fixed_black.black_facings) if fixed_black.black_facings else None,
-        )
 
-    # Combined helper to apply any fixed armies
-    def apply_fixed_armies(rs: RuleSet) -> RuleSet:
-        rs = apply_fixed_white(rs)
-        rs = apply_fixed_black(rs)
-        return rs
-
-    # Shorthand for mutation modes
-    mutate_black_only = fixed_white is not None
-    mutate_white_only = fixed_black is not None
-
-    if verbose and fixed_white:
-        print(f"  FIXED-WHITE MODE: Only evolving Black army", flush=True)
-        print(f"    White: {fixed_white.white_king} + {len(fixed_white.white_pieces)} pieces", flush=True)
-
-    if verbose and fixed_black:
-        print(f"  FIXED-BLACK MODE: Only evolving White army", flush=True)
-        print(f"    Black: {fixed_black.black_king} + {len(fixed_black.black_pieces)} pieces", flush=True)
+        # Shorthand for mutation modes
+        mutate_black_only = fixed_white is not None
+        mutate_white_only = fixed_black is not None
+
+        if verbose and fixed_white:
+            print(f"  FIXED-WHITE MODE: Only evolving Black army", flush=True)
+            print(f"    White: {fixed_white.white_king} + {len(fixed_white.white_pieces)} pieces", flush=True)
+
+        if verbose and fixed_black:
+            print(f"  FIXED-BLACK MODE: Only evolving White army", flush=True)
+            print(f"    Black: {fixed_black.black_king} + {len(fixed_black.black_pieces)} pieces", flush=True)
+
+        # Initialize population
+        population = []
+
+        if seed_rulesets:
+            # Use provided seed rulesets as initial population
+            for rs in seed_rulesets:
+                if forced_template:
+                    rs = RuleSet(
+                        white_pieces=rs.white_pieces,
+                        black_pieces=rs.black_pieces,
+                        white_template=forced_template,
+                        black_template=forced_template,
+                        white_king=rs.white_king,
+                        black_king=rs.black_king,
+                        white_positions=rs.white_positions,
+                        black_positions=rs.black_positions,
+                    )
+                rs = apply_fixed_armies(rs)  # Apply fixed white if set
+                population.append(rs)
+                if len(population) >= population_size:
+                    break
 
-    # Initialize population
-    population = []
+            if verbose and len(seed_rulesets) > 0:
+                print(f"  Loaded {len(population)} seed rulesets", flush=True)
 
-    if seed_rulesets:
-        # Use provided seed rulesets as initial population
-        for rs in seed_rulesets:
+            # Fill remaining with mutations of seeds or random
+            while len(population) < population_size:
+                if seed_rulesets:
+                    parent = rng.choice(seed_rulesets)
+                    child = mutate_ruleset(parent, rng, forced_template, mutate_black_only, mutate_white_only)
+                    population.append(apply_fixed_armies(child))
+                else:
+                    rs = create_random_ruleset(rng, forced_template)
+                    population.append(apply_fixed_armies(rs))
+        else:
+            # Default: bootstrap + random
+            bootstrap_rs = create_bootstrap_ruleset(rng)
             if forced_template:
-                rs = RuleSet(
-                    white_pieces=rs.white_pieces,
-                    black_pieces=rs.black_pieces,
+                bootstrap_rs = RuleSet(
+                    white_pieces=bootstrap_rs.white_pieces,
+                    black_pieces=bootstrap_rs.black_pieces,
                     white_template=forced_template,
                     black_template=forced_template,
-                    white_king=rs.white_king,
-                    black_king=rs.black_king,
-                    white_positions=rs.white_positions,
-                    black_positions=rs.black_positions,
+                    white_king=bootstrap_rs.white_king,
+                    black_king=bootstrap_rs.black_king,
+                    white_positions=bootstrap_rs.white_positions,
+                    black_positions=bootstrap_rs.black_positions,
                 )
-            rs = apply_fixed_armies(rs)  # Apply fixed white if set
-            population.append(rs)
-            if len(population) >= population_size:
-                break
-
-        if verbose and len(seed_rulesets) > 0:
-            print(f"  Loaded {len(population)} seed rulesets", flush=True)
-
-        # Fill remaining with mutations of seeds or random
-        while len(population) < population_size:
-            if seed_rulesets:
-                parent = rng.choice(seed_rulesets)
-                child = mutate_ruleset(parent, rng, forced_template, mutate_black_only, mutate_white_only)
-                population.append(apply_fixed_armies(child))
-            else:
+            bootstrap_rs = apply_fixed_armies(bootstrap_rs)
+            population.append(bootstrap_rs)
+            for _ in range(population_size - 1):
                 rs = create_random_ruleset(rng, forced_template)
                 population.append(apply_fixed_armies(rs))
-    else:
-        # Default: bootstrap + random
-        bootstrap_rs = create_bootstrap_ruleset(rng)
-        if forced_template:
-            bootstrap_rs = RuleSet(
-                white_pieces=bootstrap_rs.white_pieces,
-                black_pieces=bootstrap_rs.black_pieces,
-                white_template=forced_template,
-                black_template=forced_template,
-                white_king=bootstrap_rs.white_king,
-                black_king=bootstrap_rs.black_king,
-                white_positions=bootstrap_rs.white_positions,
-                black_positions=bootstrap_rs.black_positions,
-            )
-        bootstrap_rs = apply_fixed_armies(bootstrap_rs)
-        population.append(bootstrap_rs)
-        for _ in range(population_size - 1):
-            rs = create_random_ruleset(rng, forced_template)
-            population.append(apply_fixed_armies(rs))
-
-    best_ever = None
-    best_ever_fitness = float('-inf')
-    generation_stats = []
-
-    # Track which configs have been saved as champions (to avoid duplicates)
-    saved_champions: set[str] = set()
-
-    # Create champions directory if log_dir provided
-    champions_dir = None
-    if log_dir:
-        champions_dir = Path(log_dir) / 'champions'
-        champions_dir.mkdir(parents=True, exist_ok=True)
-
-    for gen in range(generations):
-        if verbose:
-            print(f"\nGeneration {gen + 1}/{generations}", flush=True)
-
-        # Evaluate fitness
-        # Skip evaluation for configs that are already proven (n >= min_evals)
-        # This saves compute by not re-evaluating converged configs
-        eval_args = []
-        eval_indices = []  # Track which population indices need evaluation
-        cached_results = {}  # idx -> cached result for proven configs
-
-        for i, rs in enumerate(population):
-            stats = tracker.get_stats(rs)
-            # When no_cache=True, always re-evaluate (skip caching)
-            if not no_cache and stats['n_evals'] >= min_evals_for_winner:
-                # Already proven - use cached stats, don't re-evaluate
-                # Try to use the stored last result with full data
-                last_result = tracker.get_last_result(rs)
-                if last_result is not None:
-                    cached_results[i] = {**last_result, 'cached': True}
-                else:
-                    # Fallback if no stored result (shouldn't happen normally)
-                    cached_results[i] = {
-                        'fitness': stats['mean'],
-                        'white_wins': 0,
-                        'black_wins': 0,
-                        'draws': 0,
-                        'total_games': 0,
-                        'avg_rounds': 0,
-                        'color_fairness': 0,
-                        'skill_gradient': 0,
-                        'game_richness': 0,
-                        'cached': True,
-                    }
-                if verbose:
-                    name = ruleset_name(rs)
-                    ucb = tracker.get_ucb_score(rs)
-                    print(f"    Ruleset {i+1} [{name}] CACHED UCB={ucb:.3f} (n={stats['n_evals']})", flush=True)
-            else:
-                eval_seed = rng.randint(0, 2**31)
-                ruleset_id = f"G{gen+1}R{i+1}"
-                eval_args.append((rs, heuristics, games_per_eval, depth, max_moves_per_action, eval_seed, n_workers, ruleset_id, use_template_aware))
-                eval_indices.append(i)
-
-        fitness_results = [None] * len(population)
-
-        # Fill in cached results first
-        for idx, result in cached_results.items():
-            fitness_results[idx] = result
-
-        # ======================================================================
-        # WORKER UTILIZATION: Generate exploratory rulesets to fill idle workers
-        # ======================================================================
-        # When configs are cached, we have fewer evaluations than workers.
-        # Generate novel exploratory mutants to keep all workers busy.
-        exploratory_rulesets = []  # List of (rs, eval_args_tuple)
-        exploratory_results = []   # Will be filled after evaluation
-
-        n_evals_needed = len(eval_args)
-        idle_workers = max(0, n_workers - n_evals_needed) if n_workers > 1 else 0
-
-        if idle_workers > 0 and len(cached_results) > 0:
-            # Get proven signatures to avoid generating duplicates
-            proven_sigs = set()
-            for rs in population:
-                stats = tracker.get_stats(rs)
-                if stats['n_evals'] >= min_evals_for_winner:
-                    proven_sigs.add(ruleset_signature(rs))
 
-            # Also avoid signatures already in eval queue
-            pending_sigs = set(ruleset_signature(population[i]) for i in eval_indices)
+        best_ever = None
+        best_ever_fitness = float('-inf')
+        generation_stats = []
 
-            # Generate exploratory mutants from elites
-            # Use current population's best (by cached UCB or prior knowledge)
-            elite_candidates = []
-            for i, rs in enumerate(population):
-                ucb = tracker.get_ucb_score(rs)
-                elite_candidates.append((rs, ucb))
-            elite_candidates.sort(key=lambda x: x[1], reverse=True)
-
-            exploratory_count = 0
-            max_attempts = idle_workers * 5  # Safety limit
-            attempts = 0
-
-            while exploratory_count < idle_workers and attempts < max_attempts:
-                attempts += 1
-                # Pick a parent from top candidates
-                parent = elite_candidates[exploratory_count % len(elite_candidates)][0]
-
-                # Generate a novel mutant
-                if smart_mutate:
-                    # Use balanced 0.5 for exploratory since we don't have win rate info
-                    child = smart_mutate_ruleset(parent, 0.5, rng, forced_template, mutate_black_only, mutate_white_only)
-                else:
-                    child = mutate_ruleset(parent, rng, forced_template, mutate_black_only, mutate_white_only)
-                child = apply_fixed_armies(child)  # Ensure white stays fixed
+        # Track which configs have been saved as champions (to avoid duplicates)
+        saved_champions: set[str] = set()
 
-                child_sig = ruleset_signature(child)
+        # Create champions directory if log_dir provided
+        champions_dir = None
+        if log_dir:
+            champions_dir = Path(log_dir) / 'champions'
+            champions_dir.mkdir(parents=True, exist_ok=True)
+
+        for gen in range(generations):
+            if verbose:
+                print(f"\nGeneration {gen + 1}/{generations}", flush=True)
 
-                # Only use if novel (not proven, not already pending)
-                if child_sig not in proven_sigs and child_sig not in pending_sigs:
+            # Evaluate fitness
+            # Skip evaluation for configs that are already proven (n >= min_evals)
+            # This saves compute by not re-evaluating converged configs
+            eval_args = []
+            eval_indices = []  # Track which population indices need evaluation
+            cached_results = {}  # idx -> cached result for proven configs
+
+            for i, rs in enumerate(population):
+                stats = tracker.get_stats(rs)
+                # When no_cache=True, always re-evaluate (skip caching)
+                if not no_cache and stats['n_evals'] >= min_evals_for_winner:
+                    # Already proven - use cached stats, don't re-evaluate
+                    # Try to use the stored last result with full data
+                    last_result = tracker.get_last_result(rs)
+                    if last_result is not None:
+                        cached_results[i] = {**last_result, 'cached': True}
+                    else:
+                        # Fallback if no stored result (shouldn't happen normally)
+                        cached_results[i] = {
+                            'fitness': stats['mean'],
+                            'white_wins': 0,
+                            'black_wins': 0,
+                            'draws': 0,
+                            'total_games': 0,
+                            'avg_rounds': 0,
+                            'color_fairness': 0,
+                            'skill_gradient': 0,
+                            'game_richness': 0,
+                            'cached': True,
+                        }
+                    if verbose:
+                        name = ruleset_name(rs)
+                        ucb = tracker.get_ucb_score(rs)
+                        print(f"    Ruleset {i+1} [{name}] CACHED UCB={ucb:.3f} (n={stats['n_evals']})", flush=True)
+                else:
                     eval_seed = rng.randint(0, 2**31)
-                    ruleset_id = f"G{gen+1}X{exploratory_count+1}"  # X = exploratory
-                    args = (child, heuristics, games_per_eval, depth, max_moves_per_action,
-                            eval_seed, n_workers, ruleset_id, use_template_aware)
-                    exploratory_rulesets.append((child, args))
-                    pending_sigs.add(child_sig)
-                    exploratory_count += 1
-
-            if verbose and exploratory_count > 0:
-                print(f"  Generated {exploratory_count} exploratory rulesets to fill idle workers", flush=True)
-
-        if eval_args or exploratory_rulesets:
-            if n_workers > 1:
-                # Parallel evaluation - include both regular and exploratory rulesets
-                total_evals = len(eval_args) + len(exploratory_rulesets)
-                if verbose:
-                    print(f"  Evaluating {total_evals} rulesets in parallel ({len(cached_results)} cached, {len(exploratory_rulesets)} exploratory)...", flush=True)
+                    ruleset_id = f"G{gen+1}R{i+1}"
+                    eval_args.append((rs, heuristics, games_per_eval, depth, max_moves_per_action, eval_seed, n_workers, ruleset_id, use_template_aware))
+                    eval_indices.append(i)
+
+            fitness_results = [None] * len(population)
+
+            # Fill in cached results first
+            for idx, result in cached_results.items():
+                fitness_results[idx] = result
+
+            # ======================================================================
+            # WORKER UTILIZATION: Generate exploratory rulesets to fill idle workers
+            # ======================================================================
+            # When configs are cached, we have fewer evaluations than workers.
+            # Generate novel exploratory mutants to keep all workers busy.
+            exploratory_rulesets = []  # List of (rs, eval_args_tuple)
+            exploratory_results = []   # Will be filled after evaluation
+
+            n_evals_needed = len(eval_args)
+            idle_workers = max(0, n_workers - n_evals_needed) if n_workers > 1 else 0
+
+            if idle_workers > 0 and len(cached_results) > 0:
+                # Get proven signatures to avoid generating duplicates
+                proven_sigs = set()
+                for rs in population:
+                    stats = tracker.get_stats(rs)
+                    if stats['n_evals'] >= min_evals_for_winner:
+                        proven_sigs.add(ruleset_signature(rs))
 
-                with ProcessPoolExecutor(max_workers=n_workers) as executor:
-                    # Submit regular population evals
-                    futures = {}
-                    for j, args in enumerate(eval_args):
-                        future = executor.submit(_eval_ruleset_worker, args)
-                        futures[future] = ('pop', eval_indices[j])
+                # Also avoid signatures already in eval queue
+                pending_sigs = set(ruleset_signature(population[i]) for i in eval_indices)
 
-                    # Submit exploratory evals
-                    for j, (exp_rs, exp_args) in enumerate(exploratory_rulesets):
-                        future = executor.submit(_eval_ruleset_worker, exp_args)
-                        futures[future] = ('exp', j)
+                # Generate exploratory mutants from elites
+                # Use current population's best (by cached UCB or prior knowledge)
+                elite_candidates = []
+                for i, rs in enumerate(population):
+                    ucb = tracker.get_ucb_score(rs)
+                    elite_candidates.append((rs, ucb))
+                elite_candidates.sort(key=lambda x: x[1], reverse=True)
+
+                exploratory_count = 0
+                max_attempts = idle_workers * 5  # Safety limit
+                attempts = 0
+
+                while exploratory_count < idle_workers and attempts < max_attempts:
+                    attempts += 1
+                    # Pick a parent from top candidates
+                    parent = elite_candidates[exploratory_count % len(elite_candidates)][0]
+
+                    # Generate a novel mutant
+                    if smart_mutate:
+                        # Use balanced 0.5 for exploratory since we don't have win rate info
+                        child = smart_mutate_ruleset(parent, 0.5, rng, forced_template, mutate_black_only, mutate_white_only)
+                    else:
+                        child = mutate_ruleset(parent, rng, forced_template, mutate_black_only, mutate_white_only)
+                    child = apply_fixed_armies(child)  # Ensure white stays fixed
+
+                    child_sig = ruleset_signature(child)
+
+                    # Only use if novel (not proven, not already pending)
+                    if child_sig not in proven_sigs and child_sig not in pending_sigs:
+                        eval_seed = rng.randint(0, 2**31)
+                        ruleset_id = f"G{gen+1}X{exploratory_count+1}"  # X = exploratory
+                        args = (child, heuristics, games_per_eval, depth, max_moves_per_action,
+                                eval_seed, n_workers, ruleset_id, use_template_aware)
+                        exploratory_rulesets.append((child, args))
+                        pending_sigs.add(child_sig)
+                        exploratory_count += 1
+
+                if verbose and exploratory_count > 0:
+                    print(f"  Generated {exploratory_count} exploratory rulesets to fill idle workers", flush=True)
+
+            if eval_args or exploratory_rulesets:
+                if n_workers > 1:
+                    # Parallel evaluation - include both regular and exploratory rulesets
+                    total_evals = len(eval_args) + len(exploratory_rulesets)
+                    if verbose:
+                        print(f"  Evaluating {total_evals} rulesets in parallel ({len(cached_results)} cached, {len(exploratory_rulesets)} exploratory)...", flush=True)
 
-                    for future in as_completed(futures):
-                        eval_type, idx = futures[future]
-                        result = future.result()
+                    # Regular population evals, then exploratory evals, all dispatched at once
+                    tasks = [(('pop', idx), args) for idx, args in zip(eval_indices, eval_args)]
+                    tasks += [(('exp', j), exp_args) for j, (exp_rs, exp_args) in enumerate(exploratory_rulesets)]
 
+                    for (eval_type, idx), result in _evaluate_parallel(executor, tasks):
                         if eval_type == 'pop':
                             # Regular population member
                             fitness_results[idx] = result
@@ -1919,335 +1913,329 @@ def evolve_rulesets(
                                 ucb = tracker.get_ucb_score(exp_rs)
                                 print(f"    Exploratory X{idx+1} [{name}] "
                                       f"fitness={result['fitness']:.3f} UCB={ucb:.3f} (n={stats['n_evals']})", flush=True)
-            else:
-                # Sequential - regular population
-                for j, args in enumerate(eval_args):
-                    idx = eval_indices[j]
-                    rs = population[idx]
-                    name = ruleset_name(rs)
-                    if verbose:
-                        print(f"  Evaluating ruleset {idx+1}/{len(population)} [{name}]...", flush=True)
-                    result = _eval_ruleset_worker(args)
-                    fitness_results[idx] = result
-                    tracker.record(rs, result['fitness'], result)
-                    if verbose:
+                else:
+                    # Sequential - regular population
+                    for j, args in enumerate(eval_args):
+                        idx = eval_indices[j]
+                        rs = population[idx]
+                        name = ruleset_name(rs)
+                        if verbose:
+                            print(f"  Evaluating ruleset {idx+1}/{len(population)} [{name}]...", flush=True)
+                        result = _eval_ruleset_worker(args)
+                        fitness_results[idx] = result
+                        tracker.record(rs, result['fitness'], result)
+                        if verbose:
+                            stats = tracker.get_stats(rs)
+                            ucb = tracker.get_ucb_score(rs)
+                            print(f"    Done: fitness={result['fitness']:.3f} UCB={ucb:.3f} (n={stats['n_evals']})", flush=True)
+
+                    # Sequential - exploratory (shouldn't happen with n_workers=1, but be safe)
+                    for j, (exp_rs, exp_args) in enumerate(exploratory_rulesets):
+                        if verbose:
+                            name = ruleset_name(exp_rs)
+                            print(f"  Evaluating exploratory X{j+1} [{name}]...", flush=True)
+                        result = _eval_ruleset_worker(exp_args)
+                        exploratory_results.append((exp_rs, result))
+                        tracker.record(exp_rs, result['fitness'], result)
+                        if verbose:
+                            stats = tracker.get_stats(exp_rs)
+                            ucb = tracker.get_ucb_score(exp_rs)
+                            print(f"    Done: fitness={result['fitness']:.3f} UCB={ucb:.3f} (n={stats['n_evals']})", flush=True)
+            elif verbose:
+                print(f"  All {len(cached_results)} rulesets cached, no new evaluations needed", flush=True)
+
+            # Sort by UCB score (not raw fitness) for selection
+            scored_pop = []
+            for rs, result in zip(population, fitness_results):
+                ucb_score = tracker.get_ucb_score(rs)
+                scored_pop.append((rs, result, ucb_score))
+
+            # Include exploratory results in selection pool
+            # This allows promising exploratory configs to become elites
+            for exp_rs, exp_result in exploratory_results:
+                ucb_score = tracker.get_ucb_score(exp_rs)
+                scored_pop.append((exp_rs, exp_result, ucb_score))
+
+            scored_pop.sort(key=lambda x: x[2], reverse=True)  # Sort by UCB score
+
+            best_rs, best_result, best_ucb = scored_pop[0]
+            if best_result['fitness'] > best_ever_fitness:
+                best_ever = best_rs
+                best_ever_fitness = best_result['fitness']
+
+            gen_stat = {
+                'generation': gen + 1,
+                'best_fitness': best_result['fitness'],
+                'best_ucb': best_ucb,
+                'best_color_fairness': best_result['color_fairness'],
+                'best_skill_gradient': best_result.get('skill_gradient', 0.0),
+                'best_white_wins': best_result['white_wins'],
+                'best_black_wins': best_result['black_wins'],
+                'best_draws': best_result['draws'],
+                'total_games': best_result['total_games'],
+                'avg_rounds': best_result['avg_rounds'],
+            }
+            generation_stats.append(gen_stat)
+
+            if verbose:
+                # Show deduplicated elites (unique configs by signature)
+                seen_sigs = set()
+                unique_elites = []
+                for rs, result, ucb in scored_pop:
+                    sig = ruleset_signature(rs)
+                    if sig not in seen_sigs:
+                        seen_sigs.add(sig)
                         stats = tracker.get_stats(rs)
-                        ucb = tracker.get_ucb_score(rs)
-                        print(f"    Done: fitness={result['fitness']:.3f} UCB={ucb:.3f} (n={stats['n_evals']})", flush=True)
+                        unique_elites.append((rs, ucb, stats['n_evals']))
+                        if len(unique_elites) >= n_elites:
+                            break
 
-                # Sequential - exploratory (shouldn't happen with n_workers=1, but be safe)
-                for j, (exp_rs, exp_args) in enumerate(exploratory_rulesets):
-                    if verbose:
-                        name = ruleset_name(exp_rs)
-                        print(f"  Evaluating exploratory X{j+1} [{name}]...", flush=True)
-                    result = _eval_ruleset_worker(exp_args)
-                    exploratory_results.append((exp_rs, result))
-                    tracker.record(exp_rs, result['fitness'], result)
-                    if verbose:
-                        stats = tracker.get_stats(exp_rs)
-                        ucb = tracker.get_ucb_score(exp_rs)
-                        print(f"    Done: fitness={result['fitness']:.3f} UCB={ucb:.3f} (n={stats['n_evals']})", flush=True)
-        elif verbose:
-            print(f"  All {len(cached_results)} rulesets cached, no new evaluations needed", flush=True)
-
-        # Sort by UCB score (not raw fitness) for selection
-        scored_pop = []
-        for rs, result in zip(population, fitness_results):
-            ucb_score = tracker.get_ucb_score(rs)
-            scored_pop.append((rs, result, ucb_score))
-
-        # Include exploratory results in selection pool
-        # This allows promising exploratory configs to become elites
-        for exp_rs, exp_result in exploratory_results:
-            ucb_score = tracker.get_ucb_score(exp_rs)
-            scored_pop.append((exp_rs, exp_result, ucb_score))
-
-        scored_pop.sort(key=lambda x: x[2], reverse=True)  # Sort by UCB score
-
-        best_rs, best_result, best_ucb = scored_pop[0]
-        if best_result['fitness'] > best_ever_fitness:
-            best_ever = best_rs
-            best_ever_fitness = best_result['fitness']
-
-        gen_stat = {
-            'generation': gen + 1,
-            'best_fitness': best_result['fitness'],
-            'best_ucb': best_ucb,
-            'best_color_fairness': best_result['color_fairness'],
-            'best_skill_gradient': best_result.get('skill_gradient', 0.0),
-            'best_white_wins': best_result['white_wins'],
-            'best_black_wins': best_result['black_wins'],
-            'best_draws': best_result['draws'],
-            'total_games': best_result['total_games'],
-            'avg_rounds': best_result['avg_rounds'],
-        }
-        generation_stats.append(gen_stat)
+                # Format: [name] UCB=0.52 n=14 | [name2] UCB=0.35 n=3 | ...
+                elite_strs = []
+                for rs, ucb, n in unique_elites:
+                    name = ruleset_name(rs)
+                    elite_strs.append(f"[{name}] UCB={ucb:.2f} n={n}")
 
-        if verbose:
-            # Show deduplicated elites (unique configs by signature)
+                print(f"  Elites: {' | '.join(elite_strs)}", flush=True)
+
+            # Save new champions (configs that just reached min_evals)
+            if champions_dir:
+                for rs, result, ucb in scored_pop:
+                    sig = ruleset_signature(rs)
+                    stats = tracker.get_stats(rs)
+                    n_evals = stats['n_evals']
+
+                    # If this config just became a champion and hasn't been saved yet
+                    if n_evals >= min_evals_for_winner and sig not in saved_champions:
+                        saved_champions.add(sig)
+                        name = ruleset_name(rs)
+
+                        # Save the ruleset
+                        champion_data = {
+                            'name': name,
+                            'signature': sig,
+                            'generation_reached': gen + 1,
+                            'n_evals': n_evals,
+                            'ucb_score': ucb,
+                            'mean_fitness': stats['mean'],
+                            'min_fitness': stats['min'],
+                            'max_fitness': stats['max'],
+                            'ruleset': ruleset_to_genome(rs),
+                        }
+
+                        champion_file = champions_dir / f'{name}.json'
+                        with open(champion_file, 'w') as f:
+                            json.dump(champion_data, f, indent=2)
+
+                        if verbose:
+                            print(f"    Saved champion: {name} (UCB={ucb:.2f}, n={n_evals})", flush=True)
+
+            # Per-generation report callback
+            if report_callback:
+                report_callback(gen + 1, best_rs, best_result, heuristics)
+
+            # Selection and reproduction
+            # Adaptive allocation: uncertain elites get clones, proven elites get mutants
+
+            # Deduplicate elites by signature - we want N different configs, not N copies of the best
             seen_sigs = set()
             unique_elites = []
             for rs, result, ucb in scored_pop:
                 sig = ruleset_signature(rs)
                 if sig not in seen_sigs:
                     seen_sigs.add(sig)
-                    stats = tracker.get_stats(rs)
-                    unique_elites.append((rs, ucb, stats['n_evals']))
+                    unique_elites.append((rs, result, ucb))
                     if len(unique_elites) >= n_elites:
                         break
 
-            # Format: [name] UCB=0.52 n=14 | [name2] UCB=0.35 n=3 | ...
-            elite_strs = []
-            for rs, ucb, n in unique_elites:
-                name = ruleset_name(rs)
-                elite_strs.append(f"[{name}] UCB={ucb:.2f} n={n}")
+            # Track proven signatures to avoid filling population with them
+            proven_sigs = set()
+            for rs, _, _ in scored_pop:
+                stats = tracker.get_stats(rs)
+                if stats['n_evals'] >= min_evals_for_winner:
+                    proven_sigs.add(ruleset_signature(rs))
 
-            print(f"  Elites: {' | '.join(elite_strs)}", flush=True)
+            # Helper to generate a novel mutant (not proven)
+            def generate_novel_mutant(parent, white_win_rate, max_attempts=10):
+                for _ in range(max_attempts):
+                    if smart_mutate:
+                        child = smart_mutate_ruleset(parent, white_win_rate, rng, forced_template, mutate_black_only, mutate_white_only)
+                    else:
+                        child = mutate_ruleset(parent, rng, forced_template, mutate_black_only, mutate_white_only)
+                    child = apply_fixed_armies(child)  # Ensure white stays fixed
+                    if ruleset_signature(child) not in proven_sigs:
+                        return child
+                # Fallback: use regular mutation which is more aggressive
+                child = mutate_ruleset(parent, rng, forced_template, mutate_black_only, mutate_white_only)
+                return apply_fixed_armies(child)
 
-        # Save new champions (configs that just reached min_evals)
-        if champions_dir:
-            for rs, result, ucb in scored_pop:
-                sig = ruleset_signature(rs)
-                stats = tracker.get_stats(rs)
-                n_evals = stats['n_evals']
+            # Ensure we don't exceed population
+            effective_elites = min(len(unique_elites), population_size // 3)
 
-                # If this config just became a champion and hasn't been saved yet
-                if n_evals >= min_evals_for_winner and sig not in saved_champions:
-                    saved_champions.add(sig)
-                    name = ruleset_name(rs)
+            next_gen = []
+            next_gen_sigs = set()  # Track what's already in next_gen
 
-                    # Save the ruleset
-                    champion_data = {
-                        'name': name,
-                        'signature': sig,
-                        'generation_reached': gen + 1,
-                        'n_evals': n_evals,
-                        'ucb_score': ucb,
-                        'mean_fitness': stats['mean'],
-                        'min_fitness': stats['min'],
-                        'max_fitness': stats['max'],
-                        'ruleset': ruleset_to_genome(rs),
-                    }
-
-                    champion_file = champions_dir / f'{name}.json'
-                    with open(champion_file, 'w') as f:
-                        json.dump(champion_data, f, indent=2)
+            # Each elite gets adaptive allocation based on how proven it is
+            for i in range(effective_elites):
+                elite, elite_result, _ = unique_elites[i]  # (rs, result, ucb_score)
+                elite_stats = tracker.get_stats(elite)
+                n_evals = elite_stats['n_evals']
+                elite_sig = ruleset_signature(elite)
 
-                    if verbose:
-                        print(f"    Saved champion: {name} (UCB={ucb:.2f}, n={n_evals})", flush=True)
-
-        # Per-generation report callback
-        if report_callback:
-            report_callback(gen + 1, best_rs, best_result, heuristics)
-
-        # Selection and reproduction
-        # Adaptive allocation: uncertain elites get clones, proven elites get mutants
-
-        # Deduplicate elites by signature - we want N different configs, not N copies of the best
-        seen_sigs = set()
-        unique_elites = []
-        for rs, result, ucb in scored_pop:
-            sig = ruleset_signature(rs)
-            if sig not in seen_sigs:
-                seen_sigs.add(sig)
-                unique_elites.append((rs, result, ucb))
-                if len(unique_elites) >= n_elites:
-                    break
+                # Compute white win rate for smart mutation
+                elite_white_win_rate = 0.5  # Default to balanced
+                if elite_result['total_games'] > 0:
+                    elite_white_win_rate = elite_result['white_wins'] / elite_result['total_games']
 
-        # Track proven signatures to avoid filling population with them
-        proven_sigs = set()
-        for rs, _, _ in scored_pop:
-            stats = tracker.get_stats(rs)
-            if stats['n_evals'] >= min_evals_for_winner:
-                proven_sigs.add(ruleset_signature(rs))
-
-        # Helper to generate a novel mutant (not proven)
-        def generate_novel_mutant(parent, white_win_rate, max_attempts=10):
-            for _ in range(max_attempts):
-                if smart_mutate:
-                    child = smart_mutate_ruleset(parent, white_win_rate, rng, forced_template, mutate_black_only, mutate_white_only)
-                else:
-                    child = mutate_ruleset(parent, rng, forced_template, mutate_black_only, mutate_white_only)
-                child = apply_fixed_armies(child)  # Ensure white stays fixed
-                if ruleset_signature(child) not in proven_sigs:
-                    return child
-            # Fallback: use regular mutation which is more aggressive
-            child = mutate_ruleset(parent, rng, forced_template, mutate_black_only, mutate_white_only)
-            return apply_fixed_armies(child)
-
-        # Ensure we don't exceed population
-        effective_elites = min(len(unique_elites), population_size // 3)
-
-        next_gen = []
-        next_gen_sigs = set()  # Track what's already in next_gen
-
-        # Each elite gets adaptive allocation based on how proven it is
-        for i in range(effective_elites):
-            elite, elite_result, _ = unique_elites[i]  # (rs, result, ucb_score)
-            elite_stats = tracker.get_stats(elite)
-            n_evals = elite_stats['n_evals']
-            elite_sig = ruleset_signature(elite)
-
-            # Compute white win rate for smart mutation
-            elite_white_win_rate = 0.5  # Default to balanced
-            if elite_result['total_games'] > 0:
-                elite_white_win_rate = elite_result['white_wins'] / elite_result['total_games']
-
-            # Add the elite itself (always 1) - but only if not already in next_gen
-            if elite_sig not in next_gen_sigs:
-                next_gen.append(elite)
-                next_gen_sigs.add(elite_sig)
-
-            # Adaptive allocation:
-            # - Uncertain (n < min_evals): clones to verify, few mutants
-            # - Proven (n >= min_evals): no clones (waste of compute), more mutants to explore
-            if n_evals < min_evals_for_winner:
-                # Uncertain elite: clone to verify
-                actual_clones = clones_per_elite
-                actual_mutants = mutants_per_elite
-            else:
-                # Proven elite: don't waste compute re-evaluating, explore instead
-                actual_clones = 0
-                actual_mutants = clones_per_elite + mutants_per_elite  # Redirect clone budget to mutants
-
-            # Add clones (unchanged copies for fitness verification)
-            # Only for unproven elites, and only if sig not already in next_gen
-            for _ in range(actual_clones):
-                if len(next_gen) >= population_size:
-                    break
+                # Add the elite itself (always 1) - but only if not already in next_gen
                 if elite_sig not in next_gen_sigs:
                     next_gen.append(elite)
                     next_gen_sigs.add(elite_sig)
 
-            # Add mutants (for exploration) - ensure they're novel
-            for _ in range(actual_mutants):
-                if len(next_gen) >= population_size:
-                    break
-                child = generate_novel_mutant(elite, elite_white_win_rate)
+                # Adaptive allocation:
+                # - Uncertain (n < min_evals): clones to verify, few mutants
+                # - Proven (n >= min_evals): no clones (waste of compute), more mutants to explore
+                if n_evals < min_evals_for_winner:
+                    # Uncertain elite: clone to verify
+                    actual_clones = clones_per_elite
+                    actual_mutants = mutants_per_elite
+                else:
+                    # Proven elite: don't waste compute re-evaluating, explore instead
+                    actual_clones = 0
+                    actual_mutants = clones_per_elite + mutants_per_elite  # Redirect clone budget to mutants
+
+                # Add clones (unchanged copies for fitness verification)
+                # Only for unproven elites, and only if sig not already in next_gen
+                for _ in range(actual_clones):
+                    if len(next_gen) >= population_size:
+                        break
+                    if elite_sig not in next_gen_sigs:
+                        next_gen.append(elite)
+                        next_gen_sigs.add(elite_sig)
+
+                # Add mutants (for exploration) - ensure they're novel
+                for _ in range(actual_mutants):
+                    if len(next_gen) >= population_size:
+                        break
+                    child = generate_novel_mutant(elite, elite_white_win_rate)
+                    child_sig = ruleset_signature(child)
+                    # Avoid duplicates in next_gen too
+                    if child_sig not in next_gen_sigs:
+                        next_gen.append(child)
+                        next_gen_sigs.add(child_sig)
+
+            # Fill remaining slots with tournament selection + crossover
+            # Ensure we generate novel configs (not proven, not duplicates)
+            crossover_attempts = 0
+            max_crossover_attempts = population_size * 10  # Safety limit
+
+            while len(next_gen) < population_size and crossover_attempts < max_crossover_attempts:
+                crossover_attempts += 1
+
+                # Tournament selection - use UCB score (index 2) for selection
+                tournament = rng.sample(scored_pop, min(3, len(scored_pop)))
+                parent1_entry = max(tournament, key=lambda x: x[2])  # x[2] = ucb_score
+                tournament = rng.sample(scored_pop, min(3, len(scored_pop)))
+                parent2_entry = max(tournament, key=lambda x: x[2])
+
+                parent1, parent1_result, _ = parent1_entry
+                parent2, parent2_result, _ = parent2_entry
+
+                # Crossover
+                child = crossover_ruleset(parent1, parent2, rng)
+
+                # Force template if required
+                if forced_template and (child.white_template != forced_template or child.black_template != forced_template):
+                    child = RuleSet(
+                        white_pieces=child.white_pieces,
+                        black_pieces=child.black_pieces,
+                        white_template=forced_template,
+                        black_template=forced_template,
+                        white_king=child.white_king,
+                        black_king=child.black_king,
+                        white_positions=child.white_positions,
+                        black_positions=child.black_positions,
+                    )
+
+                # Apply fixed white after crossover
+                child = apply_fixed_armies(child)
+
+                # Always mutate crossover children to ensure novelty
+                p1_win_rate = parent1_result['white_wins'] / parent1_result['total_games'] if parent1_result['total_games'] > 0 else 0.5
+                p2_win_rate = parent2_result['white_wins'] / parent2_result['total_games'] if parent2_result['total_games'] > 0 else 0.5
+                avg_win_rate = (p1_win_rate + p2_win_rate) / 2
+                child = generate_novel_mutant(child, avg_win_rate)
+
+                child_sig = ruleset_signature(child)
+
+                # Only add if novel (not proven and not already in next_gen)
+                if child_sig not in proven_sigs and child_sig not in next_gen_sigs:
+                    next_gen.append(child)
+                    next_gen_sigs.add(child_sig)
+
+            # If we still need more (rare), fill with random mutations
+            while len(next_gen) < population_size:
+                parent = rng.choice(list(unique_elites))[0]
+                child = mutate_ruleset(parent, rng, forced_template, mutate_black_only, mutate_white_only)
+                child = mutate_ruleset(child, rng, forced_template, mutate_black_only, mutate_white_only)  # Double mutate for more diversity
+                child = apply_fixed_armies(child)
                 child_sig = ruleset_signature(child)
-                # Avoid duplicates in next_gen too
                 if child_sig not in next_gen_sigs:
                     next_gen.append(child)
                     next_gen_sigs.add(child_sig)
 
-        # Fill remaining slots with tournament selection + crossover
-        # Ensure we generate novel configs (not proven, not duplicates)
-        crossover_attempts = 0
-        max_crossover_attempts = population_size * 10  # Safety limit
+            population = next_gen
 
-        while len(next_gen) < population_size and crossover_attempts < max_crossover_attempts:
-            crossover_attempts += 1
+        # ==========================================================================
+        # FINAL VERIFICATION PHASE
+        # Ensure the winner has enough evaluations to be trusted
+        # ==========================================================================
 
-            # Tournament selection - use UCB score (index 2) for selection
-            tournament = rng.sample(scored_pop, min(3, len(scored_pop)))
-            parent1_entry = max(tournament, key=lambda x: x[2])  # x[2] = ucb_score
-            tournament = rng.sample(scored_pop, min(3, len(scored_pop)))
-            parent2_entry = max(tournament, key=lambda x: x[2])
+        if verbose:
+            print(f"\n{'='*60}", flush=True)
+            print("FINAL VERIFICATION PHASE", flush=True)
+            print(f"{'='*60}", flush=True)
 
-            parent1, parent1_result, _ = parent1_entry
-            parent2, parent2_result, _ = parent2_entry
+        # Find the best config with enough evaluations
+        best_confident = tracker.get_best_confident()
 
-            # Crossover
-            child = crossover_ruleset(parent1, parent2, rng)
+        if best_confident is None:
+            # No config has enough evaluations yet - need to run more
+            if verbose:
+                print(f"  No config has {min_evals_for_winner}+ evaluations yet.", flush=True)
+                print(f"  Running additional evaluations on top candidates...", flush=True)
 
-            # Force template if required
-            if forced_template and (child.white_template != forced_template or child.black_template != forced_template):
-                child = RuleSet(
-                    white_pieces=child.white_pieces,
-                    black_pieces=child.black_pieces,
-                    white_template=forced_template,
-                    black_template=forced_template,
-                    white_king=child.white_king,
-                    black_king=child.black_king,
-                    white_positions=child.white_positions,
-                    black_positions=child.black_positions,
-                )
+            # Get top candidates by UCB from last generation
+            candidates = []
+            for rs, result, ucb in scored_pop[:min(5, len(scored_pop))]:
+                stats = tracker.get_stats(rs)
+                evals_needed = min_evals_for_winner - stats['n_evals']
+                if evals_needed > 0:
+                    candidates.append((rs, evals_needed))
+
+            # Run additional evaluations in parallel
+            # Collect all eval tasks
+            verify_tasks = []  # List of (rs, name, eval_num, args_tuple)
+            for rs, evals_needed in candidates:
+                name = ruleset_name(rs)
+                if verbose:
+                    print(f"  Evaluating [{name}] {evals_needed} more times...", flush=True)
+                for eval_num in range(evals_needed):
+                    eval_seed = rng.randint(0, 2**31)
+                    args = (rs, heuristics, games_per_eval, depth, max_moves_per_action,
+                            eval_seed, n_workers, f"VERIFY_{name}_{eval_num+1}", use_template_aware)
+                    verify_tasks.append((rs, name, eval_num, evals_needed, args))
 
-            # Apply fixed white after crossover
-            child = apply_fixed_armies(child)
-
-            # Always mutate crossover children to ensure novelty
-            p1_win_rate = parent1_result['white_wins'] / parent1_result['total_games'] if parent1_result['total_games'] > 0 else 0.5
-            p2_win_rate = parent2_result['white_wins'] / parent2_result['total_games'] if parent2_result['total_games'] > 0 else 0.5
-            avg_win_rate = (p1_win_rate + p2_win_rate) / 2
-            child = generate_novel_mutant(child, avg_win_rate)
-
-            child_sig = ruleset_signature(child)
-
-            # Only add if novel (not proven and not already in next_gen)
-            if child_sig not in proven_sigs and child_sig not in next_gen_sigs:
-                next_gen.append(child)
-                next_gen_sigs.add(child_sig)
-
-        # If we still need more (rare), fill with random mutations
-        while len(next_gen) < population_size:
-            parent = rng.choice(list(unique_elites))[0]
-            child = mutate_ruleset(parent, rng, forced_template, mutate_black_only, mutate_white_only)
-            child = mutate_ruleset(child, rng, forced_template, mutate_black_only, mutate_white_only)  # Double mutate for more diversity
-            child = apply_fixed_armies(child)
-            child_sig = ruleset_signature(child)
-            if child_sig not in next_gen_sigs:
-                next_gen.append(child)
-                next_gen_sigs.add(child_sig)
-
-        population = next_gen
-
-    # ==========================================================================
-    # FINAL VERIFICATION PHASE
-    # Ensure the winner has enough evaluations to be trusted
-    # ==========================================================================
-
-    if verbose:
-        print(f"\n{'='*60}", flush=True)
-        print("FINAL VERIFICATION PHASE", flush=True)
-        print(f"{'='*60}", flush=True)
-
-    # Find the best config with enough evaluations
-    best_confident = tracker.get_best_confident()
-
-    if best_confident is None:
-        # No config has enough evaluations yet - need to run more
-        if verbose:
-            print(f"  No config has {min_evals_for_winner}+ evaluations yet.", flush=True)
-            print(f"  Running additional evaluations on top candidates...", flush=True)
-
-        # Get top candidates by UCB from last generation
-        candidates = []
-        for rs, result, ucb in scored_pop[:min(5, len(scored_pop))]:
-            stats = tracker.get_stats(rs)
-            evals_needed = min_evals_for_winner - stats['n_evals']
-            if evals_needed > 0:
-                candidates.append((rs, evals_needed))
-
-        # Run additional evaluations in parallel
-        # Collect all eval tasks
-        verify_tasks = []  # List of (rs, name, eval_num, args_tuple)
-        for rs, evals_needed in candidates:
-            name = ruleset_name(rs)
-            if verbose:
-                print(f"  Evaluating [{name}] {evals_needed} more times...", flush=True)
-            for eval_num in range(evals_needed):
-                eval_seed = rng.randint(0, 2**31)
-                args = (rs, heuristics, games_per_eval, depth, max_moves_per_action,
-                        eval_seed, n_workers, f"VERIFY_{name}_{eval_num+1}", use_template_aware)
-                verify_tasks.append((rs, name, eval_num, evals_needed, args))
-
-        if verify_tasks:
-            total_verify = len(verify_tasks)
-            if verbose:
-                print(f"  Running {total_verify} verification evaluations in parallel...", flush=True)
+            if verify_tasks:
+                total_verify = len(verify_tasks)
+                if verbose:
+                    print(f"  Running {total_verify} verification evaluations in parallel...", flush=True)
 
-            if n_workers > 1:
-                with ProcessPoolExecutor(max_workers=n_workers) as executor:
-                    futures = {}
-                    for task_idx, (rs, name, eval_num, evals_needed, args) in enumerate(verify_tasks):
-                        future = executor.submit(_eval_ruleset_worker, args)
-                        futures[future] = (rs, name, eval_num, evals_needed)
+                if n_workers > 1:
+                    tasks = [(task[:4], task[4]) for task in verify_tasks]
 
                     completed = 0
-                    for future in as_completed(futures):
-                        rs, name, eval_num, evals_needed = futures[future]
-                        result = future.result()
+                    for (rs, name, eval_num, evals_needed), result in _evaluate_parallel(executor, tasks):
                         tracker.record(rs, result['fitness'], result)
                         completed += 1
                         if verbose:
@@ -2255,69 +2243,131 @@ def evolve_rulesets(
                             ucb = tracker.get_ucb_score(rs)
                             print(f"    [{name}] eval {eval_num+1}/{evals_needed}: fitness={result['fitness']:.3f} "
                                   f"UCB={ucb:.3f} (n={stats['n_evals']}) [{completed}/{total_verify}]", flush=True)
-            else:
-                # Sequential fallback
-                for task_idx, (rs, name, eval_num, evals_needed, args) in enumerate(verify_tasks):
-                    result = _eval_ruleset_worker(args)
-                    tracker.record(rs, result['fitness'], result)
-                    if verbose:
-                        stats = tracker.get_stats(rs)
-                        ucb = tracker.get_ucb_score(rs)
-                        print(f"    [{name}] eval {eval_num+1}/{evals_needed}: fitness={result['fitness']:.3f} "
-                              f"UCB={ucb:.3f} (n={stats['n_evals']})", flush=True)
+                else:
+                    # Sequential fallback
+                    for task_idx, (rs, name, eval_num, evals_needed, args) in enumerate(verify_tasks):
+                        result = _eval_ruleset_worker(args)
+                        tracker.record(rs, result['fitness'], result)
+                        if verbose:
+                            stats = tracker.get_stats(rs)
+                            ucb = tracker.get_ucb_score(rs)
+                            print(f"    [{name}] eval {eval_num+1}/{evals_needed}: fitness={result['fitness']:.3f} "
+                                  f"UCB={ucb:.3f} (n={stats['n_evals']})", flush=True)
 
-        # Now find the best confident config
-        best_confident = tracker.get_best_confident()
+            # Now find the best confident config
+            best_confident = tracker.get_best_confident()
+
+        if best_confident is not None:
+            best_sig, best_ucb = best_confident
+            # Find the ruleset object that matches this signature
+            # First look in the last generation's population
+            winner = None
+            for rs in population:
+                if ruleset_signature(rs) == best_sig:
+                    winner = rs
+                    break
+
+            # If not found in population, recover from tracker's stored rulesets
+            if winner is None:
+                winner = tracker.rulesets.get(best_sig)
+                if winner is not None and verbose:
+                    print(f"  Note: Recovered best config from tracker (was dropped from population)", flush=True)
+
+            # Final fallback to best_ever (shouldn't happen now)
+            if winner is None:
+                winner = best_ever
+                if verbose:
+                    print(f"  Warning: best confident config not found anywhere, using best_ever", flush=True)
 
-    if best_confident is not None:
-        best_sig, best_ucb = best_confident
-        # Find the ruleset object that matches this signature
-        # First look in the last generation's population
-        winner = None
-        for rs in population:
-            if ruleset_signature(rs) == best_sig:
-                winner = rs
-                break
-
-        # If not found in population, recover from tracker's stored rulesets
-        if winner is None:
-            winner = tracker.rulesets.get(best_sig)
-            if winner is not None and verbose:
-                print(f"  Note: Recovered best config from tracker (was dropped from population)", flush=True)
-
-        # Final fallback to best_ever (shouldn't happen now)
-        if winner is None:
-            winner = best_ever
+            winner_stats = tracker.get_stats(winner)
             if verbose:
-                print(f"  Warning: best confident config not found anywhere, using best_ever", flush=True)
+                winner_name = ruleset_name(winner)
+                print(f"\n  VERIFIED WINNER: [{winner_name}]", flush=True)
+                print(f"    UCB Score: {best_ucb:.3f}", flush=True)
+                print(f"    Evaluations: {winner_stats['n_evals']}", flush=True)
+                print(f"    Mean fitness: {winner_stats['mean']:.3f}", flush=True)
+                print(f"    Min/Max: {winner_stats['min']:.3f} / {winner_stats['max']:.3f}", flush=True)
+
+            best_ever = winner
+            best_ever_fitness = winner_stats['mean']
+        else:
+            if verbose:
+                print(f"  Warning: Could not verify winner with {min_evals_for_winner}+ evals", flush=True)
+
+        # Include tracker stats in output
+        return best_ever, {
+            'generations': generation_stats,
+            'best_fitness': best_ever_fitness,
+            'fitness_history': dict(tracker.history),  # All recorded fitness values
+            'ucb_c': ucb_c,
+            'min_evals_for_winner': min_evals_for_winner,
+        }
+    finally:
+        if game_log_file:
+            game_log_file.close()
+        if owns_executor:
+            executor.shutdown(cancel_futures=True)
 
-        winner_stats = tracker.get_stats(winner)
-        if verbose:
-            winner_name = ruleset_name(winner)
-            print(f"\n  VERIFIED WINNER: [{winner_name}]", flush=True)
-            print(f"    UCB Score: {best_ucb:.3f}", flush=True)
-            print(f"    Evaluations: {winner_stats['n_evals']}", flush=True)
-            print(f"    Mean fitness: {winner_stats['mean']:.3f}", flush=True)
-            print(f"    Min/Max: {winner_stats['min']:.3f} / {winner_stats['max']:.3f}", flush=True)
-
-        best_ever = winner
-        best_ever_fitness = winner_stats['mean']
-    else:
-        if verbose:
-            print(f"  Warning: Could not verify winner with {min_evals_for_winner}+ evals", flush=True)
-
-    # Close log file if open
-    if game_log_file:
-        game_log_file.close()
-
-    # Include tracker stats in output
-    return best_ever, {
-        'generations': generation_stats,
-        'best_fitness': best_ever_fitness,
-        'fitness_history': dict(tracker.history),  # All recorded fitness values
-        'ucb_c': ucb_c,
-        'min_evals_for_winner': min_evals_for_winner,
-    }
+
+def _ruleset_matchup_tasks(args) -> tuple[list, list]:
+    """Split one _eval_ruleset_worker task into its tournament matchups.
+
+    Returns (matchup_spec, matchup_args): each matchup_args entry is a
+    _eval_matchup_worker task playing the same games (same seeds) that
+    evaluate_ruleset_fitness would play for that matchup.
+    """
+    rs, heuristics, n_games, depth, max_moves, seed, n_workers, ruleset_id, use_template_aware = args
+    if use_template_aware:
+        heuristics = create_template_aware_heuristics(rs.white_template, rs.black_template)
+    rs_dict = ruleset_to_genome(rs)
+
+    matchup_spec = tournament_matchup_spec(depth, reduced=True, games_per_matchup=n_games)
+    matchup_args = []
+    seed_offset = 0
+    for d1, d2, games, weight in matchup_spec:
+        matchup_args.append((rs_dict, heuristics, d1, d2, games, seed + seed_offset, max_moves, ruleset_id))
+        seed_offset += games
+    return matchup_spec, matchup_args
+
+
+def _eval_matchup_worker(args) -> MatchupStats:
+    """Worker function: play one tournament matchup for a ruleset."""
+    rs_dict, heuristics, d1, d2, n_games, base_seed, max_moves, ruleset_id = args
+    return run_matchup(
+        d1, d2, n_games, heuristics,
+        base_seed=base_seed, n_workers=1, max_moves_per_action=max_moves,
+        ruleset_dict=rs_dict, ruleset_id=ruleset_id,
+    )
+
+
+def _evaluate_parallel(executor, tasks: list):
+    """Evaluate (key, eval_args) tasks on a pool, one future per matchup.
+
+    Stage I expands every ruleset evaluation into its matchups and submits
+    them all at once; Stage II scores each ruleset as its last matchup
+    completes. Workers stay busy even when there are fewer rulesets than
+    workers, and one slow ruleset no longer serializes its whole tournament.
+
+    Yields (key, result) in completion order, results matching
+    _eval_ruleset_worker.
+    """
+    from concurrent.futures import as_completed
+
+    specs = []
+    done = []
+    futures = {}
+    for i, (key, args) in enumerate(tasks):
+        matchup_spec, matchup_args = _ruleset_matchup_tasks(args)
+        specs.append(matchup_spec)
+        done.append({})
+        for margs in matchup_args:
+            futures[executor.submit(_eval_matchup_worker, margs)] = (i, (margs[2], margs[3]))
+
+    for future in as_completed(futures):
+        i, pair = futures[future]
+        done[i][pair] = future.result()
+        if len(done[i]) == len(specs[i]):
+            yield tasks[i][0], _tournament_fitness(score_tournament(specs[i], done[i]))
 
 
 def _eval_ruleset_worker(args):
@@ -14,7 +14,7 @@ from typing import Iterator, NamedTuple, Literal
 from copy import deepcopy
 
 from hexwar.board import (
-    BOARD_RADIUS, ALL_HEXES, NUM_HEXES,
+    BOARD_RADIUS, ALL_HEXES, NUM_HEXES, VALID_HEXES,
     WHITE_HOME_ZONE, BLACK_HOME_ZONE,
     is_valid_hex, hex_distance, distance_to_center,
     get_direction_vector, get_neighbor, get_neighbors, get_valid_neighbors,
@@ -204,7 +204,7 @@ def generate_destinations(
             forward_angle = FACING_ANGLES[facing]
 
             for dest in iter_hex_ring(pos[0], pos[1], jump_distance):
-                if not is_valid_hex(*dest):
+                if dest not in VALID_HEXES:
                     continue
 
                 # Calculate angle of destination relative to piece
@@ -239,7 +239,7 @@ def generate_destinations(
                 allowed_sectors.add(absolute_dir)
 
             for dest in iter_hex_ring(pos[0], pos[1], jump_distance):
-                if not is_valid_hex(*dest):
+                if dest not in VALID_HEXES:
                     continue
 
                 dq = dest[0] - pos[0]
@@ -267,9 +267,10 @@ def generate_destinations(
             cq, cr = pos
             for dist in range(1, ptype.move_range + 1):
                 cq, cr = cq + dq, cr + dr
-                if not is_valid_hex(cq, cr):
+                dest = (cq, cr)
+                if dest not in VALID_HEXES:
                     break  # Off board
-                occupant = state.board.get((cq, cr))
+                occupant = state.board.get(dest)
                 if occupant is not None:
                     if occupant.owner != owner:
                         # Can capture enemy unless:
@@ -277,26 +278,27 @@ def generate_destinations(
                         # - Target piece is PHASED (Ghost can't be captured)
                         if (get_special(piece.type_id) != 'PHASED' and
                             get_special(occupant.type_id) != 'PHASED'):
-                            yield (cq, cr)
+                            yield dest
                     break  # Blocked by any piece
-                yield (cq, cr)
+                yield dest
 
         elif ptype.move_type == 'SLIDE':
             # Move any distance until blocked
             cq, cr = pos
             while True:
                 cq, cr = cq + dq, cr + dr
-                if not is_valid_hex(cq, cr):
+                dest = (cq, cr)
+                if dest not in VALID_HEXES:
                     break
-                occupant = state.board.get((cq, cr))
+                occupant = state.board.get(dest)
                 if occupant is not None:
                     if occupant.owner != owner:
                         # Can capture unless Ghost involved
                         if (get_special(piece.type_id) != 'PHASED' and
                             get_special(occupant.type_id) != 'PHASED'):
-                            yield (cq, cr)  # Capture
+                            yield dest  # Capture
                     break  # Blocked
-                yield (cq, cr)
+                yield dest
 
 
 def generate_moves_for_piece(
@@ -37,7 +37,7 @@ except ImportError:
 GameLogCallback = Callable[[str], None]
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResult:
     """Result of a single game."""
     white_depth: int
@@ -47,7 +47,7 @@ class MatchResult:
     seed: int
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchupStats:
     """Statistics for a depth pairing."""
     deeper_depth: int
@@ -88,6 +88,16 @@ class MatchupStats:
         return self.shallower_wins / self.games_played
 
 
+def _worker_init() -> None:
+    """Pool initializer: load the modules _play_game_batch imports lazily.
+
+    Runs once per worker before any task, so the first batch doesn't pay
+    for importing evolution. Free under fork if the parent already did it.
+    """
+    import hexwar.evolution  # noqa: F401
+    import hexwar.pieces  # noqa: F401
+
+
 def _play_game_batch(args: tuple) -> list[MatchResult]:
     """Worker function to play MULTIPLE games (reduces dispatch overhead)."""
     game_specs, heuristics_dict, max_moves_per_action, ruleset_dict, use_rust = args
@@ -261,7 +271,7 @@ def run_matchup(
             batch_specs = game_specs[i:i + games_per_batch]
             batches.append((batch_specs, h_dict, max_moves_per_action, ruleset_dict, use_rust))
 
-        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_worker_init) as executor:
             futures = [executor.submit(_play_game_batch, b) for b in batches]
             for future in as_completed(futures):
                 results.extend(future.result())
@@ -503,6 +513,37 @@ def evaluate_ruleset_tournament(
     Returns:
         RulesetEvalResult with fitness components
     """
+    matchup_spec = tournament_matchup_spec(depth, reduced, games_per_matchup)
+
+    matchups = {}
+    seed_offset = 0
+    for d1, d2, n_games, weight in matchup_spec:
+        matchups[(d1, d2)] = run_matchup(
+            d1, d2, n_games, heuristics,
+            base_seed=base_seed + seed_offset,
+            n_workers=n_workers,
+            max_moves_per_action=max_moves_per_action,
+            use_rust=use_rust,
+            ruleset_dict=ruleset_dict,
+            log_callback=log_callback,
+            ruleset_id=ruleset_id,
+        )
+        seed_offset += n_games
+
+    return score_tournament(matchup_spec, matchups)
+
+
+def tournament_matchup_spec(
+    depth: int = 2,
+    reduced: bool = True,
+    games_per_matchup: int = None,
+) -> list[tuple[int, int, int, float]]:
+    """Build the (depth1, depth2, n_games, weight) matchups for a ruleset tournament.
+
+    Matchup i is played with seeds starting at base_seed plus the games of
+    all earlier matchups, so a tournament can be split across workers one
+    matchup at a time and still play exactly the same games.
+    """
     # Define matchups across a WIDE depth range
     # Include games from d2 up to the target depth for comprehensive testing
     # This tests skill gradient at multiple depth levels
@@ -562,28 +603,27 @@ def evaluate_ruleset_tournament(
         if tier >= 4:  # Need at least depth 2 for weaker player
             matchup_spec.append((tier, tier - 2, n_games, weight_skill_2ply))
 
-    matchups = {}
+    return matchup_spec
+
+
+def score_tournament(
+    matchup_spec: list[tuple[int, int, int, float]],
+    matchups: dict,
+) -> RulesetEvalResult:
+    """Combine per-matchup stats (keyed by (depth1, depth2)) into fitness components.
+
+    Matchups may arrive in any order (e.g. as parallel workers finish);
+    they are scored in spec order so results don't depend on timing.
+    """
+    matchups = {(d1, d2): matchups[(d1, d2)] for d1, d2, _, _ in matchup_spec}
     total_games = 0
-    seed_offset = 0
     total_rounds = 0
     white_wins_total = 0
     black_wins_total = 0
     draws_total = 0
-
     for d1, d2, n_games, weight in matchup_spec:
-        stats = run_matchup(
-            d1, d2, n_games, heuristics,
-            base_seed=base_seed + seed_offset,
-            n_workers=n_workers,
-            max_moves_per_action=max_moves_per_action,
-            use_rust=use_rust,
-            ruleset_dict=ruleset_dict,
-            log_callback=log_callback,
-            ruleset_id=ruleset_id,
-        )
-        matchups[(d1, d2)] = stats
+        stats = matchups[(d1, d2)]
         total_games += n_games
-        seed_offset += n_games
 
         # Track overall stats using actual color wins
         white_wins_total += stats.white_wins
@@ -0,0 +1,71 @@
+"""Tests for hexwar.ai module."""
+
+import pickle
+
+import pytest
+from hexwar.ai import BASE_PIECE_VALUES, Heuristics, KING_VALUE
+from hexwar.pieces import KING_IDS
+
+
+class TestGetPieceValue:
+    """Test per-owner piece value lookup."""
+
+    def test_per_owner_values(self):
+        """White and black tables are looked up independently."""
+        h = Heuristics(
+            white_piece_values={'A1': 2.0},
+            black_piece_values={'A1': 3.0},
+        )
+        assert h.get_piece_value('A1', 0) == 2.0
+        assert h.get_piece_value('A1', 1) == 3.0
+
+    def test_unknown_piece_defaults_to_one(self):
+        """Pieces missing from the table are worth 1.0."""
+        h = Heuristics()
+        assert h.get_piece_value('D5', 0) == 1.0
+        assert h.get_piece_value('D5', 1) == 1.0
+
+    @pytest.mark.parametrize('king_id', KING_IDS)
+    def test_kings_are_invaluable(self, king_id):
+        """Kings always return KING_VALUE, even if the table overrides them."""
+        h = Heuristics(
+            white_piece_values={king_id: 5.0},
+            black_piece_values={king_id: 5.0},
+        )
+        assert h.get_piece_value(king_id, 0) == KING_VALUE
+        assert h.get_piece_value(king_id, 1) == KING_VALUE
+
+    def test_reads_live_tables(self):
+        """Edits to the value dicts after construction are seen by the lookup."""
+        h = Heuristics.create_default()
+        h.white_piece_values['D5'] = 0.0
+        h.black_piece_values['XX'] = 4.0
+        assert h.get_piece_value('D5', 0) == 0.0
+        assert h.get_piece_value('XX', 1) == 4.0
+        assert h.get_piece_value('XX', 2) == 4.0  # Any non-zero owner is black
+
+    def test_any_k_prefix_is_a_king(self):
+        """Unlisted K-prefixed ids are valued as kings too."""
+        assert Heuristics().get_piece_value('K9', 0) == KING_VALUE
+
+    def test_survives_pickle(self):
+        """Lookup tables round-trip to worker processes."""
+        h = pickle.loads(pickle.dumps(Heuristics.create_default()))
+        assert h == Heuristics.create_default()
+        assert h.get_piece_value('D5', 0) == 20.0
+
+
+class TestCreateDefault:
+    """Test default heuristics construction."""
+
+    def test_tables_are_independent_copies(self):
+        """Mutating one default instance leaves the shared table alone."""
+        h = Heuristics.create_default()
+        h.white_piece_values['D5'] = 0.0
+        assert BASE_PIECE_VALUES['D5'] == 20.0
+        assert Heuristics.create_default().black_piece_values['D5'] == 20.0
+
+    def test_base_values_are_read_only(self):
+        """The module-level table cannot be modified in place."""
+        with pytest.raises(TypeError):
+            BASE_PIECE_VALUES['D5'] = 0.0
@@ -0,0 +1,143 @@
+"""Tests for hexwar.autoscale module."""
+
+import json
+
+import pytest
+from hexwar import autoscale
+from hexwar.autoscale import _golden_section_search, _search_optimal_workers
+
+
+class TestGoldenSectionSearch:
+    """Test integer golden-section search on unimodal functions."""
+
+    @pytest.mark.parametrize('peak', range(2, 61))
+    def test_finds_peak(self, peak):
+        """Finds the maximum of a unimodal function anywhere in range."""
+        assert _golden_section_search(2, 60, lambda n: -(n - peak) ** 2) == peak
+
+    def test_single_point_range(self):
+        """Degenerate range returns its only point."""
+        assert _golden_section_search(3, 3, lambda n: 0.0) == 3
+
+
+class TestSearchOptimalWorkers:
+    """Test the scale-up + golden-section worker search."""
+
+    def test_stops_early_when_flat(self):
+        """No improvement on the second probe stops the search."""
+        result = _search_optimal_workers(lambda n: 10.0, 60, 2, 0.05, False)
+        assert result.optimal_workers == 2
+        assert [n for n, _ in result.probe_history] == [2, 4]
+
+    def test_finds_saturation_point(self):
+        """Throughput that saturates at 8 workers picks 8, not more."""
+        result = _search_optimal_workers(lambda n: min(n, 8) * 10.0, 60, 2, 0.05, False)
+        assert result.optimal_workers == 8
+        assert result.throughput == 80.0
+
+    def test_probes_each_point_once(self):
+        """Memoization means no worker count is probed twice."""
+        result = _search_optimal_workers(lambda n: -(n - 23) ** 2 + 1000.0, 60, 2, 0.0, False)
+        probed = [n for n, _ in result.probe_history]
+        assert result.optimal_workers == 23
+        assert len(probed) == len(set(probed))
+
+    def test_respects_ceiling(self):
+        """Never probes above max_workers."""
+        result = _search_optimal_workers(lambda n: float(n), 10, 2, 0.05, False)
+        assert max(n for n, _ in result.probe_history) <= 10
+
+
+class TestDiskCache:
+    """Test the optimal-worker cache persisted across processes."""
+
+    @pytest.fixture
+    def cache_file(self, tmp_path, monkeypatch):
+        path = tmp_path / 'hexwar' / 'autoscale.json'
+        monkeypatch.setattr(autoscale, '_DISK_CACHE_FILE', str(path))
+        return path
+
+    def test_round_trip(self, cache_file):
+        """A saved worker count loads back for the same ceiling."""
+        autoscale._save_disk_cache(7, 16, 1000.0)
+        assert cache_file.exists()
+        assert autoscale._load_disk_cache(16) is None  # expired timestamp
+        autoscale._save_disk_cache(7, 16, autoscale.time.time())
+        assert autoscale._load_disk_cache(16)[0] == 7
+
+    def test_ceiling_mismatch_misses(self, cache_file):
+        """A different max_workers does not reuse the cached value."""
+        autoscale._save_disk_cache(7, 16, autoscale.time.time())
+        assert autoscale._load_disk_cache(32) is None
+
+    def test_other_machine_misses(self, cache_file):
+        """A cache written on different hardware is ignored."""
+        autoscale._save_disk_cache(7, 16, autoscale.time.time())
+        data = json.loads(cache_file.read_text())
+        data['cpu'] = 'other-machine'
+        cache_file.write_text(json.dumps(data))
+        assert autoscale._load_disk_cache(16) is None
+
+    def test_keyed_on_resolved_ceiling(self, cache_file, monkeypatch):
+        """A default-ceiling count is not reused, from disk or memory, once the ceiling changes."""
+        monkeypatch.setattr(autoscale, '_cached_optimal_workers', None)
+        monkeypatch.setattr(autoscale, '_cached_max_workers', None)
+        monkeypatch.setattr(autoscale, '_cache_timestamp', 0)
+        monkeypatch.setenv('HEXWAR_MAX_WORKERS', '16')
+        autoscale._save_disk_cache(12, 16, autoscale.time.time())
+        assert autoscale.get_optimal_workers() == 12
+        monkeypatch.setenv('HEXWAR_MAX_WORKERS', '5')
+        probed = []
+
+        def fake_find(max_workers, verbose):
+            probed.append(max_workers)
+            return autoscale.ScaleResult(max_workers, 1.0, [])
+
+        monkeypatch.setattr(autoscale, 'find_optimal_workers', fake_find)
+        assert autoscale.get_optimal_workers() == 5
+        assert probed == [5]
+
+    def test_missing_or_corrupt_file(self, cache_file):
+        """Unreadable cache files are treated as a miss."""
+        assert autoscale._load_disk_cache(16) is None
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_text('not json')
+        assert autoscale._load_disk_cache(16) is None
+
+
+class TestDefaultMaxWorkers:
+    """Test the probe ceiling derived from available CPUs."""
+
+    def test_env_override(self, monkeypatch):
+        """HEXWAR_MAX_WORKERS replaces the CPU-derived ceiling."""
+        monkeypatch.setenv('HEXWAR_MAX_WORKERS', '5')
+        assert autoscale._default_max_workers() == 5
+
+    def test_malformed_env_falls_back(self, monkeypatch, capsys):
+        """A non-integer HEXWAR_MAX_WORKERS warns and uses the CPU-derived ceiling."""
+        monkeypatch.setenv('HEXWAR_MAX_WORKERS', 'auto')
+        monkeypatch.setattr(autoscale, 'available_cpus', lambda: 2)
+        assert autoscale._default_max_workers() == 8
+        assert 'HEXWAR_MAX_WORKERS' in capsys.readouterr().out
+
+    def test_scales_with_available_cpus(self, monkeypatch):
+        """Without an override, the ceiling is 4x available CPUs capped at 60."""
+        monkeypatch.delenv('HEXWAR_MAX_WORKERS', raising=False)
+        monkeypatch.setattr(autoscale, 'available_cpus', lambda: 2)
+        assert autoscale._default_max_workers() == 8
+        monkeypatch.setattr(autoscale, 'available_cpus', lambda: 64)
+        assert autoscale._default_max_workers() == 60
+
+
+class TestCalibratedWorkUnits:
+    """Test probe work sizing."""
+
+    def test_doubles_until_slow_enough(self, monkeypatch):
+        """Work units grow until one task takes the target time, then cache."""
+        calls = []
+        monkeypatch.setattr(autoscale, '_work_units', None)
+        monkeypatch.setattr(autoscale, '_PROBE_TASK_SECONDS', 0.0)
+        monkeypatch.setattr(autoscale, '_simple_cpu_work', calls.append)
+        assert autoscale._calibrated_work_units() == 50000
+        assert autoscale._calibrated_work_units() == 50000
+        assert calls == [50000]
@@ -0,0 +1,199 @@
+"""Tests for hexwar.balance report generation."""
+
+import json
+import re
+
+import pytest
+from hexwar import autoscale, balance
+from hexwar.ai import Heuristics
+from hexwar.balance import (
+    cached_final_evaluation, format_console_summary, generate_human_readable_report,
+    run_balance_pipeline, write_generation_report, write_json,
+)
+from hexwar.evolution import RuleSet
+from hexwar.tournament import MatchupStats
+
+
+def _ruleset():
+    return RuleSet(
+        white_pieces=['A1', 'B1', 'A1'],
+        black_pieces=['D2', 'A2', 'D2', 'D2'],
+        white_template='E',
+        black_template='B',
+        white_king='K1',
+        black_king='K1',
+    )
+
+
+def _eval_result():
+    return {
+        'total_games': 10, 'white_wins': 4, 'black_wins': 5, 'draws': 1,
+        'avg_rounds': 30.0, 'color_fairness': 0.9, 'fitness': 0.75,
+        'skill_gradient': 0.5,
+    }
+
+
+class TestHumanReadableReport:
+    """Test the GAME_CONFIG.txt report."""
+
+    def test_piece_counts(self):
+        """Each army lists piece types once, with their counts, in id order."""
+        text = generate_human_readable_report(
+            _ruleset(), Heuristics.create_default(), _eval_result(), {}, {},
+        )
+        lines = text.split('\n')
+        counted = [m.groups() for m in map(re.compile(r'  (\d+)x .*\((\w+)\):').match, lines) if m]
+        assert counted == [('2', 'A1'), ('1', 'B1'), ('1', 'A2'), ('3', 'D2')]
+        assert '  TOTAL: 1 King + 3 pieces = 4 units' in lines
+        assert '  TOTAL: 1 King + 4 pieces = 5 units' in lines
+
+    def test_template_markers(self):
+        """The templates in use are marked for each side."""
+        text = generate_human_readable_report(
+            _ruleset(), Heuristics.create_default(), _eval_result(), {}, {},
+        )
+        assert '  Template B: Move, Rotate, Rotate <- BLACK' in text
+        assert '  Template E: Move OR Rotate (chess-like) <- WHITE' in text
+
+    def test_shared_template_gets_both_markers(self):
+        """When both sides use one template, it carries both markers."""
+        rs = _ruleset()
+        rs.black_template = rs.white_template
+        text = generate_human_readable_report(
+            rs, Heuristics.create_default(), _eval_result(), {}, {},
+        )
+        assert '  Template E: Move OR Rotate (chess-like) <- WHITE <- BLACK' in text
+        assert '  Template B: Move, Rotate, Rotate\n' in text
+
+
+class TestWriteJson:
+    """Test JSON report output."""
+
+    def test_round_trip(self, tmp_path):
+        """Written JSON loads back unchanged and is indented."""
+        obj = {'fitness': 0.75, 'pieces': ['A1', 'B1'], 'nested': {'n': 3}}
+        path = tmp_path / 'report.json'
+        write_json(path, obj)
+        assert json.loads(path.read_text()) == obj
+        assert '\n  "fitness"' in path.read_text()
+
+    def test_replaces_existing_file(self, tmp_path):
+        """Rewriting a report swaps it in whole, leaving no temp file."""
+        path = tmp_path / 'report.json'
+        write_json(path, {'gen': 1})
+        write_json(path, {'gen': 2})
+        assert json.loads(path.read_text()) == {'gen': 2}
+        assert [p.name for p in tmp_path.iterdir()] == ['report.json']
+
+
+class TestGenerationReport:
+    """Test the per-generation report file."""
+
+    def test_writes_sorted_piece_counts(self, tmp_path):
+        """Piece counts are written as a dict sorted by piece id."""
+        write_generation_report(tmp_path, 3, _ruleset(), _eval_result(), Heuristics())
+        text = (tmp_path / 'gen_003_report.txt').read_text()
+        assert "  Pieces: {'A1': 2, 'B1': 1}" in text
+        assert "  Pieces: {'A2': 1, 'D2': 3}" in text
+
+    def test_unchanged_elite_reuses_body(self, tmp_path):
+        """A repeated (ruleset, result) renders the same body under a new header."""
+        write_generation_report(tmp_path, 1, _ruleset(), _eval_result(), Heuristics())
+        write_generation_report(tmp_path, 2, _ruleset(), _eval_result(), Heuristics())
+        first = (tmp_path / 'gen_001_report.txt').read_text().split('\n')
+        second = (tmp_path / 'gen_002_report.txt').read_text().split('\n')
+        assert first[0] == 'HEXWAR Generation 1 Report'
+        assert second[0] == 'HEXWAR Generation 2 Report'
+        assert first[3:] == second[3:]
+
+    def test_changed_result_rerenders(self, tmp_path):
+        """A new fitness for the same ruleset is not served from the cache."""
+        write_generation_report(tmp_path, 1, _ruleset(), _eval_result(), Heuristics())
+        result = {**_eval_result(), 'fitness': 0.5}
+        write_generation_report(tmp_path, 2, _ruleset(), result, Heuristics())
+        assert 'Fitness: 0.500' in (tmp_path / 'gen_002_report.txt').read_text()
+
+    def test_changed_matchups_rerender(self, tmp_path):
+        """Same totals with a different per-depth split are not served from the cache."""
+        result = {**_eval_result(), 'matchups': {(4, 2): MatchupStats(4, 2, 3, 2, 0, 5)}}
+        write_generation_report(tmp_path, 1, _ruleset(), result, Heuristics())
+        result = {**_eval_result(), 'matchups': {(4, 2): MatchupStats(4, 2, 4, 1, 0, 5)}}
+        write_generation_report(tmp_path, 2, _ruleset(), result, Heuristics())
+        assert 'deeper wins 4/5' in (tmp_path / 'gen_002_report.txt').read_text()
+
+    def test_auto_workers_probe_up_to_available_cpus(self, tmp_path, monkeypatch):
+        """Auto-detection probes with the CPU affinity as its ceiling."""
+        probed = []
+
+        def fake_find(max_workers, verbose):
+            probed.append(max_workers)
+            return autoscale.ScaleResult(max_workers, 1.0, [])
+
+        def stop(*args, **kwargs):
+            raise RuntimeError(kwargs['n_workers'])
+
+        monkeypatch.setattr(autoscale, 'available_cpus', lambda: 3)
+        monkeypatch.setattr(autoscale, 'find_optimal_workers', fake_find)
+        monkeypatch.setattr(autoscale, '_cached_optimal_workers', None)
+        monkeypatch.setattr(autoscale, '_cached_max_workers', None)
+        monkeypatch.setattr(autoscale, '_cache_timestamp', 0)
+        monkeypatch.setattr(autoscale, '_DISK_CACHE_FILE', str(tmp_path / 'autoscale.json'))
+        monkeypatch.setattr(balance, 'evolve_rulesets', stop)
+        with pytest.raises(RuntimeError) as exc:
+            run_balance_pipeline(n_workers=None, output_dir=str(tmp_path / 'out'), verbose=False)
+        assert probed == [3]
+        assert exc.value.args == (3,)
+
+    def test_report_every_below_one_rejected(self, tmp_path):
+        """report_every=0 fails up front instead of after the first generation."""
+        with pytest.raises(ValueError, match='report_every'):
+            run_balance_pipeline(report_every=0, n_workers=1, output_dir=str(tmp_path), verbose=False)
+        assert not any(tmp_path.iterdir())
+
+
+class TestConsoleSummary:
+    """Test the end-of-run console summary."""
+
+    def test_sections_and_counts(self):
+        """The summary is one string with every section and piece counts."""
+        result = {**_eval_result(), 'game_length_score': 1.0, 'decisiveness': 0.9}
+        timings = {'ruleset_evolution': 90.0, 'final_evaluation': 5.0, 'total': 95.0}
+        text = format_console_summary(_ruleset(), Heuristics.create_default(), result, timings)
+        for header in ('BALANCE REPORT', '--- TIMINGS ---', '--- BEST RULESET ---',
+                       '--- BALANCE STATS ---', '--- HEURISTIC SUMMARY ---'):
+            assert header in text
+        assert "  Pieces: {'A1': 2, 'B1': 1}\n" in text
+        assert 'TOTAL:               1.6m\n' in text
+        assert text.endswith('\n')
+
+
+class TestCachedFinalEvaluation:
+    """Test the on-disk final evaluation cache."""
+
+    def _fake_eval(self, calls):
+        def fake(rs, heuristics, n_games, depth, max_moves_per_action, seed, use_template_aware):
+            calls.append(seed)
+            stats = MatchupStats(3, 2, 5, 3, 2, 10, white_wins=4, black_wins=4, total_rounds=300)
+            return {**_eval_result(), 'matchups': {(3, 2): stats}}
+        return fake
+
+    def test_repeat_is_read_from_disk(self, tmp_path, monkeypatch):
+        """An identical seeded evaluation is simulated only once."""
+        calls = []
+        monkeypatch.setattr(balance, 'evaluate_ruleset_fitness', self._fake_eval(calls))
+        path = tmp_path / 'fitness_cache.sqlite'
+        first = cached_final_evaluation(path, _ruleset(), 30, 2, 15, seed=7)
+        second = cached_final_evaluation(path, _ruleset(), 30, 2, 15, seed=7)
+        assert calls == [7]
+        assert second == first
+        assert second['matchups'][(3, 2)].avg_rounds == 30.0
+
+    def test_different_settings_miss(self, tmp_path, monkeypatch):
+        """Changing the seed or game count re-runs the evaluation."""
+        calls = []
+        monkeypatch.setattr(balance, 'evaluate_ruleset_fitness', self._fake_eval(calls))
+        path = tmp_path / 'fitness_cache.sqlite'
+        cached_final_evaluation(path, _ruleset(), 30, 2, 15, seed=7)
+        cached_final_evaluation(path, _ruleset(), 30, 2, 15, seed=8)
+        cached_final_evaluation(path, _ruleset(), 60, 2, 15, seed=7)
+        assert calls == [7, 8, 7]
@@ -1,12 +1,17 @@
 """Tests for hexwar.board module."""
 
+import math
+
 import pytest
 from hexwar.board import (
-    BOARD_RADIUS, DIRECTIONS, ALL_HEXES, NUM_HEXES,
+    BOARD_RADIUS, DIRECTIONS, ALL_HEXES, NUM_HEXES, VALID_HEXES,
     WHITE_HOME_ZONE, BLACK_HOME_ZONE,
     is_valid_hex, hex_distance, distance_to_center,
     get_direction_vector, get_neighbor, get_neighbors, get_valid_neighbors,
-    opposite_direction, default_facing, get_home_zone,
+    opposite_direction, default_facing, get_home_zone, hex_to_sector, iter_hex_ring,
+    HEX_INDEX, ALL_HEXES_MASK, WHITE_HOME_MASK, BLACK_HOME_MASK,
+    WHITE_PIECE_MASK, WHITE_PIECE_ZONE, mask_from_coords, iter_mask,
+    get_neighbor_mask, NEIGHBOR_INDEX, get_neighbor_idx,
     FORWARD, FORWARD_RIGHT, BACK_RIGHT, BACKWARD, BACK_LEFT, FORWARD_LEFT,
 )
 
@@ -43,6 +48,13 @@ class TestBoardGeometry:
         for q, r in invalid_points:
             assert not is_valid_hex(q, r), f"({q}, {r}) should be invalid"
 
+    def test_valid_hexes_set_matches_predicate(self):
+        """VALID_HEXES membership agrees with is_valid_hex everywhere nearby."""
+        span = range(-BOARD_RADIUS - 2, BOARD_RADIUS + 3)
+        for q in span:
+            for r in span:
+                assert ((q, r) in VALID_HEXES) == is_valid_hex(q, r)
+
     def test_all_hexes_are_unique(self):
         """All hexes in ALL_HEXES should be unique."""
         assert len(set(ALL_HEXES)) == NUM_HEXES
@@ -132,6 +144,12 @@ class TestDirections:
         # Facing South (3), Forward-Right should be SW (4)
         assert get_direction_vector(3, FORWARD_RIGHT) == DIRECTIONS[4]
 
+    def test_every_facing_and_relative_pair(self):
+        """All 36 table entries rotate the relative direction by the facing."""
+        for facing in range(6):
+            for relative in range(6):
+                assert get_direction_vector(facing, relative) == DIRECTIONS[(facing + relative) % 6]
+
 
 class TestNeighbors:
     """Test neighbor finding functions."""
@@ -203,3 +221,91 @@ class TestFacing:
     def test_default_facing_black(self):
         """Black pieces should face south (3)."""
         assert default_facing(1) == 3
+
+
+class TestHexRing:
+    """Test ring iteration around a center hex."""
+
+    @pytest.mark.parametrize('radius', range(0, 4))
+    def test_ring_is_exact_distance(self, radius):
+        """Rings hold 6r distinct hexes (1 at r=0), all at distance r."""
+        ring = list(iter_hex_ring(1, -1, radius))
+        assert len(ring) == len(set(ring)) == max(1, 6 * radius)
+        assert all(hex_distance(1, -1, q, r) == radius for q, r in ring)
+
+    def test_repeat_calls_match(self):
+        """A cached ring replays identically, and off-board centers work."""
+        assert list(iter_hex_ring(0, 0, 2)) == list(iter_hex_ring(0, 0, 2))
+        assert list(iter_hex_ring(10, 10, 1))[0] == (9, 11)
+
+
+class TestBitboards:
+    """Test the int bitboard view of hex sets."""
+
+    def test_index_covers_board(self):
+        """Every hex has its own bit, and all of them fill the full mask."""
+        assert sorted(HEX_INDEX.values()) == list(range(NUM_HEXES))
+        assert mask_from_coords(ALL_HEXES) == ALL_HEXES_MASK
+
+    def test_round_trip(self):
+        """iter_mask returns exactly the hexes a mask was built from."""
+        assert set(iter_mask(WHITE_PIECE_MASK)) == WHITE_PIECE_ZONE
+        assert list(iter_mask(0)) == []
+
+    def test_neighbor_masks_match_neighbor_lists(self):
+        """Each neighbor bitboard holds exactly the valid neighbors."""
+        for q, r in ALL_HEXES:
+            assert set(iter_mask(get_neighbor_mask(q, r))) == set(get_valid_neighbors(q, r))
+        # Center has all six neighbors, a corner only three
+        assert bin(get_neighbor_mask(0, 0)).count('1') == 6
+        assert bin(get_neighbor_mask(0, -4)).count('1') == 3
+
+    def test_neighbor_index_matches_neighbors(self):
+        """The flat index table agrees with get_neighbors in every direction."""
+        assert len(NEIGHBOR_INDEX) == NUM_HEXES * 6
+        for (q, r), i in HEX_INDEX.items():
+            for d, n in enumerate(get_neighbors(q, r)):
+                idx = get_neighbor_idx(i, d)
+                assert (idx == -1) if n is None else (ALL_HEXES[idx] == n)
+
+    def test_set_algebra(self):
+        """Bitwise ops agree with the frozenset zones."""
+        assert WHITE_HOME_MASK & BLACK_HOME_MASK == 0
+        assert WHITE_PIECE_MASK & ~WHITE_HOME_MASK == 0
+        assert bin(WHITE_HOME_MASK).count('1') == len(get_home_zone(0))
+        assert set(iter_mask(ALL_HEXES_MASK & ~(WHITE_HOME_MASK | BLACK_HOME_MASK))) == (
+            set(ALL_HEXES) - get_home_zone(0) - get_home_zone(1)
+        )
+
+
+def _sector_by_angle(dq, dr):
+    """Reference: classify by pixel angle, as hex_to_sector is specified."""
+    if dq == 0 and dr == 0:
+        return 0
+    angle = math.degrees(math.atan2(0.8660254 * dq + 1.7320508 * dr, 1.5 * dq)) % 360
+    for limit, sector in ((60, 2), (120, 3), (180, 4), (240, 5), (300, 0)):
+        if angle < limit:
+            return sector
+    return 1
+
+
+class TestHexToSector:
+    """Test sector classification of relative hex positions."""
+
+    @pytest.mark.parametrize('direction', range(6))
+    def test_direction_vectors_map_to_themselves(self, direction):
+        """Each unit direction and its multiples lie in its own sector."""
+        dq, dr = DIRECTIONS[direction]
+        for k in range(1, 9):
+            assert hex_to_sector(k * dq, k * dr) == direction
+
+    def test_off_table_offsets_are_computed(self):
+        """Offsets beyond any on-board pair still classify correctly."""
+        assert hex_to_sector(40, -20) == _sector_by_angle(40, -20)
+        assert hex_to_sector(-3, -30) == _sector_by_angle(-3, -30)
+
+    def test_matches_angle_classification(self):
+        """Integer tests agree with the angle wedges, edges included."""
+        for dq in range(-16, 17):
+            for dr in range(-16, 17):
+                assert hex_to_sector(dq, dr) == _sector_by_angle(dq, dr), (dq, dr)
@@ -0,0 +1,110 @@
+"""Tests for hexwar.checkpoint module."""
+
+import os
+import random
+
+import pytest
+from hexwar import checkpoint
+from hexwar.checkpoint import (
+    BINARY_SUFFIX, create_checkpoint_name, flush_checkpoints, get_latest_checkpoint,
+    load_checkpoint, save_checkpoint,
+)
+
+
+def _save(path, generation=5):
+    rng = random.Random(42)
+    save_checkpoint(
+        filepath=path,
+        generation=generation,
+        phase='ruleset',
+        population=[{'white_pieces': ['A1', 'B1']}, {'white_pieces': ['C1']}],
+        fitness_scores=[0.8, 0.6],
+        best_heuristics={'white_center_weight': 0.5},
+        best_ruleset=None,
+        rng_state=rng.getstate(),
+        elapsed_seconds=123.4,
+    )
+    return rng
+
+
+class TestSaveLoad:
+    """Test checkpoint round trips in both formats."""
+
+    @pytest.mark.parametrize('suffix', ['.json', BINARY_SUFFIX])
+    def test_round_trip(self, tmp_path, suffix):
+        """Saved fields load back, whichever format the suffix selects."""
+        path = tmp_path / f'ckpt{suffix}'
+        _save(path)
+        loaded = load_checkpoint(path)
+        assert loaded['generation'] == 5
+        assert loaded['population'][0] == {'white_pieces': ['A1', 'B1']}
+        assert loaded['fitness_scores'] == [0.8, 0.6]
+
+    def test_binary_restores_rng_state(self, tmp_path):
+        """Binary checkpoints keep rng state usable by setstate."""
+        path = tmp_path / f'ckpt{BINARY_SUFFIX}'
+        rng = _save(path)
+        restored = random.Random()
+        restored.setstate(load_checkpoint(path)['rng_state'])
+        assert restored.random() == rng.random()
+
+    def test_json_written_in_slices(self, tmp_path, monkeypatch):
+        """JSON text longer than one slice is written out whole."""
+        monkeypatch.setattr(checkpoint, '_TEXT_CHUNK', 7)
+        path = tmp_path / 'ckpt.json'
+        _save(path)
+        assert load_checkpoint(path)['elapsed_seconds'] == 123.4
+
+
+class TestBackgroundWrites:
+    """Test checkpoint writes handed to the writer thread."""
+
+    def test_flush_leaves_only_final_file(self, tmp_path):
+        """After a flush the checkpoint is in place, with no temp file."""
+        path = tmp_path / f'ckpt{BINARY_SUFFIX}'
+        _save(path, generation=1)
+        _save(path, generation=2)
+        flush_checkpoints()
+        assert [p.name for p in tmp_path.iterdir()] == [path.name]
+        assert load_checkpoint(path)['generation'] == 2
+
+    def test_flush_reraises_write_errors(self, tmp_path):
+        """A failed background write surfaces at the next flush."""
+        target = tmp_path / 'ckpt.json'
+        target.mkdir()  # Cannot be replaced by a file
+        _save(target)
+        with pytest.raises(OSError):
+            flush_checkpoints()
+        flush_checkpoints()  # Reported once
+
+
+class TestLatestCheckpoint:
+    """Test checkpoint discovery."""
+
+    def test_finds_both_formats(self, tmp_path):
+        """Binary and JSON checkpoints are both candidates."""
+        assert create_checkpoint_name(3, 'ruleset').endswith(BINARY_SUFFIX)
+        assert create_checkpoint_name(3, 'ruleset', binary=False).endswith('.json')
+        older = tmp_path / 'checkpoint_ruleset_gen0001.json'
+        newer = tmp_path / f'checkpoint_ruleset_gen0002{BINARY_SUFFIX}'
+        _save(older)
+        _save(newer)
+        flush_checkpoints()
+        os.utime(older, (1000, 1000))
+        os.utime(newer, (2000, 2000))
+        assert get_latest_checkpoint(tmp_path) == newer
+        os.utime(older, (3000, 3000))
+        assert get_latest_checkpoint(tmp_path) == older
+
+    def test_timestamped_names_beat_mtime(self, tmp_path):
+        """Standard names are ordered by their embedded timestamp, then generation."""
+        names = [
+            'checkpoint_ruleset_gen0009_20260101_120000.json',
+            f'checkpoint_ruleset_gen0002_20260102_080000{BINARY_SUFFIX}',
+            f'checkpoint_ruleset_gen0003_20260102_080000{BINARY_SUFFIX}',
+        ]
+        for name in names:
+            _save(tmp_path / name)
+        flush_checkpoints()
+        os.utime(tmp_path / names[0], (9999999999, 9999999999))  # Touched later
+        assert get_latest_checkpoint(tmp_path).name == names[2]
@@ -2,6 +2,11 @@
 
 import pytest
 import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from hexwar import evolution, tournament
+from hexwar.tournament import MatchupStats
 from hexwar.evolution import (
     FitnessTracker,
     RuleSet,
@@ -14,6 +19,16 @@ from hexwar.evolution import (
     mutate_ruleset,
     _ADJECTIVES,
     _NOUNS,
+    create_template_aware_heuristics,
+    _evaluate_parallel,
+    _eval_ruleset_worker,
+    _free_cells,
+    PIECE_TIERS,
+    get_pieces_by_tier,
+    _lowest_tier_index,
+    _highest_tier_index,
+    _drop_shifter_with_warper,
+    load_seed_rulesets,
 )
 
 
@@ -74,6 +89,21 @@ class TestRulesetNaming:
         )
         assert ruleset_signature(rs1) != ruleset_signature(rs2)
 
+    def test_signature_follows_in_place_mutation(self):
+        """A memoized signature never outlives an edit to the army."""
+        rs = RuleSet(
+            white_pieces=['A1', 'B1'],
+            black_pieces=['A1'],
+            white_template='E',
+            black_template='E',
+            white_king='K1',
+            black_king='K1',
+        )
+        before = ruleset_signature(rs)
+        rs.white_pieces.append('C1')
+        assert ruleset_signature(rs) == 'K1:A1,B1,C1|K1:A1'
+        assert ruleset_signature(rs) != before
+
     def test_name_is_two_words(self):
         """Generated name is adjective-noun format."""
         rs = RuleSet(
@@ -104,6 +134,11 @@ class TestRulesetNaming:
         name2 = ruleset_name(rs)
         assert name1 == name2
 
+    def test_names_are_stable_across_versions(self):
+        """Published names never change for a given signature."""
+        assert signature_to_name('K1:A1,B1|K1:A1') == 'dim-vine'
+        assert signature_to_name('K2:D5,D5|K1:A2') == 'dark-wolf'
+
     def test_different_compositions_get_different_names(self):
         """Different army compositions should generally have different names."""
         names = set()
@@ -144,6 +179,27 @@ class TestFitnessTracker:
         assert stats['min'] == 0.5
         assert stats['max'] == 0.7
 
+    def test_running_stats_match_history(self):
+        """Incremental sum/min/max agree with a rescan of the history."""
+        tracker = FitnessTracker(c=0.3)
+        rs = RuleSet(
+            white_pieces=['A1'],
+            black_pieces=['B1'],
+            white_template='E',
+            black_template='E',
+            white_king='K1',
+            black_king='K1',
+        )
+        rng = random.Random(3)
+        for _ in range(50):
+            tracker.record(rs, rng.uniform(-1.0, 1.0))
+        scores = tracker.history[ruleset_signature(rs)]
+        stats = tracker.get_stats(rs)
+        assert stats['mean'] == sum(scores) / len(scores)
+        assert stats['min'] == min(scores)
+        assert stats['max'] == max(scores)
+        assert tracker.get_ucb_score(rs) == sum(scores) / 50 - 0.3 * (1.0 / 50) ** 0.5
+
     def test_ucb_score_penalizes_uncertainty(self):
         """UCB score is lower with fewer evaluations."""
         tracker = FitnessTracker(c=0.3)
@@ -274,6 +330,19 @@ class TestRulesetSerialization:
         assert rs2.white_facings == rs.white_facings
         assert rs2.black_facings == rs.black_facings
 
+    def test_dict_positions_load_as_tuples(self):
+        """Positions saved as {'q', 'r'} dicts load as (q, r) tuples."""
+        genome = {
+            'white_pieces': ['A1'], 'black_pieces': [],
+            'white_template': 'E', 'black_template': 'E',
+            'white_king': 'K1', 'black_king': 'K1',
+            'white_positions': [{'q': 0, 'r': 4}, {'q': 0, 'r': 3}],
+            'black_positions': [],
+        }
+        rs = genome_to_ruleset(genome)
+        assert rs.white_positions == [(0, 4), (0, 3)]
+        assert rs.black_positions == []
+
     def test_genome_is_json_serializable(self):
         """Genome dict can be JSON serialized."""
         import json
@@ -295,6 +364,42 @@ class TestRulesetSerialization:
         rs2 = genome_to_ruleset(genome2)
         assert rs2.white_pieces == rs.white_pieces
 
+    def test_loaded_piece_ids_are_interned(self):
+        """Piece ids decoded from JSON are shared string objects."""
+        import json
+        genome = json.loads('{"white_pieces": ["A1", "A1"], "black_pieces": ["B1"], '
+                            '"white_template": "E", "black_template": "E", '
+                            '"white_king": "K1", "black_king": "K1"}')
+        rs = genome_to_ruleset(genome)
+        assert rs.white_pieces[0] is rs.white_pieces[1]
+        assert rs.black_pieces[0] is sys.intern('B1')
+
+    def test_pickle_round_trip(self):
+        """Slotted RuleSet still pickles to worker processes intact."""
+        import pickle
+        rs = RuleSet(
+            white_pieces=['A1', 'A2'],
+            black_pieces=['B1'],
+            white_template='E',
+            black_template='D',
+            white_king='K1',
+            black_king='K2',
+            white_facings=[0, 1, 2],
+        )
+        assert not hasattr(rs, '__dict__')
+        assert pickle.loads(pickle.dumps(rs)) == rs
+
+    def test_load_seed_rulesets_skips_bad_files(self, tmp_path):
+        """Champion and raw genome seeds load; unparseable files are skipped."""
+        import json
+        rs = create_random_ruleset(random.Random(3))
+        genome = ruleset_to_genome(rs)
+        (tmp_path / 'champion.json').write_text(json.dumps({'ruleset': genome}))
+        (tmp_path / 'raw.json').write_text(json.dumps(genome))
+        (tmp_path / 'broken.json').write_text('{not json')
+        loaded = load_seed_rulesets(str(tmp_path))
+        assert loaded == [rs, rs]
+
 
 class TestCreateRandomRuleset:
     """Test random ruleset creation."""
@@ -352,6 +457,15 @@ class TestCreateRandomRuleset:
         assert len(rs.white_positions) == len(rs.white_pieces) + 1
         assert len(rs.black_positions) == len(rs.black_pieces) + 1
 
+    def test_default_bootstrap_matches_seed_42(self):
+        """The cached default bootstrap equals seed 42 and is not shared."""
+        from hexwar.evolution import create_bootstrap_ruleset
+        rs = create_bootstrap_ruleset()
+        assert rs == create_bootstrap_ruleset(random.Random(42))
+        rs.white_positions.pop()
+        rs.white_pieces.pop()
+        assert create_bootstrap_ruleset() == create_bootstrap_ruleset(random.Random(42))
+
     def test_facings_default_to_none(self):
         """Random ruleset has facings as None (defaulted at game time)."""
         rng = random.Random(42)
@@ -414,6 +528,23 @@ class TestMutateRuleset:
             mutated = mutate_ruleset(rs, rng, mutate_white_only=True)
             assert mutated.black_pieces == original_black
 
+    def test_mutation_tables_respect_mode(self):
+        """Each mode only draws its own side, templates only when allowed."""
+        names, cum_weights = evolution._MUTATION_TABLES['black', False]
+        assert all('black' in m and 'white' not in m for m in names)
+        assert 'change_black_template' not in names
+        assert cum_weights[-1] == sum(evolution._MUTATION_WEIGHTS['black'].values())
+        names, _ = evolution._MUTATION_TABLES['both', True]
+        assert names[-2:] == ('change_white_template', 'change_black_template')
+
+    def test_shifter_drop_keeps_positions_aligned(self):
+        """Removing W2 also removes its position, not the last one."""
+        pieces = ['A1', 'W2', 'W1', 'B1']
+        positions = [(0, 4), (1, 3), (2, 2), (3, 1), (0, 3)]
+        _drop_shifter_with_warper(pieces, positions)
+        assert pieces == ['A1', 'W1', 'B1']
+        assert positions == [(0, 4), (1, 3), (3, 1), (0, 3)]
+
     def test_mutate_returns_valid_ruleset(self):
         """Mutation returns a valid RuleSet."""
         rng = random.Random(42)
@@ -426,6 +557,44 @@ class TestMutateRuleset:
             assert mutated.white_king in ['K1', 'K2', 'K3', 'K4', 'K5']
             assert mutated.black_king in ['K1', 'K2', 'K3', 'K4', 'K5']
 
+    def test_free_cells_skip_occupied(self):
+        """Free cells keep zone order and leave out occupied positions."""
+        from hexwar.board import WHITE_PIECE_ZONE
+        taken = list(WHITE_PIECE_ZONE)[::2]
+        free = _free_cells(WHITE_PIECE_ZONE, taken)
+        assert free == [p for p in WHITE_PIECE_ZONE if p not in taken]
+        assert not set(free) & set(taken)
+
+
+class TestPieceTiers:
+    """Test the tier lookups smart mutation draws from."""
+
+    def test_pieces_by_tier_matches_tier_table(self):
+        """Each tier lists exactly its pieces, in PIECE_TIERS order."""
+        for tier in range(7):
+            assert get_pieces_by_tier(tier) == tuple(
+                pid for pid, t in PIECE_TIERS.items() if t == tier
+            )
+        assert get_pieces_by_tier(99) == ()
+
+    def test_imbalance_bands_pick_handlers(self):
+        """Band edges belong to the next, stronger band."""
+        def handler(imbalance):
+            i = evolution.bisect_right(evolution._IMBALANCE_THRESHOLDS, imbalance)
+            return evolution._SIDE_HANDLERS[i]
+        assert handler(0.0) is evolution._side_balanced
+        assert handler(0.05) is evolution._side_slight
+        assert handler(0.2) is evolution._side_moderate
+        assert handler(0.25) is evolution._side_severe
+        assert handler(0.5) is evolution._side_severe
+
+    def test_tier_index_picks_first_extreme(self):
+        """Ties resolve to the first piece, unknown pieces count as tier 3."""
+        pieces = ['C2', 'A1', 'D5', 'A3', 'D5', 'ZZ']
+        assert _lowest_tier_index(pieces) == 1
+        assert _highest_tier_index(pieces) == 2
+        assert _lowest_tier_index(['D5', 'ZZ']) == 1
+
 
 class TestEdgeCases:
     """Test edge cases and error handling."""
@@ -492,3 +661,80 @@ class TestEdgeCases:
         assert best is not None
         sig, score = best
         assert sig == ruleset_signature(rs2)
+
+
+def _fake_matchup(d1, d2, n_games, heuristics, base_seed=0, **kwargs):
+    """Deterministic stand-in for run_matchup (no Rust engine needed)."""
+    rng = random.Random(base_seed * 31 + d1 * 7 + d2)
+    white = rng.randint(0, n_games)
+    black = rng.randint(0, n_games - white)
+    deeper = rng.randint(0, white + black)
+    return MatchupStats(
+        deeper_depth=max(d1, d2), shallower_depth=min(d1, d2),
+        deeper_wins=deeper, shallower_wins=white + black - deeper,
+        draws=n_games - white - black, games_played=n_games,
+        white_wins=white, black_wins=black, total_rounds=rng.randint(10, 60) * n_games,
+    )
+
+
+class TestParallelEvaluation:
+    """Test matchup-level dispatch of ruleset evaluations."""
+
+    def test_matches_sequential_evaluation(self, monkeypatch):
+        """Splitting a tournament across workers plays and scores the same games."""
+        monkeypatch.setattr(evolution, 'run_matchup', _fake_matchup)
+        monkeypatch.setattr(tournament, 'run_matchup', _fake_matchup)
+
+        rng = random.Random(7)
+        tasks = []
+        for i in range(4):
+            rs = create_random_ruleset(rng)
+            tasks.append((i, (rs, None, 3, 4, 15, 1000 * i, 1, f'R{i}', True)))
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            parallel = dict(_evaluate_parallel(executor, tasks))
+
+        assert sorted(parallel) == [0, 1, 2, 3]
+        for i, args in tasks:
+            assert parallel[i] == _eval_ruleset_worker(args)
+
+    def test_owned_pool_shut_down_on_error(self, monkeypatch, tmp_path):
+        """A failing evaluation still shuts down the run's pool and closes the log."""
+        pools = []
+
+        class FakePool:
+            def __init__(self, **kwargs):
+                self.shutdown_kwargs = None
+                pools.append(self)
+
+            def shutdown(self, **kwargs):
+                self.shutdown_kwargs = kwargs
+
+        def failing_evaluate(executor, tasks):
+            raise RuntimeError('worker failed')
+
+        monkeypatch.setattr(evolution, 'ProcessPoolExecutor', FakePool)
+        monkeypatch.setattr(evolution, '_evaluate_parallel', failing_evaluate)
+        with pytest.raises(RuntimeError, match='worker failed'):
+            evolution.evolve_rulesets(
+                None, population_size=2, generations=1, seed=1, n_workers=2,
+                verbose=False, log_dir=str(tmp_path), no_cache=True,
+            )
+
+        assert len(pools) == 1
+        assert pools[0].shutdown_kwargs == {'cancel_futures': True}
+        assert (tmp_path / 'game_log.txt').exists()
+
+
+class TestTemplateAwareHeuristics:
+    """Test template-aware heuristics construction."""
+
+    def test_cached_per_template_pair(self):
+        """Repeated template pairs reuse one Heuristics instance."""
+        evolution._TEMPLATE_HEURISTICS_CACHE.clear()
+        h1 = create_template_aware_heuristics('A', 'D')
+        assert create_template_aware_heuristics('A', 'D') is h1
+        h2 = create_template_aware_heuristics('D', 'A')
+        assert h2 is not h1
+        assert h2.white_piece_values == h1.black_piece_values
+